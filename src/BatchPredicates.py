@@ -0,0 +1,384 @@
+'''
+Created on Oct 18, 2026
+
+NumPy versions of the O'Rourke predicates used by the Triangulation class
+(Area2, AreaSign, Left, LeftOn, Collinear, Between, IntersectProp, Intersect,
+InCone and Diagonalie). Instead of one point triple or quadruple per call, each
+function takes coordinate arrays and returns an array of signs or booleans, so
+for example a candidate diagonal is tested against every edge of the polygon in
+a single call.
+
+The results match the scalar predicates exactly: areaSign returns the exact
+sign, like Predicates.orient, and the other predicates are built from it in
+the same way. Integer coordinates are used as int64, which is exact as long as
+they are within +/-2^30 (see useBatch). Float coordinates go through the same
+error bound as Predicates.orient, and the few signs that can't be decided
+from it are computed exactly one by one.
+
+NumPy is optional. It is imported the first time useBatch is asked about a
+polygon large enough to need it, so jobs on small polygons never pay for the
+import. Until then, and for good if it isn't installed, 'numpy' is None in
+this module and the rest of the code falls back to the scalar predicates.
+'''
+import Predicates
+
+
+numpy = None
+numpyLoaded = False
+
+
+# Number of (diagonal, edge) pairs tested at once by earInit. This bounds the
+# size of the temporary arrays.
+CHUNK = 1 << 20
+
+# Below this many vertices the NumPy call overhead outweighs the savings, so
+# the callers keep using the scalar predicates:
+MIN_SIZE = 64
+
+# Integer coordinates must be within +/-INT_LIMIT, so that twice the area of a
+# triangle fits in an int64:
+INT_LIMIT = 1 << 30
+
+# The number of areaSign evaluations per element of inCone (the convex and
+# the reflex case are both evaluated), intersect and touchesAtEnd:
+IN_CONE_SIGNS = 5
+INTERSECT_SIGNS = 8
+TOUCHES_SIGNS = 2
+
+
+'''
+Imports NumPy the first time it is called and returns it, or None if it isn't
+installed.
+'''
+def loadNumpy():
+    global numpy, numpyLoaded
+    if not numpyLoaded:
+        numpyLoaded = True
+        try:
+            import numpy as module
+            numpy = module
+        except ImportError:
+            numpy = None
+    return numpy
+
+
+'''
+Returns True if the batch predicates should be used for a polygon with n
+vertices. If the coordinates are given (arrays or sequences), integer
+coordinates must also be within +/-INT_LIMIT.
+'''
+def useBatch(n, xs = None, ys = None):
+    if n < MIN_SIZE or loadNumpy() is None:
+        return False
+    if xs is None:
+        return True
+    return exactRange(numpy.asarray(xs)) and exactRange(numpy.asarray(ys))
+
+
+'''
+Returns True if areaSign is exact for the coordinates in the NumPy array x.
+'''
+def exactRange(x):
+    if x.dtype.kind == 'f':
+        return True
+    if x.dtype.kind not in 'iu':
+        return False
+    return len(x) == 0 or (-INT_LIMIT <= int(x.min()) and int(x.max()) <= INT_LIMIT)
+
+
+'''
+Returns the coordinate arrays of a Polygon object as NumPy arrays. The arrays
+share memory with the Polygon, so nothing is copied.
+'''
+def coordinates(polygon):
+    dtype = numpy.int64 if polygon.xs.typecode == 'q' else numpy.float64
+    return (numpy.frombuffer(polygon.xs, dtype = dtype),
+            numpy.frombuffer(polygon.ys, dtype = dtype))
+
+
+'''
+Twice the signed area of each triangle (a, b, c). All arguments are arrays (or
+scalars) that broadcast together.
+'''
+def area2(ax, ay, bx, by, cx, cy):
+    return (bx - ax) * (cy - ay) - (cx - ax) * (by - ay)
+
+
+'''
+Same as Triangulation.AreaSign: returns an int8 array of 1, -1 or 0.
+'''
+def areaSign(ax, ay, bx, by, cx, cy):
+    abx = numpy.subtract(bx, ax)
+    aby = numpy.subtract(by, ay)
+    acx = numpy.subtract(cx, ax)
+    acy = numpy.subtract(cy, ay)
+    left = abx * acy
+    right = acx * aby
+    area = left - right
+    sign = (area > 0).astype(numpy.int8) - (area < 0).astype(numpy.int8)
+    if area.dtype.kind != 'f':
+        return sign
+
+    # Float coordinates: redo the signs that are within the error bound, as in
+    # Predicates.orient:
+    bound = Predicates.ERRBOUND * (numpy.abs(left) + numpy.abs(right))
+    zero = ((abx == 0) | (acy == 0)) & ((acx == 0) | (aby == 0))
+    unsure = (numpy.abs(area) <= bound) & ~zero
+    if unsure.any():
+        coords = [numpy.atleast_1d(c) for c in numpy.broadcast_arrays(ax, ay, bx, by, cx, cy)]
+        sign = numpy.array(sign, dtype = numpy.int8, ndmin = 1)
+        where = numpy.flatnonzero(numpy.atleast_1d(unsure))
+        points = zip(*[c.ravel()[where].tolist() for c in coords])
+        sign.ravel()[where] = [Predicates.orientExact(*p) for p in points]
+        sign = sign.reshape(numpy.shape(area))
+    return sign
+
+
+def left(ax, ay, bx, by, cx, cy):
+    return areaSign(ax, ay, bx, by, cx, cy) > 0
+
+
+def leftOn(ax, ay, bx, by, cx, cy):
+    return areaSign(ax, ay, bx, by, cx, cy) >= 0
+
+
+def collinear(ax, ay, bx, by, cx, cy):
+    return areaSign(ax, ay, bx, by, cx, cy) == 0
+
+
+'''
+Same as Triangulation.Between: c must be collinear with a,b and lie within the
+x range of a,b (or the y range, if a,b is vertical).
+'''
+def between(ax, ay, bx, by, cx, cy):
+    inx = ((ax <= cx) & (cx <= bx)) | ((ax >= cx) & (cx >= bx))
+    iny = ((ay <= cy) & (cy <= by)) | ((ay >= cy) & (cy >= by))
+    return collinear(ax, ay, bx, by, cx, cy) & numpy.where(ax != bx, inx, iny)
+
+
+'''
+Same as Triangulation.IntersectProp, for the segments a,b and c,d.
+'''
+def intersectProp(ax, ay, bx, by, cx, cy, dx, dy):
+    abc = areaSign(ax, ay, bx, by, cx, cy)
+    abd = areaSign(ax, ay, bx, by, dx, dy)
+    cda = areaSign(cx, cy, dx, dy, ax, ay)
+    cdb = areaSign(cx, cy, dx, dy, bx, by)
+    noncollinear = (abc != 0) & (abd != 0) & (cda != 0) & (cdb != 0)
+    return noncollinear & ((abc > 0) != (abd > 0)) & ((cda > 0) != (cdb > 0))
+
+
+'''
+Same as Triangulation.Intersect, for the segments a,b and c,d.
+'''
+def intersect(ax, ay, bx, by, cx, cy, dx, dy):
+    return (intersectProp(ax, ay, bx, by, cx, cy, dx, dy) |
+            between(ax, ay, bx, by, cx, cy) | between(ax, ay, bx, by, dx, dy) |
+            between(cx, cy, dx, dy, ax, ay) | between(cx, cy, dx, dy, bx, by))
+
+
+'''
+Same as Triangulation.InCone, for arrays of vertex indices a and b. prv and nxt
+give the neighbours of each vertex.
+'''
+def inCone(x, y, nxt, prv, a, b):
+    a0 = prv[a]
+    a1 = nxt[a]
+    convex = leftOn(x[a], y[a], x[a1], y[a1], x[a0], y[a0])
+    inside = left(x[a], y[a], x[b], y[b], x[a0], y[a0]) & left(x[b], y[b], x[a], y[a], x[a1], y[a1])
+    outside = ~(leftOn(x[a], y[a], x[b], y[b], x[a1], y[a1]) & left(x[b], y[b], x[a], y[a], x[a0], y[a0]))
+    return numpy.where(convex, inside, outside)
+
+
+'''
+Same as Polygon.touchesAtEnd: True where the edge c,d has an end at the same
+position as a or b, and doesn't otherwise overlap the segment a,b.
+'''
+def touchesAtEnd(ax, ay, bx, by, cx, cy, dx, dy):
+    shared = (((cx == ax) & (cy == ay)) | ((cx == bx) & (cy == by)) |
+              ((dx == ax) & (dy == ay)) | ((dx == bx) & (dy == by)))
+    return shared & ((areaSign(ax, ay, bx, by, cx, cy) != 0) |
+                     (areaSign(ax, ay, bx, by, dx, dy) != 0))
+
+
+'''
+Same as Polygon.classify, for the coordinate arrays x and y: returns the
+orientation of the ring and whether it is strictly convex. The orientation is
+just the turn at the lowest leftmost vertex, so it can be 0.
+'''
+def classify(x, y):
+    prev = numpy.roll(numpy.arange(len(x)), 1)
+    nxt = numpy.roll(numpy.arange(len(x)), -1)
+    turns = areaSign(x[prev], y[prev], x, y, x[nxt], y[nxt])
+
+    # Sign changes of the x direction of the edges, around the ring:
+    dx = x - x[prev]
+    right = dx[dx != 0] > 0
+    changes = int(numpy.count_nonzero(right != numpy.roll(right, 1)))
+
+    leftmost = numpy.flatnonzero(x == x.min())
+    lowest = int(leftmost[numpy.argmin(y[leftmost])])
+    orientation = int(turns[lowest])
+    convex = changes == 2 and (bool((turns > 0).all()) or bool((turns < 0).all()))
+    return orientation, convex
+
+
+'''
+Adds predicate evaluations to an Instrumentation.TriangulationStats object,
+if there is one. Every element of a batch counts as one call of the scalar
+predicate.
+'''
+def count(stats, areaSigns = 0, intersects = 0, diagonals = 0):
+    if stats is not None:
+        stats.areaSign += int(areaSigns)
+        stats.intersect += int(intersects)
+        stats.diagonal += int(diagonals)
+
+
+'''
+Same as Polygon.diagonalie for a single segment a,b. The polygon edges are
+given as two index arrays: edge k runs from vertex c[k] to vertex c1[k].
+
+@param stats: An Instrumentation.TriangulationStats object to count the
+       predicate evaluations in, or None
+'''
+def diagonalie(x, y, c, c1, a, b, stats = None):
+    keep = (c != a) & (c1 != a) & (c != b) & (c1 != b)
+    c = c[keep]
+    c1 = c1[keep]
+    hits = intersect(x[a], y[a], x[b], y[b], x[c], y[c], x[c1], y[c1])
+    count(stats, INTERSECT_SIGNS * len(c), len(c))
+    if not hits.any():
+        return True
+    c = c[hits]
+    c1 = c1[hits]
+    count(stats, TOUCHES_SIGNS * len(c))
+    return bool(touchesAtEnd(x[a], y[a], x[b], y[b], x[c], y[c], x[c1], y[c1]).all())
+
+
+'''
+Same as Polygon.diagonal for many segments at once: element k of the result
+is True if a[k], b[k] is a diagonal of the polygon. Only the segments that
+pass the cone tests are tested against the edges, a few at a time.
+
+@param stats: As in diagonalie
+'''
+def diagonals(x, y, nxt, prv, a, b, stats = None):
+    n = len(x)
+    result = inCone(x, y, nxt, prv, a, b) & inCone(x, y, nxt, prv, b, a)
+    count(stats, 2 * IN_CONE_SIGNS * len(a), 0, len(a))
+
+    # Test the candidates against every edge at once, a few rows at a time:
+    c = numpy.arange(n)
+    c1 = nxt[c]
+    candidates = numpy.flatnonzero(result)
+    rows = max(1, CHUNK // max(n, 1))
+    for start in range(0, len(candidates), rows):
+        block = candidates[start:start + rows]
+        ba = a[block][:, None]
+        bb = b[block][:, None]
+        keep = (c != ba) & (c1 != ba) & (c != bb) & (c1 != bb)
+        hits = intersect(x[ba], y[ba], x[bb], y[bb], x[c], y[c], x[c1], y[c1]) & keep
+        tested = numpy.count_nonzero(keep)
+        count(stats, INTERSECT_SIGNS * tested, tested)
+        hitRows, hitCols = numpy.nonzero(hits)
+        count(stats, TOUCHES_SIGNS * len(hitRows))
+        if len(hitRows):
+            # Drop the edges that only touch the diagonal at a copy of its end:
+            ra = a[block][hitRows]
+            rb = b[block][hitRows]
+            rc = c[hitCols]
+            rd = c1[hitCols]
+            hits[hitRows, hitCols] = ~touchesAtEnd(x[ra], y[ra], x[rb], y[rb], x[rc], y[rc], x[rd], y[rd])
+        result[block] = ~hits.any(axis = 1)
+    return result
+
+
+'''
+Computes the ear status of every vertex of a polygon at once, like
+Polygon.earInit does one vertex at a time.
+
+@param stats: As in diagonalie
+@return: A boolean array; element i is True if vertex i is an ear.
+'''
+def earInit(x, y, nxt, prv, stats = None):
+    v = numpy.arange(len(x))
+    return diagonals(x, y, nxt, prv, prv[v], nxt[v], stats)
+
+
+'''
+O'Rourke's ear clipping on NumPy arrays. It follows Polygon.earClip step by
+step and gives exactly the same triangles, but the ear status is initialized
+with earInit and every Diagonalie call is a single batch test.
+
+@param nxt, prv: The ring of the polygon, as in Polygon. They are copied, not
+       modified.
+@param ear: The ear flags of the vertices, if they are already known. They
+       are copied, not modified.
+@param stats, out: As in Polygon.earClip
+@return: A list of (v1, v2, v3) index triples of the form (prev, ear, next),
+        or 'out'. There are fewer than n-2 if no ear can be found, as in
+        Polygon.earClip.
+'''
+def earClip(x, y, nxt, prv, ear = None, stats = None, out = None):
+    n = len(x)
+    nxt = numpy.array(nxt, dtype = numpy.intp)
+    prv = numpy.array(prv, dtype = numpy.intp)
+    if ear is None:
+        ear = earInit(x, y, nxt, prv, stats).tolist()
+    else:
+        ear = [bool(e) for e in ear]
+    alive = numpy.ones(n, dtype = bool)
+    returnlist = out if out is not None else []
+
+    def diagonal(a, b):
+        count(stats, IN_CONE_SIGNS, 0, 1)
+        if not inCone(x, y, nxt, prv, a, b):
+            return False
+        count(stats, IN_CONE_SIGNS)
+        if not inCone(x, y, nxt, prv, b, a):
+            return False
+        c = numpy.flatnonzero(alive)
+        return diagonalie(x, y, c, nxt[c], a, b, stats)
+
+    head = 0
+    tested = 0
+    while n > 3:
+        v2 = head
+        earfound = False
+        while True:
+            tested += 1
+            if ear[v2]:
+                earfound = True
+                v3 = int(nxt[v2])
+                v4 = int(nxt[v3])
+                v1 = int(prv[v2])
+                v0 = int(prv[v1])
+                returnlist.append((v1, v2, v3))
+
+                # Update the ear status of the diagonal endpoints:
+                ear[v1] = diagonal(v0, v3)
+                ear[v3] = diagonal(v1, v4)
+
+                # Cut off the ear v2:
+                nxt[v1] = v3
+                prv[v3] = v1
+                alive[v2] = False
+                head = v3
+                n -= 1
+
+                if n == 3:
+                    v2 = head
+                    returnlist.append((int(prv[v2]), v2, int(nxt[v2])))
+                break
+            v2 = int(nxt[v2])
+            if v2 == head:
+                break
+
+        if not earfound:
+            break
+
+    if stats is not None:
+        stats.earsTested += tested
+        stats.earsClipped += len(x) - n
+    return returnlist
@@ -0,0 +1,252 @@
+'''
+Created on Oct 18, 2026
+
+This module triangulates many polygons at once. The polygons are split into
+chunks, and the chunks are sent to a pool of worker processes. This replaces
+the Main.main sequence (createLinkedList, set HEAD/SIZE, Triangulate) when there
+are thousands of polygons to do.
+
+A polygon can be given as:
+- the name of an input file, in the format read by IOClass.createLinkedList.
+  Only the name is sent to the worker, which reads the file itself.
+- a Polygon object
+- a sequence of (x, y) pairs, in CCW order
+
+Polygons are sent to the workers as typed coordinate arrays, never as chains
+of Point objects. The results come back in input order, and a polygon that
+fails (for example when no ear can be found) is reported in its result
+without stopping the rest of the batch.
+
+triangulateFile runs the whole pipeline for a file of many polygons (see
+IOClass.iterRecords): the records are read one at a time, triangulated by the
+worker pool and written out in input order as their results come back. Only
+the chunks in flight are ever held in memory, so any size of file can be
+processed.
+'''
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+from Polygon import Polygon
+from Triangulation import Triangulation, EARCLIP
+import IOClass
+import TriangleOutput
+import Validation
+
+
+# Output formats of triangulateFile. PLY isn't one of them, since its header
+# needs the totals of the whole file before anything else is written:
+FILE_FORMATS = ('text', 'obj')
+
+
+'''
+The result of triangulating one polygon of a batch.
+
+index: the position of the polygon in the input
+size: the number of vertices (after duplicates were removed, for files)
+triangles: the triangle list, in the same format as Triangulation.Triangulate
+error: None if the triangulation succeeded, otherwise a message
+'''
+class BatchResult:
+
+    __slots__ = ('index', 'size', 'triangles', 'error')
+
+    def __init__(self, index, size, triangles, error = None):
+        self.index = index
+        self.size = size
+        self.triangles = triangles
+        self.error = error
+
+
+    def ok(self):
+        return self.error is None
+
+
+'''
+Turns one input polygon into the compact form that is sent to a worker.
+'''
+def pack(item):
+    if isinstance(item, str):
+        return item
+    if isinstance(item, Polygon):
+        return (item.xs, item.ys, item.names)
+    xs = []
+    ys = []
+    for x, y in item:
+        xs.append(x)
+        ys.append(y)
+    p = Polygon(xs, ys)
+    return (p.xs, p.ys, None)
+
+
+'''
+Triangulates one packed polygon and returns its BatchResult. If 'validate' is
+True, a polygon that isn't simple fails straight away with the message of the
+Validation.InvalidPolygonError.
+'''
+def triangulateOne(index, packed, engine, validate = False):
+    try:
+        if isinstance(packed, str):
+            polygon = IOClass.createPolygon(packed)
+            if polygon is None:
+                return BatchResult(index, 0, [], "Inconsistent input file: %s" % packed)
+        else:
+            xs, ys, names = packed
+            polygon = Polygon(xs, ys, names)
+
+        n = len(polygon)
+        if n < 3:
+            return BatchResult(index, n, [], "Fewer than 3 vertices")
+        if validate:
+            try:
+                Validation.validate(polygon.xs, polygon.ys, names = polygon.names)
+            except Validation.InvalidPolygonError as e:
+                return BatchResult(index, n, [], str(e))
+
+        triangles = Triangulation(engine = engine, polygon = polygon).Triangulate()
+        if len(triangles) != n - 2:
+            return BatchResult(index, n, triangles, "Ear not found")
+        return BatchResult(index, n, triangles)
+    except Exception as e:
+        return BatchResult(index, 0, [], "%s: %s" % (type(e).__name__, e))
+
+
+'''
+The function that runs in the worker processes. It triangulates one chunk of
+(index, packed polygon) pairs.
+'''
+def triangulateChunk(chunk, engine, validate = False):
+    return [triangulateOne(index, packed, engine, validate) for index, packed in chunk]
+
+
+'''
+Groups the input polygons into chunks of (index, packed polygon) pairs.
+'''
+def chunks(polygons, chunksize):
+    chunk = []
+    for index, item in enumerate(polygons):
+        chunk.append((index, pack(item)))
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+'''
+Triangulates every polygon in 'polygons' and yields a BatchResult for each of
+them, in input order. The input is consumed lazily, and at most a few chunks
+per worker are in flight at any time.
+
+@param polygons: An iterable of polygons (see the top of this module)
+@param engine: The Triangulation engine to use
+@param workers: Number of worker processes. Defaults to the number of CPUs.
+       With 1 worker everything runs in this process.
+@param chunksize: Number of polygons sent to a worker at a time
+@param validate: If True, each polygon is checked with Validation.py first,
+       so self-intersecting polygons fail in O(n log n) time instead of
+       running the ear clipping until it gets stuck
+'''
+def iterTriangulate(polygons, engine = EARCLIP, workers = None, chunksize = 256,
+                    validate = False):
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        for chunk in chunks(polygons, chunksize):
+            for result in triangulateChunk(chunk, engine, validate):
+                yield result
+        return
+
+    pending = []
+    with ProcessPoolExecutor(max_workers = workers) as pool:
+        for chunk in chunks(polygons, chunksize):
+            pending.append(pool.submit(triangulateChunk, chunk, engine, validate))
+            # Don't let the queue grow without bound; wait for the oldest chunk
+            # once every worker has a couple of chunks queued up:
+            if len(pending) >= 2 * workers:
+                for result in pending.pop(0).result():
+                    yield result
+        for future in pending:
+            for result in future.result():
+                yield result
+
+
+'''
+Same as iterTriangulate, but returns all the results as a list.
+'''
+def triangulateMany(polygons, engine = EARCLIP, workers = None, chunksize = 256,
+                    validate = False):
+    return list(iterTriangulate(polygons, engine, workers, chunksize, validate))
+
+
+'''
+Triangulates every polygon of a multi-record file and writes the results to
+'target' in input order, while the rest of the file is still being read and
+triangulated.
+
+With the 'text' format, each polygon is written in the format of
+IOClass.printTrianglesToConsole (its number of triangles, then the
+triangles), with the polygons separated by a newline. A polygon that fails is
+written as 0 triangles, so the records of the output still match those of the
+input. With 'obj', each polygon is an object of its own ("o polygonK") with
+its vertices and faces; a polygon that fails only has its vertices.
+
+@param source: The name of a file in the format read by IOClass.iterRecords
+@param target: A file name or a text stream
+@param format: 'text' or 'obj'
+@param consecutive: Passed on to IOClass.iterPolygons
+@param engine, workers, chunksize, validate: As in iterTriangulate
+@return: The number of polygons, and a list of (index, error) pairs for the
+        ones that failed
+@raise ValueError: If the file doesn't follow the format (see
+       IOClass.iterRecords). The polygons before the bad record have all
+       been written to 'target' by then.
+'''
+def triangulateFile(source, target, format = 'text', engine = EARCLIP, workers = None,
+                    chunksize = 256, validate = False, consecutive = False):
+    if format not in FILE_FORMATS:
+        raise ValueError("Unknown output format for a file of polygons: %s" % format)
+
+    # The polygons whose results haven't been written yet, for their vertices.
+    # iterTriangulate reads ahead only a few chunks, so this stays small:
+    inFlight = deque()
+
+    # A bad record ends the input; the error is raised once the polygons
+    # before it are written:
+    readErrors = []
+
+    def records():
+        try:
+            for polygon in IOClass.iterPolygons(source, consecutive):
+                inFlight.append(polygon)
+                yield polygon
+        except ValueError as e:
+            readErrors.append(e)
+
+    failed = []
+    count = 0
+    base = 0
+    stream, opened = TriangleOutput.openTarget(target, False)
+    try:
+        for result in iterTriangulate(records(), engine, workers, chunksize, validate):
+            polygon = inFlight.popleft()
+            triangles = result.triangles
+            if not result.ok():
+                failed.append((result.index, result.error))
+                triangles = []
+            if format == 'text':
+                if count > 0:
+                    stream.write('\n')
+                TriangleOutput.writeText(stream, triangles)
+            else:
+                stream.write('o polygon%d\n' % (result.index + 1))
+                TriangleOutput.writeOBJ(stream, polygon, triangles, base)
+                base += len(polygon)
+            count += 1
+    finally:
+        if opened:
+            stream.close()
+    if readErrors:
+        raise readErrors[0]
+    return count, failed
@@ -0,0 +1,311 @@
+'''
+Created on Oct 18, 2026
+
+Benchmarks for the triangulation path, on synthetic polygons from
+PolygonGenerators. For every generator and size, each stage is timed on its
+own (the best of a few runs):
+
+parse: reading the input file into coordinate arrays (IOClass.readCoordinates)
+dedup: removing duplicate points (IOClass.removeDuplicateCoordinates)
+linkedlist: the whole of IOClass.createLinkedList
+earinit: computing the ear flags of every vertex (Polygon.earStatus)
+clip: ear clipping, with the ear flags already computed (Polygon.earClip)
+monotone, reflex: the other two engines (MonotoneTriangulation,
+                  ReflexEarClipping)
+output: printing the triangles (IOClass.printTrianglesToConsole)
+render: drawing the triangulation as SVG (HeadlessRenderer.writeSVG)
+
+A stage that takes longer than the time budget for one size is skipped for
+the larger sizes of the same generator. At the end, a power law t = c * n^k is
+fitted to the timings of each generator and stage.
+
+The results can be saved as JSON, and compared with the JSON of an earlier
+run to find regressions:
+
+    python Benchmark.py -o new.json --compare old.json
+'''
+import argparse
+import io
+import json
+import math
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import IOClass
+import HeadlessRenderer
+import MonotoneTriangulation
+import PolygonGenerators
+import ReflexEarClipping
+import BatchPredicates
+from Polygon import Polygon
+
+
+SIZES = [10, 100, 1000, 10000, 100000, 1000000]
+
+# The 2-opt untangling of the 'random' generator is too slow above this size:
+RANDOM_MAX = 2000
+
+STAGES = ['parse', 'dedup', 'linkedlist', 'earinit', 'clip', 'monotone',
+          'reflex', 'output', 'render']
+
+
+'''
+One generated polygon, and what the stages have produced from it so far.
+'''
+class Case:
+
+    def __init__(self, generator, n, seed, directory):
+        self.generator = generator
+        self.n = n
+        self.xs, self.ys = PolygonGenerators.generate(generator, n, seed)
+        self.filename = os.path.join(directory, "%s-%d.txt" % (generator, n))
+        PolygonGenerators.writeText(self.filename, self.xs, self.ys)
+        self.triangles = None
+
+
+    '''
+    Returns the triangles as name triples, triangulating the polygon (without
+    timing it) if no stage has done it yet.
+    '''
+    def triangleNames(self):
+        if self.triangles is None:
+            self.setTriangles(MonotoneTriangulation.triangulateIndices(self.xs, self.ys))
+        return self.triangles
+
+
+    def setTriangles(self, indices):
+        self.triangles = [[str(a + 1), str(b + 1), str(c + 1)] for a, b, c in indices]
+
+
+'''
+Runs function(setup()) 'repeat' times and returns the shortest time, in
+seconds, and the last result. Only the call to function is timed.
+'''
+def measure(function, repeat, setup = None):
+    best = None
+    result = None
+    for i in range(repeat):
+        argument = setup() if setup is not None else None
+        start = time.perf_counter()
+        result = function(argument)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+'''
+Runs one stage on a case and returns its time in seconds.
+'''
+def runStage(stage, case, repeat):
+    if stage == 'parse':
+        return measure(lambda _: IOClass.readCoordinates(case.filename), repeat)[0]
+
+    if stage == 'dedup':
+        return measure(lambda _: IOClass.removeDuplicateCoordinates(case.xs, case.ys), repeat)[0]
+
+    if stage == 'linkedlist':
+        return measure(lambda _: IOClass.createLinkedList(case.filename), repeat)[0]
+
+    if stage == 'earinit':
+        return measure(lambda p: p.earStatus(), repeat,
+                       lambda: Polygon(case.xs, case.ys))[0]
+
+    if stage == 'clip':
+        def setup():
+            p = Polygon(case.xs, case.ys)
+            p.earStatus()
+            return p
+        seconds, triangles = measure(lambda p: p.earClip(), repeat, setup)
+        case.setTriangles(triangles)
+        return seconds
+
+    if stage == 'monotone':
+        seconds, triangles = measure(
+            lambda _: MonotoneTriangulation.triangulateIndices(case.xs, case.ys), repeat)
+        case.setTriangles(triangles)
+        return seconds
+
+    if stage == 'reflex':
+        seconds, triangles = measure(
+            lambda _: ReflexEarClipping.triangulateIndices(case.xs, case.ys), repeat)
+        case.setTriangles(triangles)
+        return seconds
+
+    if stage == 'output':
+        triangles = case.triangleNames()
+        def output(_):
+            stdout = sys.stdout
+            sys.stdout = io.StringIO()
+            try:
+                IOClass.printTrianglesToConsole(triangles)
+            finally:
+                sys.stdout = stdout
+        return measure(output, repeat)[0]
+
+    if stage == 'render':
+        triangles = case.triangleNames()
+        vertices = [(case.xs[i], case.ys[i], str(i + 1)) for i in range(len(case.xs))]
+        return measure(lambda _: HeadlessRenderer.writeSVG(io.StringIO(), vertices, triangles),
+                       repeat)[0]
+
+    raise ValueError("Unknown benchmark stage: %s" % stage)
+
+
+'''
+Fits t = c * n^k to a list of (n, seconds) pairs by least squares on the
+logarithms. Returns (c, k), or None if there are fewer than two usable points.
+'''
+def fitPowerLaw(points):
+    points = [(math.log(n), math.log(t)) for n, t in points if n > 1 and t > 0]
+    if len(points) < 2:
+        return None
+    m = len(points)
+    sx = sum(p[0] for p in points)
+    sy = sum(p[1] for p in points)
+    sxx = sum(p[0] * p[0] for p in points)
+    sxy = sum(p[0] * p[1] for p in points)
+    d = m * sxx - sx * sx
+    if d == 0:
+        return None
+    k = (m * sxy - sx * sy) / d
+    c = math.exp((sy - k * sx) / m)
+    return c, k
+
+
+'''
+Runs the benchmarks and returns the results as a dictionary that can be saved
+as JSON.
+
+@param budget: A stage that takes longer than this many seconds for one size
+       is not run for the larger sizes of the same generator
+@param log: A stream for progress messages, or None
+'''
+def run(generators, sizes, stages, repeat = 3, seed = 0, budget = 10.0, log = None):
+    directory = tempfile.mkdtemp(prefix = 'triangulation-bench-')
+    results = []
+    try:
+        for generator in generators:
+            slow = set()
+            for n in sorted(sizes):
+                if generator == 'random' and n > RANDOM_MAX:
+                    continue
+                if all(stage in slow for stage in stages):
+                    break
+                case = Case(generator, n, seed, directory)
+                for stage in stages:
+                    if stage in slow:
+                        continue
+                    seconds = runStage(stage, case, repeat)
+                    results.append({'generator': generator, 'size': n,
+                                    'stage': stage, 'seconds': seconds})
+                    if log is not None:
+                        log.write("%-10s %8d %-10s %10.6f\n" % (generator, n, stage, seconds))
+                        log.flush()
+                    if seconds > budget:
+                        slow.add(stage)
+                os.remove(case.filename)
+    finally:
+        shutil.rmtree(directory, ignore_errors = True)
+
+    fits = []
+    for generator in generators:
+        for stage in stages:
+            points = [(r['size'], r['seconds']) for r in results
+                      if r['generator'] == generator and r['stage'] == stage]
+            fit = fitPowerLaw(points)
+            if fit is not None:
+                fits.append({'generator': generator, 'stage': stage,
+                             'constant': fit[0], 'exponent': fit[1]})
+
+    return {'meta': metadata(repeat, seed), 'results': results, 'fits': fits}
+
+
+'''
+Describes the machine and the code the benchmarks ran on.
+'''
+def metadata(repeat, seed):
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'],
+                                         cwd = os.path.dirname(os.path.abspath(__file__)),
+                                         stderr = subprocess.STDOUT).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    numpy = BatchPredicates.loadNumpy()
+    return {'commit': commit, 'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': numpy.__version__ if numpy is not None else None,
+            'repeat': repeat, 'seed': seed, 'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+
+
+'''
+Compares two sets of results. Returns a list of (generator, size, stage, old
+seconds, new seconds) for the timings that got slower by more than
+'threshold' (0.25 is 25% slower). Timings under 'floor' seconds are ignored,
+since they are mostly noise.
+'''
+def compare(old, new, threshold = 0.25, floor = 1e-3):
+    before = {}
+    for r in old['results']:
+        before[(r['generator'], r['size'], r['stage'])] = r['seconds']
+    regressions = []
+    for r in new['results']:
+        key = (r['generator'], r['size'], r['stage'])
+        if key not in before or max(before[key], r['seconds']) < floor:
+            continue
+        if r['seconds'] > before[key] * (1 + threshold):
+            regressions.append(key + (before[key], r['seconds']))
+    return regressions
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Benchmark the triangulation path.")
+    parser.add_argument('-g', '--generators', nargs = '+', default = sorted(PolygonGenerators.GENERATORS),
+                        choices = sorted(PolygonGenerators.GENERATORS))
+    parser.add_argument('-n', '--sizes', nargs = '+', type = int, default = SIZES)
+    parser.add_argument('-s', '--stages', nargs = '+', default = STAGES, choices = STAGES)
+    parser.add_argument('-r', '--repeat', type = int, default = 3)
+    parser.add_argument('--seed', type = int, default = 0)
+    parser.add_argument('-b', '--budget', type = float, default = 10.0,
+                        help = "seconds after which a stage is dropped for larger sizes")
+    parser.add_argument('-o', '--output', help = "file to save the results to, as JSON")
+    parser.add_argument('--compare', help = "JSON results of an earlier run to compare with")
+    parser.add_argument('--threshold', type = float, default = 0.25)
+    args = parser.parse_args(argv)
+
+    report = run(args.generators, args.sizes, args.stages, args.repeat, args.seed,
+                 args.budget, sys.stdout)
+
+    sys.stdout.write("\nFitted t = c * n^k:\n")
+    for fit in report['fits']:
+        sys.stdout.write("%-10s %-10s k = %5.2f  c = %.3g\n" % (
+            fit['generator'], fit['stage'], fit['exponent'], fit['constant']))
+
+    if args.output:
+        outputfile = open(args.output, 'w')
+        try:
+            json.dump(report, outputfile, indent = 1)
+        finally:
+            outputfile.close()
+
+    if args.compare:
+        inputfile = open(args.compare)
+        try:
+            old = json.load(inputfile)
+        finally:
+            inputfile.close()
+        regressions = compare(old, report, args.threshold)
+        sys.stdout.write("\n%d regressions against %s\n" % (len(regressions), args.compare))
+        for generator, n, stage, before, after in regressions:
+            sys.stdout.write("%-10s %8d %-10s %10.6f -> %10.6f\n" % (generator, n, stage, before, after))
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
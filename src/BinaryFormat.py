@@ -0,0 +1,294 @@
+'''
+Created on Oct 18, 2026
+
+This module reads and writes a binary container for polygons and their
+triangulations. Loading a file doesn't parse anything: the file is
+memory-mapped and the coordinate and triangle blocks are exposed as typed
+memoryviews over the mapping. Saving builds the whole file in one buffer and
+writes it with a single call.
+
+File layout (all values little-endian):
+
+    offset  size  field
+    0       4     magic, the bytes 'CGPT'
+    4       2     format version (currently 1)
+    6       1     coordinate type: 'i' (int32), 'q' (int64) or 'd' (float64)
+    7       1     padding (0)
+    8       8     n, the number of vertices (uint64)
+    16      8     t, the number of triangles (uint64), 0 if there are none
+    24            the n x-coordinates, then the n y-coordinates
+                  the 3t vertex indices of the triangles (int32, 0-based)
+
+The x block, the y block and the triangle block each start on an 8-byte
+boundary; zero bytes are added after a block when needed. The names of the
+vertices aren't stored: vertex i of the polygon is named str(i + 1) when the
+file is converted back to the usual structures, the same as
+IOClass.createLinkedList does (see BinaryFile.triangleList).
+'''
+from array import array
+import mmap
+import os
+import struct
+import sys
+
+from Polygon import Polygon
+import IOClass
+
+
+MAGIC = b'CGPT'
+VERSION = 1
+HEADER = struct.Struct('<4sHcxQQ')
+
+INT32_MIN = -(1 << 31)
+INT32_MAX = (1 << 31) - 1
+
+
+'''
+Returns the number of zero bytes needed to pad 'size' to a multiple of 8.
+'''
+def padding(size):
+    return (8 - size % 8) % 8
+
+
+'''
+Converts a triangle list to a flat int32 array of 0-based vertex indices.
+Triangles can be given either as index triples or as name triples, as returned
+by Triangulation.Triangulate.
+'''
+def triangleIndices(polygon, triangles):
+    flat = array('i')
+    if not triangles:
+        return flat
+
+    indexOf = None
+    if not isinstance(triangles[0][0], int):
+        indexOf = {}
+        for i in range(len(polygon)):
+            indexOf[polygon.name(i)] = i
+
+    for t in triangles:
+        if indexOf is None:
+            flat.extend(t)
+        else:
+            flat.extend((indexOf[t[0]], indexOf[t[1]], indexOf[t[2]]))
+    return flat
+
+
+'''
+Copies the contents of a typed memoryview into an array with the given type
+code.
+'''
+def copyView(view, typecode):
+    raw = view.cast('B')
+    result = array(typecode)
+    result.frombytes(raw)
+    raw.release()
+    if sys.byteorder == 'big':
+        result.byteswap()
+    return result
+
+
+'''
+Saves a polygon, and optionally its triangulation, to a binary file.
+
+@param polygon: A Polygon object
+@param triangles: The result of Triangulate (name triples), a list of index
+       triples, or None
+'''
+def save(filename, polygon, triangles = None):
+    n = len(polygon)
+    if not isinstance(polygon.xs, array):
+        raise ValueError("The binary format can't hold integer coordinates that don't fit in 64 bits")
+    if polygon.xs.typecode == 'd':
+        xs = polygon.xs
+        ys = polygon.ys
+        coordtype = 'd'
+    else:
+        xmin, ymin, xmax, ymax = polygon.bounds() if n > 0 else (0, 0, 0, 0)
+        if min(xmin, ymin) >= INT32_MIN and max(xmax, ymax) <= INT32_MAX:
+            xs = array('i', polygon.xs)
+            ys = array('i', polygon.ys)
+            coordtype = 'i'
+        else:
+            xs = polygon.xs
+            ys = polygon.ys
+            coordtype = 'q'
+
+    flat = triangleIndices(polygon, triangles)
+    if sys.byteorder == 'big':
+        xs = array(xs.typecode, xs)
+        ys = array(ys.typecode, ys)
+        xs.byteswap()
+        ys.byteswap()
+        flat.byteswap()
+
+    block = n * xs.itemsize
+    buf = bytearray(HEADER.pack(MAGIC, VERSION, coordtype.encode('ascii'), n, len(flat) // 3))
+    buf += xs.tobytes()
+    buf += bytes(padding(block))
+    buf += ys.tobytes()
+    buf += bytes(padding(block))
+    buf += flat.tobytes()
+
+    outputfile = open(filename, 'wb')
+    try:
+        outputfile.write(buf)
+    finally:
+        outputfile.close()
+
+
+'''
+A binary file opened with load(). The blocks of the file are available as
+memoryviews over the memory-mapped file, so nothing is copied or parsed:
+
+xs, ys: the coordinates, one element per vertex
+triangles: the triangle indices, with shape (t, 3), or None if the file has
+           no triangulation
+
+The memoryviews are only valid until close() is called. A ValueError is
+raised if the file isn't a polygon file, or is too short for the blocks its
+header describes.
+'''
+class BinaryFile:
+
+    def __init__(self, filename):
+        inputfile = open(filename, 'rb')
+        try:
+            if os.fstat(inputfile.fileno()).st_size < HEADER.size:
+                raise ValueError("%s is too short to be a polygon file" % filename)
+            self.data = mmap.mmap(inputfile.fileno(), 0, access = mmap.ACCESS_READ)
+        finally:
+            inputfile.close()
+
+        try:
+            magic, version, coordtype, n, t = HEADER.unpack_from(self.data, 0)
+            if magic != MAGIC:
+                raise ValueError("%s is not a polygon file" % filename)
+            if version != VERSION:
+                raise ValueError("%s has unsupported version %d" % (filename, version))
+            coordtype = coordtype.decode('ascii', 'replace')
+            if coordtype not in ('i', 'q', 'd'):
+                raise ValueError("%s has an unknown coordinate type" % filename)
+
+            # Check that the blocks the header describes are all there:
+            block = n * struct.calcsize(coordtype)
+            xoffset = HEADER.size
+            yoffset = xoffset + block + padding(block)
+            toffset = yoffset + block + padding(block)
+            if len(self.data) < toffset + 12 * t:
+                raise ValueError("%s is truncated: the header describes %d vertices and %d triangles"
+                                 % (filename, n, t))
+        except ValueError:
+            self.data.close()
+            raise
+
+        view = memoryview(self.data)
+        self.n = n
+        self.t = t
+        self.coordtype = coordtype
+        self.xs = view[xoffset:xoffset + block].cast(coordtype)
+        self.ys = view[yoffset:yoffset + block].cast(coordtype)
+        if t > 0:
+            self.triangles = view[toffset:toffset + 12 * t].cast('i', (t, 3))
+        else:
+            self.triangles = None
+        self.view = view
+
+
+    '''
+    Copies the coordinates into a Polygon object (one buffer copy per array).
+    '''
+    def polygon(self):
+        typecode = 'd' if self.coordtype == 'd' else 'q'
+        xs = copyView(self.xs, self.coordtype)
+        ys = copyView(self.ys, self.coordtype)
+        if typecode != self.coordtype:
+            xs = array(typecode, xs)
+            ys = array(typecode, ys)
+        return Polygon(xs, ys)
+
+
+    '''
+    Returns the triangles as a list of name triples, the same format as
+    Triangulation.Triangulate.
+
+    The file doesn't store the names of the vertices, so vertex i is named
+    str(i + 1) by its position. These are the names Triangulate gives only
+    if the polygon that was saved had the default names: a ring read with
+    duplicate points removed, a simplified one, or one with holes has names
+    of its own.
+
+    @param polygon: The Polygon that was saved, to name the vertices after
+           instead, or None
+    '''
+    def triangleList(self, polygon = None):
+        if self.triangles is None:
+            return []
+        flat = copyView(self.triangles, 'i')
+        if polygon is not None:
+            if len(polygon) != self.n:
+                raise ValueError("The polygon has %d vertices, but the file has %d"
+                                 % (len(polygon), self.n))
+            names = [polygon.name(i) for i in range(self.n)]
+        else:
+            names = [str(i + 1) for i in range(self.n)]
+        return [[names[flat[k]], names[flat[k + 1]], names[flat[k + 2]]]
+                for k in range(0, len(flat), 3)]
+
+
+    def close(self):
+        for v in (self.xs, self.ys, self.triangles, self.view):
+            if v is not None:
+                v.release()
+        self.data.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+'''
+Opens a binary polygon file. See BinaryFile.
+'''
+def load(filename):
+    return BinaryFile(filename)
+
+
+'''
+Converts a text input file (the [x,y] format read by IOClass) to a binary file.
+Duplicate points are removed, the same as when the text file is loaded, but
+the vertices keep the order of the file, even if it is clockwise.
+
+@return: True if the conversion succeeded, False if the text file was
+        inconsistent
+'''
+def textToBinary(textfile, binaryfile):
+    polygon = IOClass.createPolygon(textfile, ccw = False)
+    if polygon is None:
+        return False
+    save(binaryfile, polygon)
+    return True
+
+
+'''
+Converts the polygon in a binary file back to the [x,y] text format, written
+by IOClass.writeCoordinates. Raises ValueError if the file has float
+coordinates, since the text format only allows integers.
+'''
+def binaryToText(binaryfile, textfile):
+    f = load(binaryfile)
+    try:
+        polygon = f.polygon()
+    finally:
+        f.close()
+
+    xs = polygon.xs
+    ys = polygon.ys
+    if xs.typecode == 'd':
+        raise ValueError("The text format can only hold integer coordinates")
+
+    IOClass.writeCoordinates(textfile, xs, ys)
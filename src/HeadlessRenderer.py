@@ -0,0 +1,331 @@
+'''
+Created on Oct 18, 2026
+
+This module draws a polygon and its triangulation without Tkinter, so it works
+in batch jobs on machines without a display. It writes either an SVG file or a
+PNG file (rasterized in pure Python, no imaging library needed).
+
+The picture is the same as the one drawn by Triangulation.drawPolygon and
+drawTriangles: red triangle edges, a black polygon outline with a dot at each
+vertex, and the vertex names next to the vertices (SVG only). Unlike the Tk
+version, which creates several canvas items per triangle and a widget per
+vertex:
+
+- every edge is drawn once, even though most edges belong to two triangles
+- vertex labels are culled: at most one label per small screen cell, and none
+  at all above 'maxLabels' vertices
+- edges shorter than 'minEdge' pixels are dropped (level of detail), and
+  polygon vertices that land on the same pixel are merged
+
+The polygon is fitted to the image with a ViewTransform, the same way
+Triangulation.scale does with uniform scaling, but without touching the
+coordinates. If NumPy is installed, the PNG rasterizer draws all the lines of a
+color in one batch.
+
+A polygon with holes is passed as the vertices of all its rings, one after
+the other, together with the number of vertices in each ring ('rings').
+'''
+import struct
+import zlib
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ViewTransform import ViewTransform
+
+
+# Size of the screen cells used for label culling, in pixels:
+LABEL_CELL = 12
+
+
+'''
+Returns the (start, end) vertex index ranges of the rings. 'rings' is the
+list of ring sizes; None means that all n vertices form a single ring.
+'''
+def ringRanges(n, rings):
+    if rings is None:
+        return [(0, n)]
+    ranges = []
+    start = 0
+    for size in rings:
+        ranges.append((start, start + size))
+        start += size
+    return ranges
+
+
+'''
+Returns the edges to draw as two lists of (i, j) vertex index pairs: the
+polygon edges and the interior triangle edges. Every edge appears only once.
+'''
+def collectEdges(vertices, triangles, rings = None):
+    n = len(vertices)
+    indexOf = {}
+    for i in range(n):
+        indexOf[vertices[i][2]] = i
+
+    outline = set()
+    for start, end in ringRanges(n, rings):
+        for i in range(start, end):
+            j = i + 1 if i + 1 < end else start
+            outline.add((min(i, j), max(i, j)))
+
+    interior = set()
+    for t in triangles:
+        a = indexOf[t[0]]
+        b = indexOf[t[1]]
+        c = indexOf[t[2]]
+        for i, j in ((a, b), (b, c), (c, a)):
+            key = (min(i, j), max(i, j))
+            if key not in outline:
+                interior.add(key)
+    return sorted(outline), sorted(interior)
+
+
+'''
+Maps every vertex to image coordinates, and returns the list of screen
+positions together with, for each ring, the indices of the outline vertices
+that are kept after merging vertices that fall on the same pixel.
+'''
+def project(vertices, view, rings = None):
+    screen = [(x, y) for x, y, name in view.applyAll(vertices)]
+    outlines = []
+    for start, end in ringRanges(len(screen), rings):
+        kept = []
+        last = None
+        for i in range(start, end):
+            pixel = (int(screen[i][0]), int(screen[i][1]))
+            if pixel != last:
+                kept.append(i)
+                last = pixel
+        outlines.append(kept)
+    return screen, outlines
+
+
+'''
+Returns the indices of the vertices that get a label: one per LABEL_CELL
+screen cell, or none at all if there are more than maxLabels vertices.
+'''
+def labelledVertices(screen, maxLabels):
+    if maxLabels is not None and len(screen) > maxLabels:
+        return []
+    taken = set()
+    labelled = []
+    for i in range(len(screen)):
+        cell = (int(screen[i][0]) // LABEL_CELL, int(screen[i][1]) // LABEL_CELL)
+        if cell not in taken:
+            taken.add(cell)
+            labelled.append(i)
+    return labelled
+
+
+def isShort(p, q, minEdge):
+    return minEdge > 0 and abs(p[0] - q[0]) < minEdge and abs(p[1] - q[1]) < minEdge
+
+
+'''
+Writes the polygon and its triangulation as an SVG file.
+
+@param target: A file name or a writable text stream
+@param vertices: The (x, y, name) list of the polygon (Triangulation.vertexList)
+@param triangles: The return value of Triangulate
+@param labels: False to leave out the vertex names
+@param maxLabels: No labels are drawn for polygons with more vertices than this
+@param minEdge: Interior edges shorter than this many pixels are left out
+@param view: The ViewTransform to use. By default the polygon is fitted to
+       the image.
+@param rings: The number of vertices in each ring, for a polygon with holes
+       (Triangulation.ringSizes). By default there is a single ring.
+'''
+def writeSVG(target, vertices, triangles, width = 1280, height = 720,
+             labels = True, maxLabels = 2000, minEdge = 0.0, view = None,
+             rings = None):
+    if view is None:
+        view = ViewTransform.fitVertices(vertices, width, height)
+    screen, outlines = project(vertices, view, rings)
+    _, interior = collectEdges(vertices, triangles, rings)
+
+    out = []
+    out.append('<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d" '
+               'viewBox="0 0 %d %d">\n' % (width, height, width, height))
+    out.append('<rect width="100%" height="100%" fill="white"/>\n')
+
+    # All the interior edges go into a single path element:
+    parts = []
+    for i, j in interior:
+        p = screen[i]
+        q = screen[j]
+        if isShort(p, q, minEdge):
+            continue
+        parts.append('M%.1f %.1fL%.1f %.1f' % (p[0], p[1], q[0], q[1]))
+    out.append('<path fill="none" stroke="red" stroke-width="1" d="%s"/>\n' % ''.join(parts))
+
+    # Each ring of the outline is a polygon element over its kept vertices:
+    for kept in outlines:
+        points = ' '.join(['%.1f,%.1f' % screen[i] for i in kept])
+        out.append('<polygon fill="none" stroke="black" stroke-width="2" points="%s"/>\n' % points)
+
+    if labels:
+        shown = labelledVertices(screen, maxLabels)
+        if shown:
+            out.append('<g fill="black">\n')
+            for i in shown:
+                out.append('<circle cx="%.1f" cy="%.1f" r="4"/>\n' % screen[i])
+            out.append('</g>\n<g font-family="Times" font-size="8">\n')
+            for i in shown:
+                x, y = screen[i]
+                name = str(vertices[i][2]).replace('&', '&amp;').replace('<', '&lt;')
+                out.append('<text x="%.1f" y="%.1f">%s</text>\n' % (x + 5, y - 5, name))
+            out.append('</g>\n')
+    out.append('</svg>\n')
+
+    text = ''.join(out)
+    if hasattr(target, 'write'):
+        target.write(text)
+    else:
+        outputfile = open(target, 'w')
+        try:
+            outputfile.write(text)
+        finally:
+            outputfile.close()
+
+
+'''
+A simple RGB raster image, with just enough drawing to render a triangulation.
+'''
+class Raster:
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(b'\xff' * (width * height * 3))
+
+
+    def plot(self, x, y, color):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            k = (y * self.width + x) * 3
+            self.pixels[k:k + 3] = color
+
+
+    '''
+    Draws a line from (x0, y0) to (x1, y1) by stepping along its longer axis.
+    '''
+    def line(self, x0, y0, x1, y1, color, thick = False):
+        dx = x1 - x0
+        dy = y1 - y0
+        steps = int(max(abs(dx), abs(dy))) + 1
+        for k in range(steps + 1):
+            t = k / float(steps)
+            px = int(round(x0 + dx * t))
+            py = int(round(y0 + dy * t))
+            self.plot(px, py, color)
+            if thick:
+                self.plot(px + 1, py, color)
+                self.plot(px, py + 1, color)
+
+
+    '''
+    Draws a list of (x0, y0, x1, y1) line segments. With NumPy, the pixels of
+    all the segments are computed at once; otherwise each line is drawn with
+    line().
+    '''
+    def lines(self, segments, color, thick = False):
+        if numpy is None or not segments:
+            for x0, y0, x1, y1 in segments:
+                self.line(x0, y0, x1, y1, color, thick)
+            return
+
+        seg = numpy.array(segments, dtype = numpy.float64)
+        dx = seg[:, 2] - seg[:, 0]
+        dy = seg[:, 3] - seg[:, 1]
+        steps = numpy.maximum(numpy.abs(dx), numpy.abs(dy)).astype(numpy.int64) + 1
+
+        # One row per pixel: which segment it belongs to, and how far along:
+        owner = numpy.repeat(numpy.arange(len(seg)), steps + 1)
+        start = numpy.cumsum(steps + 1) - (steps + 1)
+        k = numpy.arange(len(owner)) - start[owner]
+        t = k / steps[owner].astype(numpy.float64)
+        px = numpy.rint(seg[owner, 0] + dx[owner] * t).astype(numpy.int64)
+        py = numpy.rint(seg[owner, 1] + dy[owner] * t).astype(numpy.int64)
+        if thick:
+            px = numpy.concatenate((px, px + 1, px))
+            py = numpy.concatenate((py, py, py + 1))
+
+        inside = (px >= 0) & (px < self.width) & (py >= 0) & (py < self.height)
+        offsets = (py[inside] * self.width + px[inside]) * 3
+        image = numpy.frombuffer(self.pixels, dtype = numpy.uint8)
+        for c in range(3):
+            image[offsets + c] = color[c]
+
+
+    def dot(self, x, y, color, radius = 2):
+        cx = int(round(x))
+        cy = int(round(y))
+        for i in range(-radius, radius + 1):
+            for j in range(-radius, radius + 1):
+                self.plot(cx + i, cy + j, color)
+
+
+    '''
+    Encodes the image as a PNG file and returns the bytes.
+    '''
+    def toPNG(self):
+        rowsize = self.width * 3
+        raw = bytearray()
+        for y in range(self.height):
+            raw.append(0)                       # filter type: none
+            raw += self.pixels[y * rowsize:(y + 1) * rowsize]
+
+        def chunk(kind, data):
+            return (struct.pack('>I', len(data)) + kind + data +
+                    struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff))
+
+        header = struct.pack('>IIBBBBB', self.width, self.height, 8, 2, 0, 0, 0)
+        return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) +
+                chunk(b'IDAT', zlib.compress(bytes(raw), 6)) + chunk(b'IEND', b''))
+
+
+'''
+Writes the polygon and its triangulation as a PNG file. The parameters are the
+same as for writeSVG; vertex names are not drawn, since there are no fonts.
+
+@param target: A file name or a writable binary stream
+'''
+def writePNG(target, vertices, triangles, width = 1280, height = 720,
+             maxLabels = 2000, minEdge = 0.0, view = None, rings = None):
+    if view is None:
+        view = ViewTransform.fitVertices(vertices, width, height)
+    screen, outlines = project(vertices, view, rings)
+    _, interior = collectEdges(vertices, triangles, rings)
+
+    raster = Raster(width, height)
+    red = b'\xff\x00\x00'
+    black = b'\x00\x00\x00'
+    segments = []
+    for i, j in interior:
+        p = screen[i]
+        q = screen[j]
+        if not isShort(p, q, minEdge):
+            segments.append((p[0], p[1], q[0], q[1]))
+    raster.lines(segments, red)
+
+    segments = []
+    for kept in outlines:
+        for k in range(len(kept)):
+            p = screen[kept[k]]
+            q = screen[kept[(k + 1) % len(kept)]]
+            segments.append((p[0], p[1], q[0], q[1]))
+    raster.lines(segments, black, True)
+
+    for i in labelledVertices(screen, maxLabels):
+        raster.dot(screen[i][0], screen[i][1], black)
+
+    data = raster.toPNG()
+    if hasattr(target, 'write'):
+        target.write(data)
+    else:
+        outputfile = open(target, 'wb')
+        try:
+            outputfile.write(data)
+        finally:
+            outputfile.close()
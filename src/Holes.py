@@ -0,0 +1,372 @@
+'''
+Created on Oct 18, 2026
+
+This module turns a polygon with holes into a single ring that the
+triangulation engines can work on. Each hole is joined to the outer ring by a
+bridge: a pair of edges, one in each direction, between a vertex of the hole
+and a vertex of the ring it can see. The two bridge vertices appear twice in
+the merged ring, once on each side of the bridge.
+
+The holes are bridged one at a time, from the one that reaches furthest to
+the right. A hole is always bridged from its rightmost vertex M to a vertex
+to the right of it. The holes that are still to be bridged lie to the left of
+M, or reach just as far right and so can touch the bridge at that x, so their
+edges are in the grid from the start and block bridges like the edges of the
+merged ring; their vertices only become candidates once they are bridged. The
+vertex is found with a uniform grid over the edges and vertices: the cells
+around M are searched outwards, nearest vertex first, and each candidate is
+tested only against the edges in the cells its bridge passes through. With
+holes of about the same size, each hole costs a constant number of cell
+lookups, so bridging takes close to linear time overall.
+
+The outer ring is used in CCW order and the holes in CW order; rings given the
+other way round are reversed.
+
+MonotoneTriangulation doesn't need the bridges: its sweep handles the holes
+directly, so joinRings only puts the rings side by side in one Polygon.
+'''
+from array import array
+import heapq
+import math
+
+from Polygon import Polygon, intersect
+from Predicates import orient
+
+
+'''
+Returns twice the signed area of the ring (xs, ys).
+'''
+def ringArea2(xs, ys):
+    n = len(xs)
+    total = 0
+    for i in range(n):
+        total += xs[i - 1] * ys[i] - xs[i] * ys[i - 1]
+    return total
+
+
+'''
+A uniform grid over the edges and vertices of the merged ring.
+'''
+class BridgeGrid:
+
+    def __init__(self, xmin, ymin, xmax, ymax, count):
+        width = max(xmax - xmin, 1)
+        height = max(ymax - ymin, 1)
+        self.size = max(math.sqrt(float(width) * height / max(count, 1)), 1e-9)
+        self.xmin = xmin
+        self.ymin = ymin
+        self.cols = int(width / self.size) + 1
+        self.rows = int(height / self.size) + 1
+        self.edges = [[] for i in range(self.cols * self.rows)]
+        self.vertices = [[] for i in range(self.cols * self.rows)]
+
+
+    def col(self, x):
+        return min(max(int((x - self.xmin) / self.size), 0), self.cols - 1)
+
+
+    def row(self, y):
+        return min(max(int((y - self.ymin) / self.size), 0), self.rows - 1)
+
+
+    def addVertex(self, u, x, y):
+        self.vertices[self.col(x) * self.rows + self.row(y)].append(u)
+
+
+    '''
+    Adds the edge (u, w) to every cell its bounding box overlaps.
+    '''
+    def addEdge(self, u, w, x1, y1, x2, y2):
+        c0 = self.col(min(x1, x2))
+        c1 = self.col(max(x1, x2))
+        r0 = self.row(min(y1, y2))
+        r1 = self.row(max(y1, y2))
+        edge = (u, w)
+        for c in range(c0, c1 + 1):
+            base = c * self.rows
+            for r in range(r0, r1 + 1):
+                self.edges[base + r].append(edge)
+
+
+    '''
+    Returns the edges in the cells overlapped by the bounding box of the
+    segment (x1, y1), (x2, y2). An edge can be returned more than once.
+    '''
+    def edgesNear(self, x1, y1, x2, y2):
+        c0 = self.col(min(x1, x2))
+        c1 = self.col(max(x1, x2))
+        r0 = self.row(min(y1, y2))
+        r1 = self.row(max(y1, y2))
+        for c in range(c0, c1 + 1):
+            base = c * self.rows
+            for r in range(r0, r1 + 1):
+                for edge in self.edges[base + r]:
+                    yield edge
+
+
+'''
+The outer ring and the holes, stored in one pool of vertices with next and
+prev links, as in Polygon. Bridging only relinks vertices and appends the two
+copies of the bridge vertices, so nothing is ever moved.
+'''
+class Bridging:
+
+    def __init__(self, outer, holes):
+        self.xs = []
+        self.ys = []
+        self.source = []
+        self.nxt = []
+        self.prv = []
+
+        rings = [outer] + list(holes)
+        offset = 0
+        self.starts = []
+        for k in range(len(rings)):
+            xs, ys = rings[k]
+            n = len(xs)
+            ids = list(range(offset, offset + n))
+            area = ringArea2(xs, ys)
+            # The outer ring must be CCW and the holes CW:
+            if (k == 0 and area < 0) or (k > 0 and area > 0):
+                ids.reverse()
+            first = len(self.xs)
+            for i in range(n):
+                self.xs.append(xs[ids[i] - offset])
+                self.ys.append(ys[ids[i] - offset])
+                self.source.append(ids[i])
+                self.nxt.append(first + (i + 1) % n)
+                self.prv.append(first + (i - 1) % n)
+            self.starts.append((first, n))
+            offset += n
+        self.grid = None
+
+
+    def addEdges(self, first, n):
+        xs = self.xs
+        ys = self.ys
+        for u in range(first, first + n):
+            w = self.nxt[u]
+            self.grid.addEdge(u, w, xs[u], ys[u], xs[w], ys[w])
+
+
+    def addVertices(self, first, n):
+        for u in range(first, first + n):
+            self.grid.addVertex(u, self.xs[u], self.ys[u])
+
+
+    '''
+    Same as Polygon.inCone: True if the segment from vertex a towards the point
+    (bx, by) starts inside the polygon.
+    '''
+    def inCone(self, a, bx, by):
+        xs = self.xs
+        ys = self.ys
+        a0 = self.prv[a]
+        a1 = self.nxt[a]
+        ax = xs[a]
+        ay = ys[a]
+        if orient(ax, ay, xs[a1], ys[a1], xs[a0], ys[a0]) >= 0:
+            return (orient(ax, ay, bx, by, xs[a0], ys[a0]) > 0 and
+                    orient(bx, by, ax, ay, xs[a1], ys[a1]) > 0)
+        return not (orient(ax, ay, bx, by, xs[a1], ys[a1]) >= 0 and
+                    orient(bx, by, ax, ay, xs[a0], ys[a0]) > 0)
+
+
+    '''
+    Returns True if the bridge from hole vertex m to ring vertex u is inside
+    the polygon and doesn't touch any edge of the merged ring or of a hole,
+    other than the edges that meet at m or at u's position.
+    '''
+    def canBridge(self, m, u):
+        xs = self.xs
+        ys = self.ys
+        ux = xs[u]
+        uy = ys[u]
+        if not (self.inCone(u, xs[m], ys[m]) and self.inCone(m, ux, uy)):
+            return False
+
+        nxt = self.nxt
+        seen = set()
+        for edge in self.grid.edgesNear(xs[m], ys[m], ux, uy):
+            c, d = edge
+            if nxt[c] != d or edge in seen:
+                continue                 # replaced by a bridge, or seen
+            seen.add(edge)
+            if c == m or d == m:
+                continue
+            if (xs[c] == ux and ys[c] == uy) or (xs[d] == ux and ys[d] == uy):
+                continue
+            if intersect(xs, ys, m, u, c, d):
+                return False
+        return True
+
+
+    '''
+    Finds the ring vertex to bridge hole vertex m to: the nearest vertex to the
+    right of m (x not smaller) that m can see. Returns None if there is none.
+    '''
+    def findBridge(self, m):
+        xs = self.xs
+        ys = self.ys
+        grid = self.grid
+        mx = xs[m]
+        my = ys[m]
+        c0 = grid.col(mx)
+        r0 = grid.row(my)
+        reach = max(grid.cols - c0, r0 + 1, grid.rows - r0)
+        heap = []
+        for k in range(reach + 1):
+            # The cells at Chebyshev distance k from m's cell, right half only:
+            cells = []
+            for c in range(c0, min(c0 + k, grid.cols - 1) + 1):
+                if c == c0 + k:
+                    rows = range(r0 - k, r0 + k + 1)
+                else:
+                    rows = (r0 - k, r0 + k) if k > 0 else (r0,)
+                for r in rows:
+                    if 0 <= r < grid.rows:
+                        cells.append(c * grid.rows + r)
+            for cell in cells:
+                for u in grid.vertices[cell]:
+                    if xs[u] >= mx:
+                        dx = xs[u] - mx
+                        dy = ys[u] - my
+                        heapq.heappush(heap, (dx * dx + dy * dy, u))
+
+            # Every vertex not seen yet is at least k cells away:
+            limit = (k * grid.size) ** 2 if k < reach else float('inf')
+            while heap and heap[0][0] <= limit:
+                u = heapq.heappop(heap)[1]
+                if self.canBridge(m, u):
+                    return u
+        return None
+
+
+    '''
+    Joins the hole that starts at 'first' to the merged ring.
+    '''
+    def bridge(self, first, n):
+        xs = self.xs
+        ys = self.ys
+        m = first
+        for i in range(first + 1, first + n):
+            if xs[i] > xs[m] or (xs[i] == xs[m] and ys[i] < ys[m]):
+                m = i
+
+        u = self.findBridge(m)
+        if u is None:
+            raise ValueError("Hole at (%s, %s) can't be joined to the outer ring"
+                             % (xs[m], ys[m]))
+
+        # Copies of m and u for the way back across the bridge:
+        m2 = self.copyVertex(m)
+        u2 = self.copyVertex(u)
+        nxt = self.nxt
+        prv = self.prv
+        after = nxt[u]
+        before = prv[m]
+        nxt[u] = m
+        prv[m] = u
+        nxt[before] = m2
+        prv[m2] = before
+        nxt[m2] = u2
+        prv[u2] = m2
+        nxt[u2] = after
+        prv[after] = u2
+
+        self.addVertices(first, n)
+        grid = self.grid
+        for v in (m2, u2):
+            grid.addVertex(v, xs[v], ys[v])
+        for a in (u, before, m2, u2):
+            b = nxt[a]
+            grid.addEdge(a, b, xs[a], ys[a], xs[b], ys[b])
+
+
+    def copyVertex(self, v):
+        self.xs.append(self.xs[v])
+        self.ys.append(self.ys[v])
+        self.source.append(self.source[v])
+        self.nxt.append(-1)
+        self.prv.append(-1)
+        return len(self.xs) - 1
+
+
+    '''
+    Bridges every hole, rightmost first, and returns the merged ring as lists
+    xs, ys and source, where source[i] is the original vertex of position i.
+    '''
+    def merge(self):
+        xs = self.xs
+        ys = self.ys
+        self.grid = BridgeGrid(min(xs), min(ys), max(xs), max(ys), len(xs))
+        # The edges of every hole can block a bridge, but the vertices of a
+        # hole aren't candidates until it has been joined:
+        for first, n in self.starts:
+            self.addEdges(first, n)
+        first, n = self.starts[0]
+        self.addVertices(first, n)
+
+        holes = self.starts[1:]
+        holes.sort(key = lambda h: -max(xs[h[0]:h[0] + h[1]]))
+        for first, n in holes:
+            self.bridge(first, n)
+
+        mx = []
+        my = []
+        source = []
+        u = 0
+        while True:
+            mx.append(self.xs[u])
+            my.append(self.ys[u])
+            source.append(self.source[u])
+            u = self.nxt[u]
+            if u == 0:
+                break
+        return mx, my, source
+
+
+'''
+Returns the names of the vertices of all the rings, the outer ring first and
+then each hole in order. Unless a hole has names of its own, its vertices are
+numbered on from the rings before it, so vertex k is named str(k + 1) as if
+all the rings had been read from one file.
+'''
+def ringNames(outer, holes):
+    names = []
+    for p in [outer] + list(holes):
+        for i in range(len(p)):
+            names.append(p.name(i) if p.names is not None or p is outer else str(len(names) + 1))
+    return names
+
+
+'''
+Merges a polygon with holes into a single Polygon.
+
+Vertex i of the merged Polygon is named after the vertex it comes from (see
+ringNames), so the triangles of the merged Polygon refer to the original
+vertices.
+
+@param outer: The outer ring, as a Polygon
+@param holes: A list of Polygons, one per hole
+@return: The merged Polygon
+'''
+def mergeHoles(outer, holes):
+    names = ringNames(outer, holes)
+    bridging = Bridging((outer.xs, outer.ys), [(h.xs, h.ys) for h in holes])
+    xs, ys, source = bridging.merge()
+    return Polygon(xs, ys, [names[k] for k in source])
+
+
+'''
+Puts the outer ring and the holes into one Polygon without bridging them, for
+MonotoneTriangulation. Its nxt and prv arrays link each ring separately (the
+outer ring CCW, the holes CW), so it can't be used for ear clipping.
+'''
+def joinRings(outer, holes):
+    names = ringNames(outer, holes)
+    bridging = Bridging((outer.xs, outer.ys), [(h.xs, h.ys) for h in holes])
+    p = Polygon(bridging.xs, bridging.ys, [names[k] for k in bridging.source])
+    p.nxt = array('i', bridging.nxt)
+    p.prv = array('i', bridging.prv)
+    return p
@@ -6,32 +6,293 @@ This class handles some input/output. It reads input from file, parses the point
 creates a linked-list that represents a polygon, etc.
 '''
 from Point import Point
+from Polygon import Polygon, classify, coordinatesLike, appendLarge
+from array import array
+import mmap
+import os
+import re
 import sys
 
 '''
-This function compares each Point object to every other Point object in the 
-given list and removes any duplicates. Only the x and y coordinates are 
-compared.
+This function removes duplicate Point objects from the given list, in place.
+Only the x and y coordinates are compared. The first occurrence of each point
+is kept, and the order of the list is preserved.
+
+The points seen so far are kept in a set keyed on their coordinates, so this
+takes a single pass over the list.
 
 @param listofpoints: A list of Point objects.
+@param consecutive: If True, only points that are equal to the point right
+       before them are removed (the first and last points count as consecutive,
+       since the list describes a closed polygon). These are the duplicates
+       that break ear clipping; points that come back later in the ring are
+       kept.
+@return: The number of points that were removed.
 '''
-def removeDuplicates(listofpoints):
-    length = len(listofpoints)
-    i = 0
-    j = 0
-    
-    while i < length - 1:
-        j = i + 1
-        while j < length:
-            p1 = listofpoints[i]
-            p2 = listofpoints[j]
-            if p1.equals(p2):
-                length -= 1
-                listofpoints.remove(p2)
-            else:
-                j += 1
-        i += 1
-        
+def removeDuplicates(listofpoints, consecutive = False):
+    keep = []
+    if consecutive:
+        for p in listofpoints:
+            if not keep or not p.equals(keep[-1]):
+                keep.append(p)
+        # The polygon is closed, so the last point also follows the first:
+        while len(keep) > 1 and keep[-1].equals(keep[0]):
+            keep.pop()
+    else:
+        seen = set()
+        for p in listofpoints:
+            key = (p.x, p.y)
+            if key not in seen:
+                seen.add(key)
+                keep.append(p)
+
+    removed = len(listofpoints) - len(keep)
+    listofpoints[:] = keep
+    return removed
+
+
+'''
+Same as removeDuplicates, but for points stored in two coordinate arrays.
+
+@return: The new x and y arrays, and the number of points that were removed.
+'''
+def removeDuplicateCoordinates(xs, ys, consecutive = False):
+    keepx = coordinatesLike(xs, [])
+    keepy = coordinatesLike(ys, [])
+    n = len(xs)
+    if consecutive:
+        for i in range(n):
+            x = xs[i]
+            y = ys[i]
+            if len(keepx) == 0 or x != keepx[-1] or y != keepy[-1]:
+                keepx.append(x)
+                keepy.append(y)
+        while len(keepx) > 1 and keepx[-1] == keepx[0] and keepy[-1] == keepy[0]:
+            keepx.pop()
+            keepy.pop()
+    else:
+        seen = set()
+        for i in range(n):
+            key = (xs[i], ys[i])
+            if key not in seen:
+                seen.add(key)
+                keepx.append(key[0])
+                keepy.append(key[1])
+    return keepx, keepy, n - len(keepx)
+
+
+# The input format, as used by the tokenizer below. The first number is n,
+# and each point is [Xi,Yi] (whitespace is allowed around every token):
+HEADER = re.compile(br'\s*(\d+)')
+VERTEX = re.compile(br'\s*\[\s*(-?\d+)\s*,\s*(-?\d+)\s*\]')
+TRAILER = re.compile(br'\s*\Z')
+
+
+'''
+Reads the points of an input file one at a time, without loading the whole
+file. The file is memory-mapped and parsed in a single pass, and each point is
+yielded as an (x, y) tuple as soon as it has been parsed.
+
+The file format is the one described in createLinkedList. A ValueError is
+raised if the file doesn't follow it, or if the number of points doesn't match
+the first line. Since points are yielded as they are read, the count can only
+be checked at the end.
+'''
+def iterVertices(filename = 'input.txt'):
+    inputfile = open(filename, 'rb')
+    try:
+        if os.fstat(inputfile.fileno()).st_size == 0:
+            raise ValueError("%s is empty" % filename)
+        data = mmap.mmap(inputfile.fileno(), 0, access = mmap.ACCESS_READ)
+    finally:
+        inputfile.close()
+
+    try:
+        m = HEADER.match(data)
+        if m is None:
+            raise ValueError("%s: the first line should be the number of points" % filename)
+        n = int(m.group(1))
+        pos = m.end()
+
+        match = VERTEX.match
+        for i in range(n):
+            m = match(data, pos)
+            if m is None:
+                raise ValueError("%s: expected %d points, point %d is missing or malformed" % (filename, n, i + 1))
+            pos = m.end()
+            yield int(m.group(1)), int(m.group(2))
+
+        if TRAILER.match(data, pos) is None:
+            raise ValueError("%s: found more than the %d points specified" % (filename, n))
+    finally:
+        data.close()
+
+
+'''
+Reads a polygon with holes. The file starts like the usual input file: the
+number of points of the outer ring, then its points. Each hole follows in the
+same way, as its number of points and then its points:
+
+    4
+    [0,0]
+    [10,0]
+    [10,10]
+    [0,10]
+    3
+    [2,2]
+    [4,2]
+    [3,4]
+
+A file without holes is an ordinary input file.
+
+@return: A list of (xs, ys) typed arrays, one pair per ring with the outer
+        ring first, or None if the input file is inconsistent
+'''
+def readRings(filename = 'input.txt'):
+    inputfile = open(filename, 'rb')
+    try:
+        if os.fstat(inputfile.fileno()).st_size == 0:
+            return None
+        data = mmap.mmap(inputfile.fileno(), 0, access = mmap.ACCESS_READ)
+    finally:
+        inputfile.close()
+
+    rings = []
+    try:
+        pos = 0
+        match = VERTEX.match
+        while not rings or TRAILER.match(data, pos) is None:
+            m = HEADER.match(data, pos)
+            if m is None:
+                return None
+            n = int(m.group(1))
+            pos = m.end()
+            xs = array('q')
+            ys = array('q')
+            for i in range(n):
+                m = match(data, pos)
+                if m is None:
+                    return None
+                pos = m.end()
+                x = int(m.group(1))
+                y = int(m.group(2))
+                try:
+                    xs.append(x)
+                    ys.append(y)
+                except OverflowError:
+                    xs, ys = appendLarge(xs, ys, x, y)
+            rings.append((xs, ys))
+    finally:
+        data.close()
+    return rings
+
+
+'''
+Reads a file that holds many polygons, one record after another. Each record
+is laid out like an ordinary input file: its number of points, then its
+points. Unlike readRings, every record is a separate polygon, not a hole:
+
+    3
+    [0,0]
+    [4,0]
+    [0,4]
+    4
+    [0,0]
+    [10,0]
+    [10,10]
+    [0,10]
+
+The file is memory-mapped and the records are yielded one at a time, as
+(xs, ys) typed arrays, so only the current record is ever held in memory. A
+ValueError naming the record is raised if the file doesn't follow the format;
+the records before it have been yielded by then.
+'''
+def iterRecords(filename = 'input.txt'):
+    inputfile = open(filename, 'rb')
+    try:
+        if os.fstat(inputfile.fileno()).st_size == 0:
+            return
+        data = mmap.mmap(inputfile.fileno(), 0, access = mmap.ACCESS_READ)
+    finally:
+        inputfile.close()
+
+    try:
+        pos = 0
+        match = VERTEX.match
+        record = 0
+        while TRAILER.match(data, pos) is None:
+            record += 1
+            m = HEADER.match(data, pos)
+            if m is None:
+                raise ValueError("%s: record %d should start with its number of points" % (filename, record))
+            n = int(m.group(1))
+            pos = m.end()
+            xs = array('q')
+            ys = array('q')
+            for i in range(n):
+                m = match(data, pos)
+                if m is None:
+                    raise ValueError("%s: record %d: expected %d points, point %d is missing or malformed"
+                                     % (filename, record, n, i + 1))
+                pos = m.end()
+                x = int(m.group(1))
+                y = int(m.group(2))
+                try:
+                    xs.append(x)
+                    ys.append(y)
+                except OverflowError:
+                    xs, ys = appendLarge(xs, ys, x, y)
+            yield xs, ys
+    finally:
+        data.close()
+
+
+'''
+Same as iterRecords, but yields each record as a Polygon, with its duplicate
+points removed as in createPolygon. The polygons are left in the order they
+were given in, clockwise or not (Triangulation handles both).
+'''
+def iterPolygons(filename = 'input.txt', consecutive = False):
+    for xs, ys in iterRecords(filename):
+        xs, ys, removed = removeDuplicateCoordinates(xs, ys, consecutive)
+        yield Polygon(xs, ys)
+
+
+'''
+Reads all the points of an input file straight into two typed arrays (or
+lists, if the integers don't fit in 64 bits).
+
+@return: The arrays of x and y coordinates, or (None, None) if the input file
+        is inconsistent
+'''
+def readCoordinates(filename = 'input.txt'):
+    xs = array('q')
+    ys = array('q')
+    try:
+        for x, y in iterVertices(filename):
+            try:
+                xs.append(x)
+                ys.append(y)
+            except OverflowError:
+                # Too large for 64 bits (see Polygon.coordinateType):
+                xs, ys = appendLarge(xs, ys, x, y)
+    except ValueError:
+        return None, None
+    return xs, ys
+
+
+'''
+Writes the coordinates xs, ys to a file in the input format read by
+readCoordinates: the number of points, then one [x,y] line per point.
+'''
+def writeCoordinates(filename, xs, ys):
+    outputfile = open(filename, 'w')
+    try:
+        outputfile.write("%d\n" % len(xs))
+        outputfile.write("".join(["[%d,%d]\n" % (xs[i], ys[i]) for i in range(len(xs))]))
+    finally:
+        outputfile.close()
+
 
 '''
 This function takes in the name of an input file, opens it, reads the list of
@@ -43,51 +304,38 @@ number of points); each of the subsequent lines should be the coordinates of a
 single point, in the form [Xi,Yi], where Xi and Yi are integers. Therefore the 
 file should have a total of n+1 lines.
 
+@param consecutive: Passed on to removeDuplicates. If True, only consecutive
+       duplicate points are removed.
+@param validate: If True, the polygon is checked first (see Validation.py),
+       and a Validation.InvalidPolygonError is raised if it intersects itself
+       or is degenerate, instead of leaving that to the triangulation.
+@param ccw: If True, a file that lists the points in clockwise order is
+       accepted too: the linked-list is reversed (see reverseLinkedList), so
+       that it is CCW as the rest of the code expects. The points keep the
+       names of their lines in the file.
 @return: Reference to the head of the linked-list and n (number of points)
 '''
-def createLinkedList(filename = 'input.txt'):
-    
-    # Open a file object, read the contents and create a list out of the input points:
-    inputfile = open(filename, 'r')                     # 'r' for read-only mode
-    # The first line should be the number of points:
-    n = int(inputfile.readline())
-    
+def createLinkedList(filename = 'input.txt', consecutive = False, validate = False,
+                     ccw = True):
     
-    
-    # Then read all the points and store them in a list:
-    list1 = [x for x in inputfile.readlines()]
-    inputfile.close()
-
-    
-    # The size of the list must match the number that was specified:
-    if n is not len(list1):
+    # Read the coordinates of the points (see readCoordinates):
+    xs, ys = readCoordinates(filename)
+    if xs is None or len(xs) == 0:
         return None, 0
     
-    # Go through the list and check the input for any inconsistencies
-    for x in list1:
-        if len(x) < 2:
-            return None, 0                      # Something wrong with the input
-        x = x.strip()
-    
+    if validate:
+        import Validation
+        # The same points removeDuplicates leaves:
+        keepx, keepy, removed = removeDuplicateCoordinates(xs, ys, consecutive)
+        Validation.validate(keepx, keepy)
     
     points = []
-    # Go thru the list and remove the '[' and ']' signs, and create Point
-    # objects using the x and y coordinates:
-    for i in range(n):
-        p = list(list1[i])
-        p.remove('[')
-        p.remove(']')
-        p = "".join(p)
-        p = p.split(',')
-        x = int(p[0])
-        y = int(p[1])
-        # construct a Point object:
-        pt = Point(x, y)
-        points.append(pt)
+    for i in range(len(xs)):
+        points.append(Point(xs[i], ys[i]))
 
         
     # Remove any duplicate points from the list:
-    removeDuplicates(points)
+    removeDuplicates(points, consecutive)
     
     
     # This list is now treated as the points that comprise the polygon, in
@@ -113,9 +361,85 @@ def createLinkedList(filename = 'input.txt'):
     for i in range(len(points)):
         points[i].name = str(i + 1)
         
+    
+    # Make sure the points are in counterclockwise order:
+    if ccw:
+        orientation, convex = classify([p.x for p in points], [p.y for p in points])
+        if orientation < 0:
+            reverseLinkedList(firstPoint)
+        
     return firstPoint, len(points)
 
 
+'''
+Reverses a circular linked-list of points in place, by swapping the next and
+prev links of every point. The head stays the head.
+'''
+def reverseLinkedList(head):
+    cursor = head
+    while True:
+        following = cursor.next
+        cursor.next = cursor.prev
+        cursor.prev = following
+        cursor = following
+        if cursor is head:
+            break
+
+
+
+'''
+Same as createLinkedList, but returns an array-backed Polygon object instead of
+a linked-list of Point objects.
+
+@param validate, ccw: As in createLinkedList. A clockwise polygon is reversed
+       with Polygon.reverse, so its vertices get explicit names.
+@return: A Polygon object, or None if the input was inconsistent
+'''
+def createPolygon(filename = 'input.txt', consecutive = False, validate = False,
+                  ccw = True):
+    xs, ys = readCoordinates(filename)
+    if xs is None or len(xs) == 0:
+        return None
+
+    # Remove any duplicate points from the arrays:
+    xs, ys, removed = removeDuplicateCoordinates(xs, ys, consecutive)
+    if validate:
+        import Validation
+        Validation.validate(xs, ys)
+    polygon = Polygon(xs, ys)
+    if ccw and polygon.classify()[0] < 0:
+        polygon.reverse()
+    return polygon
+
+
+
+'''
+Same as createPolygon, for a file with holes (see readRings). Duplicate points
+are removed from each ring separately.
+
+@param validate: As in createLinkedList. The rings are checked together, so
+       a hole that crosses the outer ring or another hole is an error too.
+@return: The outer ring as a Polygon and a list of Polygons, one per hole, or
+        None and an empty list if the input was inconsistent
+'''
+def createPolygonWithHoles(filename = 'input.txt', consecutive = False, validate = False):
+    rings = readRings(filename)
+    if not rings or len(rings[0][0]) == 0:
+        return None, []
+
+    polygons = []
+    for xs, ys in rings:
+        xs, ys, removed = removeDuplicateCoordinates(xs, ys, consecutive)
+        if len(xs) > 0:
+            polygons.append(Polygon(xs, ys))
+    if validate:
+        import Holes
+        import Validation
+        p = Holes.joinRings(polygons[0], polygons[1:])
+        Validation.validate(p.xs, p.ys, p.nxt, p.prv, p.names)
+    return polygons[0], polygons[1:]
+
+
 
 '''
 Behaves exactly like the C library function printf.
@@ -126,10 +450,9 @@ def printf(format, *args):
 
 '''
 Prints the number of triangles and the three vertices of each triangle on each
-line.
+line. The lines are formatted and written in large chunks (see
+TriangleOutput.writeText).
 '''
 def printTrianglesToConsole(triangles):
-    printf("%d", len(triangles))
-    for i in range(len(triangles)):
-        t = triangles[i]
-        printf("\n[%s,%s,%s]", t[0], t[1], t[2])
\ No newline at end of file
+    import TriangleOutput
+    TriangleOutput.writeText(sys.stdout, triangles)
\ No newline at end of file
@@ -0,0 +1,175 @@
+'''
+Created on Oct 18, 2026
+
+Opt-in instrumentation for Triangulation. Nothing here runs unless a
+Triangulation object has been switched on with Triangulation.instrument; the
+normal triangulation path only checks whether STATS is None.
+
+A TriangulationStats object collects, for the last call to Triangulate:
+
+areaSign, intersect, diagonal: the number of calls to these predicates of the
+        ear clipping code (the functions of the same names in Polygon.py).
+        The NumPy path for large polygons evaluates the predicates in
+        batches (see BatchPredicates.py); there, every element of a batch
+        counts as one call, and a batch doesn't stop at the first answer
+        the way the scalar code does, so the counts are higher than for the
+        same polygon on the scalar path.
+earsTested: the number of vertices whose ear flag was looked at while
+        searching for the next ear
+earsClipped: the number of ears cut off
+phases: the time spent in each phase, in seconds: 'copy' (array copy of the
+        linked list), 'holes' (bridging the holes, see Holes.py), 'classify'
+        (orientation and convexity, see Polygon.classify), 'reverse' (only
+        for clockwise polygons), 'cache' (result cache lookup), 'earinit',
+        'clip' or 'triangulate' (for the other engines and for the fan of a
+        convex polygon), 'names' (building the result list) and 'total'
+'''
+import time
+
+import Polygon
+
+
+class TriangulationStats:
+
+    COUNTERS = ('areaSign', 'intersect', 'diagonal', 'earsTested', 'earsClipped')
+
+    def __init__(self):
+        self.reset()
+
+
+    def reset(self):
+        self.areaSign = 0
+        self.intersect = 0
+        self.diagonal = 0
+        self.earsTested = 0
+        self.earsClipped = 0
+        self.phases = {}
+
+
+    '''
+    Calls function(*args), adds the time it took to the phase 'name', and
+    returns its result.
+    '''
+    def time(self, name, function, *args):
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+
+    '''
+    Returns the ear clipping predicates that count their calls in this object
+    (see CountingPredicates).
+    '''
+    def counting(self):
+        return CountingPredicates(self)
+
+
+    '''
+    Returns the counters and phase times as a dictionary, e.g. to hand over to
+    a metrics system.
+    '''
+    def asDict(self):
+        result = {}
+        for name in self.COUNTERS:
+            result[name] = getattr(self, name)
+        result['phases'] = dict(self.phases)
+        return result
+
+
+    def __repr__(self):
+        return "TriangulationStats(%s)" % ", ".join(
+            ["%s=%r" % (k, v) for k, v in sorted(self.asDict().items())])
+
+
+'''
+The ear clipping predicates of Polygon.py, counting their calls in a
+TriangulationStats object. Polygon.earStatus and Polygon.earClip use these
+instead of the module functions when they are given a stats object (see
+TriangulationStats.counting), so nothing is replaced for the rest of the
+process and each Triangulation counts only its own calls.
+
+The methods take the same arguments as the functions of the same names and
+return the same results; the sign itself is left to Polygon.areaSign.
+'''
+class CountingPredicates:
+
+    def __init__(self, stats):
+        self.stats = stats
+
+
+    def areaSign(self, xs, ys, a, b, c):
+        self.stats.areaSign += 1
+        return Polygon.areaSign(xs, ys, a, b, c)
+
+
+    def between(self, xs, ys, a, b, c):
+        if self.areaSign(xs, ys, a, b, c) != 0:
+            return False
+        if xs[a] != xs[b]:
+            return (xs[a] <= xs[c] <= xs[b]) or (xs[a] >= xs[c] >= xs[b])
+        return (ys[a] <= ys[c] <= ys[b]) or (ys[a] >= ys[c] >= ys[b])
+
+
+    def intersectProp(self, xs, ys, a, b, c, d):
+        abc = self.areaSign(xs, ys, a, b, c)
+        abd = self.areaSign(xs, ys, a, b, d)
+        cda = self.areaSign(xs, ys, c, d, a)
+        cdb = self.areaSign(xs, ys, c, d, b)
+        if abc == 0 or abd == 0 or cda == 0 or cdb == 0:
+            return False
+        return ((abc > 0) != (abd > 0)) and ((cda > 0) != (cdb > 0))
+
+
+    def intersect(self, xs, ys, a, b, c, d):
+        self.stats.intersect += 1
+        if self.intersectProp(xs, ys, a, b, c, d):
+            return True
+        return (self.between(xs, ys, a, b, c) or self.between(xs, ys, a, b, d) or
+                self.between(xs, ys, c, d, a) or self.between(xs, ys, c, d, b))
+
+
+    def touchesAtEnd(self, xs, ys, a, b, c, d):
+        for p in (c, d):
+            px = xs[p]
+            py = ys[p]
+            if (px == xs[a] and py == ys[a]) or (px == xs[b] and py == ys[b]):
+                return self.areaSign(xs, ys, a, b, c) != 0 or self.areaSign(xs, ys, a, b, d) != 0
+        return False
+
+
+    def diagonalie(self, xs, ys, nxt, a, b, head):
+        c = head
+        while True:
+            c1 = nxt[c]
+            if (c != a and c1 != a and c != b and c1 != b and self.intersect(xs, ys, a, b, c, c1) and
+                    not self.touchesAtEnd(xs, ys, a, b, c, c1)):
+                return False
+            c = c1
+            if c == head:
+                break
+        return True
+
+
+    def inCone(self, xs, ys, nxt, prv, a, b):
+        a1 = nxt[a]
+        a0 = prv[a]
+        if self.areaSign(xs, ys, a, a1, a0) >= 0:
+            return self.areaSign(xs, ys, a, b, a0) > 0 and self.areaSign(xs, ys, b, a, a1) > 0
+        return not (self.areaSign(xs, ys, a, b, a1) >= 0 and self.areaSign(xs, ys, b, a, a0) > 0)
+
+
+    def diagonal(self, xs, ys, nxt, prv, a, b, head):
+        self.stats.diagonal += 1
+        return (self.inCone(xs, ys, nxt, prv, a, b) and self.inCone(xs, ys, nxt, prv, b, a) and
+                self.diagonalie(xs, ys, nxt, a, b, head))
+
+
+    def earInit(self, xs, ys, nxt, prv, ear, head):
+        v1 = head
+        while True:
+            ear[v1] = self.diagonal(xs, ys, nxt, prv, prv[v1], nxt[v1], head)
+            v1 = nxt[v1]
+            if v1 == head:
+                break
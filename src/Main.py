@@ -1,72 +1,194 @@
-from Triangulation import Triangulation
-import Tkinter            # May need to change 'Tkinter' to 'tkinter' on Windows
+from Triangulation import Triangulation, ENGINES, EARCLIP, loadTkinter
 import IOClass
+import argparse
+import sys
 '''
 Created on Nov 17, 2014
 @author: chris joseph
+
+Command line entry point. By default the input file is triangulated without
+any GUI and the triangles are written to the console, in the format of
+IOClass.printTrianglesToConsole:
+
+    python Main.py input3.txt
+    python Main.py input3.txt --engine monotone --format ply --output out.ply
+    python Main.py polygons.txt --multi --workers 4 --output out.txt
+    python Main.py big.txt --parallel --workers 4 --output out.txt
+    python Main.py input3.txt --simplify 50 --svg out.svg
+    python Main.py input3.txt --gui
+
+Only --gui imports Tkinter, and only --multi and --parallel import the worker
+pool, so a batch job loads nothing but the modules that do the computation.
+NumPy is only imported for polygons large enough to use it (see
+BatchPredicates.py), and the other engines, holes, validation,
+simplification, the renderers and the instrumentation only when they are
+asked for.
 '''
 
 
 
-def main():
-    FILENAME = 'input3.txt'
+def parseArguments(argv):
+    import Simplification
+    import TriangleOutput
+    parser = argparse.ArgumentParser(description = "Triangulate a simple polygon.")
+    parser.add_argument('input', nargs = '?', default = 'input3.txt',
+                        help = "input file (default: input3.txt)")
+    parser.add_argument('-e', '--engine', default = EARCLIP, choices = ENGINES)
+    parser.add_argument('-f', '--format', default = 'text', choices = TriangleOutput.FORMATS,
+                        help = "output format of the triangles")
+    parser.add_argument('-o', '--output', help = "file to write the triangles to (default: the console)")
+    parser.add_argument('--holes', action = 'store_true',
+                        help = "the points after the outer ring are holes (see IOClass.readRings)")
+    parser.add_argument('--multi', action = 'store_true',
+                        help = "the file holds many polygons (see IOClass.iterRecords)")
+    parser.add_argument('--parallel', action = 'store_true',
+                        help = "cut the polygon into pieces and triangulate them on worker "
+                               "processes (see ParallelTriangulation.py)")
+    parser.add_argument('-w', '--workers', type = int,
+                        help = "worker processes for --multi and --parallel (default: the number of CPUs)")
+    parser.add_argument('--validate', action = 'store_true',
+                        help = "reject polygons that aren't simple before triangulating")
+    parser.add_argument('--consecutive', action = 'store_true',
+                        help = "only remove duplicate points that follow each other")
+    parser.add_argument('--simplify', type = float, metavar = 'TOLERANCE',
+                        help = "simplify the polygon first: an area for visvalingam, a distance "
+                               "for douglas-peucker (see Simplification.py)")
+    parser.add_argument('--method', default = Simplification.VISVALINGAM, choices = Simplification.METHODS,
+                        help = "simplification method")
+    parser.add_argument('--svg', help = "also draw the triangulation into this SVG file")
+    parser.add_argument('--png', help = "also draw the triangulation into this PNG file")
+    parser.add_argument('--gui', action = 'store_true', help = "show the triangulation in a Tk window")
+    return parser.parse_args(argv)
 
-    # Open the file from disk, read the points and create a linked-list
-    # structure that represents the Polygon:
-    headnode1, size1 = IOClass.createLinkedList(FILENAME)
 
+'''
+Returns the stream to write the triangles to: the output file name, or the
+console (its binary buffer for PLY).
+'''
+def outputTarget(args):
+    if args.output:
+        return args.output
+    if args.format == 'ply':
+        return getattr(sys.stdout, 'buffer', sys.stdout)
+    return sys.stdout
 
-    # Check if the file reading was successful or if there were inconsistencies:
-    if not headnode1 or size1 < 3:
-        print("No triangulations to output")
-        return
-
-    # Create a Triangulation object from the linked list:
-    t1 = Triangulation()
-    t1.HEAD = headnode1
-    t1.SIZE = size1
-    
-    
-    # Create a copy of the linked list and use that to create a new 
-    # Triangulation object. This is an identical copy, but it will be scaled
-    # and translated in order to be graphed on the canvas.
-    headnode2, size2 = t1.cloneLinkedList()
-    t2 = Triangulation()
-    t2.HEAD = headnode2
-    t2.SIZE = size2
-    t2.scale(True)
-    t2.scale(True)
-    # The scaling is just to make the polygon look better when viewing on a 
-    # canvas. Doing it multiple times is inefficient but makes the picture 
-    # better.
-
-
-    # Do the triangulation. The return value is a list of 3-tuples, which 
-    # represent the vertices of each triangle.
-    triangles1 = t1.Triangulate()
-    triangles2 = t2.Triangulate()
-
-    # Now for the GUI. Both the polygon and its triangulation have been scaled,
-    # as specified above. Now we need to draw them on a Tkinter Canvas.
-    # Setup and init a canvas:
+
+'''
+Triangulates a file of many polygons (see BatchTriangulation.triangulateFile).
+If a record is malformed, the polygons before it are still written out, and
+the error is reported.
+'''
+def mainMulti(args):
+    import BatchTriangulation
+    try:
+        count, failed = BatchTriangulation.triangulateFile(args.input, outputTarget(args), args.format,
+                                                           args.engine, args.workers,
+                                                           validate = args.validate,
+                                                           consecutive = args.consecutive)
+    except ValueError as e:
+        sys.stderr.write("Polygon file error: %s\n" % e)
+        return 1
+    for index, error in failed:
+        sys.stderr.write("Polygon %d: %s\n" % (index + 1, error))
+    return 1 if failed else 0
+
+
+'''
+Shows the polygon and its triangulation in a Tk window, until it is closed.
+The polygon is drawn with a view transform that translates and scales it to
+fit the canvas; the points themselves are not changed.
+'''
+def showWindow(t, triangles):
+    Tkinter = loadTkinter()
     canvas_width = 1280
     canvas_height = 720
     master = Tkinter.Tk()
     canvas = Tkinter.Canvas(master, width=canvas_width, height=canvas_height)
     canvas.pack()
 
-
-    t2.drawTriangles(canvas, triangles2)
-    t2.drawPolygon(canvas)
-
-
-    # The last step is to output the triangulation of the original, non-scaled
-    # polygon to the console:
-    IOClass.printTrianglesToConsole(triangles1)
-
-
-    # Display the canvas:
+    view = t.viewTransform(canvas_width, canvas_height)
+    t.drawTriangles(canvas, triangles, view)
+    t.drawPolygon(canvas, view)
     Tkinter.mainloop()
 
 
-main()
+def main(argv = None):
+    args = parseArguments(argv)
+    if args.multi:
+        if args.holes or args.gui or args.svg or args.png:
+            sys.stderr.write("--multi can't be combined with --holes, --gui, --svg or --png\n")
+            return 2
+        return mainMulti(args)
+    if args.holes and args.simplify is not None:
+        sys.stderr.write("--simplify can't be combined with --holes\n")
+        return 2
+    if args.holes and args.parallel:
+        sys.stderr.write("--parallel can't be combined with --holes\n")
+        return 2
+
+    # Read the points into an array-backed Polygon (no Point objects are
+    # needed without the GUI):
+    holes = None
+    try:
+        if args.holes:
+            polygon, holes = IOClass.createPolygonWithHoles(args.input, args.consecutive, args.validate)
+        else:
+            polygon = IOClass.createPolygon(args.input, args.consecutive, args.validate)
+    except ValueError as e:
+        # Such as a Validation.InvalidPolygonError:
+        sys.stderr.write("%s\n" % e)
+        return 1
+
+    # Check if the file reading was successful or if there were inconsistencies:
+    if polygon is None or len(polygon) < 3:
+        print("No triangulations to output")
+        return 1
+
+    if args.simplify is not None:
+        import Simplification
+        size = len(polygon)
+        polygon, removed = Simplification.simplifyPolygon(polygon, args.simplify, args.method)
+        sys.stderr.write("Simplified: removed %d of %d vertices\n" % (removed, size))
+
+    t = Triangulation(engine = args.engine, polygon = polygon, holes = holes or None)
+
+    # Without any drawing (or pieces), the triangles are written out while they
+    # are found.
+    # The writer checks their number, which is off if no ear could be found:
+    if not (args.gui or args.svg or args.png or args.parallel):
+        try:
+            t.TriangulateTo(outputTarget(args), args.format)
+        except ValueError as e:
+            sys.stderr.write("%s\n" % e)
+            return 1
+        return 0
+
+    # The return value is a list of 3-tuples, which represent the vertices of
+    # each triangle:
+    try:
+        triangles = t.TriangulateParallel(args.workers) if args.parallel else t.Triangulate()
+    except ValueError as e:
+        sys.stderr.write("%s\n" % e)
+        return 1
+    # Each ring adds n - 2 triangles, and each hole 2 more for its bridge. The
+    # engines stop early if they can't find an ear:
+    expected = len(t.vertexList()) + 2 * len(holes or []) - 2
+    if len(triangles) != expected:
+        sys.stderr.write("Expected %d triangles, but %d were found\n" % (expected, len(triangles)))
+    if holes:
+        # The triangles refer to the vertices of all the rings:
+        import Holes
+        polygon = Holes.joinRings(polygon, holes)
+    import TriangleOutput
+    TriangleOutput.write(outputTarget(args), polygon, triangles, args.format)
+    if args.svg:
+        t.renderSVG(args.svg, triangles)
+    if args.png:
+        t.renderPNG(args.png, triangles)
+    if args.gui:
+        showWindow(t, triangles)
+    return 0 if len(triangles) == expected else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
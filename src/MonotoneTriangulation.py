@@ -0,0 +1,364 @@
+'''
+Created on Oct 18, 2026
+
+This module is the second triangulation engine used by the Triangulation class.
+Instead of clipping ears, the polygon is first split into y-monotone pieces
+with a sweep line, and each piece is then triangulated in linear time. The
+whole process is O(n log n) (expected, as the sweep status is a randomized
+search tree), compared to the O(n^3) worst case of ear clipping.
+
+The algorithm follows chapter 3 of 'Computational Geometry: Algorithms and
+Applications' by de Berg, Cheong, van Kreveld and Overmars:
+
+1. Sort the vertices from top to bottom and classify each of them as a start,
+   split, end, merge or regular vertex.
+2. Sweep a horizontal line down over the polygon. The sweep status holds the
+   edges that have the interior of the polygon to their right, each with a
+   'helper' vertex, in a treap (see SweepStatus.py), so each event costs
+   O(log n). Diagonals are added at split and merge vertices, which
+   removes them and leaves only y-monotone pieces.
+3. Walk the faces of the polygon + diagonals to recover the pieces.
+4. Triangulate each monotone piece with a single pass and a stack.
+
+triangulateIndices works on coordinate arrays, such as the ones in a Polygon
+object, and returns (a, b, c) index triples like Polygon.earClip;
+Triangulation.Triangulate turns them into the usual [v1, v2, v3] name
+triples.
+
+The sweep works on any set of rings given by next and prev index arrays, so a
+polygon with holes (the outer ring CCW, the holes CW, see Holes.py) is
+triangulated as it is: the top vertex of every hole is a split vertex and its
+bottom vertex a merge vertex, and the diagonals added there connect the holes
+to the rest of the polygon.
+'''
+import math
+
+from SweepStatus import SweepStatus, NONE
+
+
+# Vertex types used during the sweep:
+START = 0
+SPLIT = 1
+END = 2
+MERGE = 3
+REGULAR = 4
+
+
+'''
+Returns True if the point (x1, y1) comes before the point (x2, y2) in sweep
+order. Points with the same y-coordinate are ordered by their x-coordinate, so
+that horizontal edges are handled as if they were rotated very slightly.
+'''
+def above(x1, y1, x2, y2):
+    return y1 > y2 or (y1 == y2 and x1 < x2)
+
+
+'''
+Returns twice the signed area of the triangle (a, b, c), where a, b and c are
+indices into the coordinate lists xs and ys.
+'''
+def area2(xs, ys, a, b, c):
+    return (xs[b] - xs[a]) * (ys[c] - ys[a]) - (xs[c] - xs[a]) * (ys[b] - ys[a])
+
+
+'''
+Returns the next and prev index lists of a single ring of n vertices.
+'''
+def ringLinks(n):
+    return [(i + 1) % n for i in range(n)], [(i - 1) % n for i in range(n)]
+
+
+'''
+Classifies vertex i of the polygon as a start, split, end, merge or regular
+vertex.
+'''
+def vertexType(xs, ys, i, nxt, prv):
+    p = prv[i]
+    q = nxt[i]
+    prevBelow = above(xs[i], ys[i], xs[p], ys[p])
+    nextBelow = above(xs[i], ys[i], xs[q], ys[q])
+    convex = area2(xs, ys, p, i, q) > 0
+
+    if prevBelow and nextBelow:
+        if convex:
+            return START
+        return SPLIT
+    if not prevBelow and not nextBelow:
+        if convex:
+            return END
+        return MERGE
+    return REGULAR
+
+
+'''
+Returns the x-coordinate of edge e (which runs from vertex e to vertex nxt[e])
+at the horizontal line y. Horizontal edges return the x-coordinate of their
+upper (left) endpoint.
+'''
+def edgeX(xs, ys, e, nxt, y):
+    f = nxt[e]
+    x1, y1, x2, y2 = xs[e], ys[e], xs[f], ys[f]
+    if y1 == y2:
+        return min(x1, x2)
+    return x1 + (y - y1) * float(x2 - x1) / (y2 - y1)
+
+
+'''
+Returns a test for SweepStatus.search that is True for the edges in the
+sweep status that lie strictly to the left of the point (x, y).
+'''
+def leftOf(xs, ys, nxt, x, y):
+    return lambda e: edgeX(xs, ys, e, nxt, y) < x
+
+
+'''
+Inserts edge e (whose upper endpoint is the current event point (x, y)) into
+the sweep status.
+'''
+def statusInsert(status, xs, ys, nxt, e, x, y):
+    status.insert(e, status.search(leftOf(xs, ys, nxt, x, y)))
+
+
+'''
+Returns the edge in the sweep status that is immediately to the left of the
+point (x, y). There always is one in a simple polygon.
+'''
+def statusLeftOf(status, xs, ys, nxt, x, y):
+    e = status.search(leftOf(xs, ys, nxt, x, y))
+    e = status.last() if e == NONE else status.prev(e)
+    if e == NONE:
+        raise ValueError("No edge left of (%s, %s): the polygon is not simple" % (x, y))
+    return e
+
+
+'''
+Sweeps the polygon from top to bottom and returns the list of diagonals (as
+pairs of vertex indices) that split it into y-monotone pieces.
+
+@param nxt, prv: The rings of the polygon, as in Polygon. By default the
+       vertices form a single ring in the order given.
+'''
+def monotoneDiagonals(xs, ys, nxt = None, prv = None):
+    n = len(xs)
+    if nxt is None:
+        nxt, prv = ringLinks(n)
+    order = sorted(range(n), key = lambda i: (-ys[i], xs[i]))
+    types = [vertexType(xs, ys, i, nxt, prv) for i in range(n)]
+
+    status = SweepStatus(n)     # edges with the interior to their right
+    helper = [-1] * n           # helper[e] is the helper vertex of edge e
+    diagonals = []
+
+    for v in order:
+        x = xs[v]
+        y = ys[v]
+        t = types[v]
+        ePrev = prv[v]
+
+        if t == START:
+            statusInsert(status, xs, ys, nxt, v, x, y)
+            helper[v] = v
+
+        elif t == END:
+            if types[helper[ePrev]] == MERGE:
+                diagonals.append((v, helper[ePrev]))
+            status.remove(ePrev)
+
+        elif t == SPLIT:
+            ej = statusLeftOf(status, xs, ys, nxt, x, y)
+            diagonals.append((v, helper[ej]))
+            helper[ej] = v
+            statusInsert(status, xs, ys, nxt, v, x, y)
+            helper[v] = v
+
+        elif t == MERGE:
+            if types[helper[ePrev]] == MERGE:
+                diagonals.append((v, helper[ePrev]))
+            status.remove(ePrev)
+            ej = statusLeftOf(status, xs, ys, nxt, x, y)
+            if types[helper[ej]] == MERGE:
+                diagonals.append((v, helper[ej]))
+            helper[ej] = v
+
+        else:
+            p = ePrev
+            if above(xs[p], ys[p], x, y):
+                # The interior of the polygon lies to the right of v:
+                if types[helper[ePrev]] == MERGE:
+                    diagonals.append((v, helper[ePrev]))
+                status.remove(ePrev)
+                statusInsert(status, xs, ys, nxt, v, x, y)
+                helper[v] = v
+            else:
+                ej = statusLeftOf(status, xs, ys, nxt, x, y)
+                if types[helper[ej]] == MERGE:
+                    diagonals.append((v, helper[ej]))
+                helper[ej] = v
+
+    return diagonals
+
+
+'''
+Splits the polygon along the given diagonals and returns the resulting pieces,
+each one a list of vertex indices in CCW order.
+
+Every vertex keeps its neighbours sorted by angle. Walking a face means
+arriving at a vertex and leaving through the next neighbour in clockwise
+order, which keeps the interior of the face on the left.
+
+@param nxt, prv: The rings of the polygon, as in monotoneDiagonals
+'''
+def splitPolygon(xs, ys, diagonals, nxt = None, prv = None):
+    n = len(xs)
+    if nxt is None:
+        if not diagonals:
+            return [list(range(n))]
+        nxt, prv = ringLinks(n)
+
+    neighbours = [[prv[i], nxt[i]] for i in range(n)]
+    seen = set()
+    for a, b in diagonals:
+        key = (min(a, b), max(a, b))
+        if a == b or key in seen or b == nxt[a] or b == prv[a]:
+            continue
+        seen.add(key)
+        neighbours[a].append(b)
+        neighbours[b].append(a)
+
+    # Sort the neighbours of the vertices that got any diagonals by angle:
+    for v in range(n):
+        if len(neighbours[v]) > 2:
+            neighbours[v].sort(key = lambda u: math.atan2(ys[u] - ys[v], xs[u] - xs[v]))
+
+    # The half-edges that have the interior on their left are the polygon
+    # edges in ring order and both directions of every diagonal:
+    halfedges = [(i, nxt[i]) for i in range(n)]
+    for a, b in seen:
+        halfedges.append((a, b))
+        halfedges.append((b, a))
+
+    visited = set()
+    pieces = []
+    for start in halfedges:
+        if start in visited:
+            continue
+        piece = []
+        u, v = start
+        while (u, v) not in visited:
+            visited.add((u, v))
+            piece.append(u)
+            nbrs = neighbours[v]
+            if len(nbrs) == 2:
+                w = nbrs[0] if nbrs[1] == u else nbrs[1]
+            else:
+                w = nbrs[nbrs.index(u) - 1]
+            u, v = v, w
+        pieces.append(piece)
+    return pieces
+
+
+'''
+Triangulates one y-monotone piece (a list of vertex indices in CCW order) in
+linear time and appends the triangles to 'triangles' as index triples.
+'''
+def triangulateMonotonePiece(xs, ys, piece, triangles):
+    m = len(piece)
+    if m < 3:
+        return
+    if m == 3:
+        triangles.append((piece[0], piece[1], piece[2]))
+        return
+
+    # Find the top and bottom vertices of the piece:
+    top = 0
+    bottom = 0
+    for i in range(1, m):
+        if above(xs[piece[i]], ys[piece[i]], xs[piece[top]], ys[piece[top]]):
+            top = i
+        if above(xs[piece[bottom]], ys[piece[bottom]], xs[piece[i]], ys[piece[i]]):
+            bottom = i
+
+    # Going CCW from the top vertex walks down the left chain, and going CCW
+    # from the bottom vertex walks up the right chain. Merge the two chains
+    # into a single list sorted from top to bottom:
+    left = []
+    i = top
+    while i != bottom:
+        left.append(piece[i])
+        i = (i + 1) % m
+    right = []
+    i = bottom
+    while i != top:
+        right.append(piece[i])
+        i = (i + 1) % m
+    right.reverse()
+
+    onLeft = {}
+    merged = [piece[top]]
+    onLeft[piece[top]] = True
+    a = 1
+    b = 0
+    while a < len(left) or b < len(right) - 1:
+        if b >= len(right) - 1 or (a < len(left) and above(xs[left[a]], ys[left[a]], xs[right[b]], ys[right[b]])):
+            merged.append(left[a])
+            onLeft[left[a]] = True
+            a += 1
+        else:
+            merged.append(right[b])
+            onLeft[right[b]] = False
+            b += 1
+    merged.append(piece[bottom])
+
+    # Triangulate with the stack algorithm:
+    stack = [merged[0], merged[1]]
+    for j in range(2, m - 1):
+        u = merged[j]
+        if onLeft[u] != onLeft[stack[-1]]:
+            # u is on the opposite chain, so it sees every vertex on the stack:
+            for k in range(len(stack) - 1, 0, -1):
+                triangles.append((u, stack[k], stack[k - 1]))
+            stack = [merged[j - 1], u]
+        else:
+            last = stack.pop()
+            while stack:
+                if onLeft[u]:
+                    inside = area2(xs, ys, stack[-1], last, u) > 0
+                else:
+                    inside = area2(xs, ys, u, last, stack[-1]) > 0
+                if not inside:
+                    break
+                triangles.append((u, last, stack[-1]))
+                last = stack.pop()
+            stack.append(last)
+            stack.append(u)
+
+    # The bottom vertex sees every vertex left on the stack:
+    u = merged[m - 1]
+    for k in range(len(stack) - 1):
+        triangles.append((u, stack[k], stack[k + 1]))
+
+
+'''
+Triangulates the polygon given by the coordinate lists xs and ys (in CCW
+order).
+
+@param nxt, prv: The rings of the polygon, if it has holes (see
+       monotoneDiagonals)
+@param out: Where to add the triangles, with its extend method, as each
+       monotone piece is done. By default a new list.
+@return: A list of (a, b, c) index triples, each listed in CCW order, or
+        'out'.
+'''
+def triangulateIndices(xs, ys, nxt = None, prv = None, out = None):
+    if out is None:
+        out = []
+    diagonals = monotoneDiagonals(xs, ys, nxt, prv)
+    for piece in splitPolygon(xs, ys, diagonals, nxt, prv):
+        triangles = []
+        triangulateMonotonePiece(xs, ys, piece, triangles)
+        for k in range(len(triangles)):
+            a, b, c = triangles[k]
+            if area2(xs, ys, a, b, c) < 0:
+                triangles[k] = (a, c, b)
+        out.extend(triangles)
+    return out
@@ -0,0 +1,313 @@
+'''
+Created on Oct 18, 2026
+
+Divide and conquer triangulation of one large polygon on several processes.
+The polygon is cut along diagonals into pieces of about the same size, the
+pieces are triangulated independently by a pool of worker processes (see
+BatchTriangulation), and their triangles are put back together. A diagonal
+cuts a simple polygon into two simple polygons, so the triangles of the
+pieces together triangulate the whole polygon (though not in the same way as
+Triangulate would).
+
+Cutting helps on one core too for the 'earclip' engine, which takes about
+quadratic time, so two halves cost less than the whole. The 'reflex' engine
+is close to linear on smooth outlines, and slower on the pieces than on the
+whole, since the cut edges lead to long triangles that cover many cells of its
+grid; it only gains from the workers.
+
+To cut a piece of n vertices, a ray is shot from each of CANDIDATES vertices
+spread around it, towards the vertex across the ring, and the vertex that the
+ray shows to be visible is a candidate (see visibleVertex). The most balanced
+candidate that passes the exact test of Polygon.diagonal (InCone both ways,
+and no edge crossed, done with BatchPredicates.diagonals) is used. Each ray
+and each test is O(n), and done with NumPy. Without NumPy, the candidates are
+just segments between vertices about n/2 apart, and a piece for which none
+of them is a diagonal is left whole.
+
+The largest piece is cut next, until there are enough pieces or the largest
+one is smaller than MIN_SIZE. Where the only diagonals found cut off small
+pieces (spiky outlines), those don't count, up to MAX_CUTS cuts per piece.
+
+Holes aren't supported.
+'''
+from array import array
+import heapq
+import os
+import random
+
+import BatchPredicates
+import BatchTriangulation
+from Polygon import Polygon, inCone, diagonal, coordinatesLike
+from Triangulation import Triangulation, EARCLIP
+
+
+# Number of starting vertices for the candidate diagonals of a piece, and
+# their offsets from the opposite vertex, in 1/32ths of the piece:
+CANDIDATES = 16
+OFFSETS = (0, 1, -1, 2, -2, 4, -4)
+
+# Number of candidates that get the O(n) edge test before a piece is left
+# whole:
+MAX_TESTS = 16
+
+# Pieces smaller than this aren't cut any further:
+MIN_SIZE = 1000
+
+# At most this many cuts per piece asked for, where the cuts only cut off
+# small pieces:
+MAX_CUTS = 4
+
+
+'''
+Returns the size of the larger of the two pieces that the diagonal i,j cuts a
+ring of n vertices into (both pieces include i and j).
+'''
+def largerPiece(n, i, j):
+    return max((j - i) % n, (i - j) % n) + 1
+
+
+'''
+Returns the candidate diagonals of a ring of n vertices, as (i, j) pairs of
+positions in the ring, most balanced first.
+'''
+def candidates(n, rng):
+    start = rng.randrange(n)
+    pairs = set()
+    for k in range(CANDIDATES):
+        i = (start + k * n // CANDIDATES) % n
+        for d in OFFSETS:
+            j = (i + n // 2 + d * n // 32) % n
+            if (j - i) % n > 1 and (i - j) % n > 1:
+                pairs.add((min(i, j), max(i, j)))
+    return sorted(pairs, key = lambda p: (largerPiece(n, p[0], p[1]), p))
+
+
+'''
+Returns a vertex of the ring (x, y) (float NumPy arrays) that vertex i can
+see, found by shooting a ray from i in the direction (dx, dy), which must
+point into the polygon. The ray stops at the first edge it hits, at P. If no
+vertex lies inside the triangle formed by i, P and one end of that edge, i
+sees that end. Otherwise, of the vertices inside, i sees the one at the
+smallest angle from the ray (O'Rourke, "Computational Geometry in C", Lemma
+1.2.2 uses the same argument).
+
+This is done in floating point, so the result is only a candidate, to be
+checked with the exact predicates. Returns -1 if the ray hits nothing.
+'''
+def visibleVertex(x, y, i, dx, dy):
+    numpy = BatchPredicates.numpy
+    n = len(x)
+    px = x[i]
+    py = y[i]
+    c1 = numpy.roll(numpy.arange(n), -1)
+    ex = x[c1] - x
+    ey = y[c1] - y
+    wx = x - px
+    wy = y - py
+    with numpy.errstate(divide = 'ignore', invalid = 'ignore'):
+        denom = dx * ey - dy * ex
+        t = (wx * ey - wy * ex) / denom
+        u = (wx * dy - wy * dx) / denom
+    hits = (denom != 0) & (t > 0) & (u >= 0) & (u <= 1)
+    hits[i] = False
+    hits[(i - 1) % n] = False
+    if not hits.any():
+        return -1
+    k = int(numpy.flatnonzero(hits)[numpy.argmin(t[hits])])
+    hx = px + t[k] * dx
+    hy = py + t[k] * dy
+
+    # The end of the edge on the far side of the ray:
+    e = int(c1[k]) if u[k] >= 0.5 else k
+    ox = x[e] - hx
+    oy = y[e] - hy
+    side = numpy.sign(dx * oy - dy * ox)
+    if side == 0:
+        return e
+    inside = ((side * (dx * wy - dy * wx) > 0) &
+              (side * (ox * (y - hy) - oy * (x - hx)) > 0) &
+              (side * ((px - x[e]) * (y - y[e]) - (py - y[e]) * (x - x[e])) > 0))
+    inside[i] = False
+    inside[e] = False
+    if not inside.any():
+        return e
+    candidates = numpy.flatnonzero(inside)
+    angle = numpy.arctan2(numpy.abs(dx * wy[candidates] - dy * wx[candidates]),
+                          dx * wx[candidates] + dy * wy[candidates])
+    return int(candidates[numpy.argmin(angle)])
+
+
+'''
+Returns the direction from vertex i of the ring (x, y) towards vertex t, if
+it points into the polygon, and otherwise the direction that halves the
+interior angle at i.
+'''
+def direction(x, y, nxt, prv, i, t):
+    numpy = BatchPredicates.numpy
+    a = numpy.array([i])
+    b = numpy.array([t])
+    if BatchPredicates.inCone(x, y, nxt, prv, a, b)[0]:
+        return float(x[t] - x[i]), float(y[t] - y[i])
+    ax = float(x[nxt[i]] - x[i])
+    ay = float(y[nxt[i]] - y[i])
+    bx = float(x[prv[i]] - x[i])
+    by = float(y[prv[i]] - y[i])
+    la = (ax * ax + ay * ay) ** 0.5
+    lb = (bx * bx + by * by) ** 0.5
+    dx = ax / la + bx / lb
+    dy = ay / la + by / lb
+    turn = ax * by - ay * bx
+    if turn < 0:
+        # A reflex vertex: the bisector of the outside angle, reversed:
+        dx, dy = -dx, -dy
+    elif turn == 0 or (dx == 0 and dy == 0):
+        # A straight angle: the normal on the inside of the ring:
+        dx, dy = -ay, ax
+    return dx, dy
+
+
+'''
+Finds a balanced diagonal of a piece, given as the array of its vertices (in
+CCW order) in the polygon (xs, ys).
+
+With NumPy, a ray is shot from each of CANDIDATES vertices spread around the
+piece towards the opposite vertex (see visibleVertex), and the vertices it
+finds are checked with BatchPredicates.diagonals, most balanced first.
+Without NumPy, the candidates are straight segments to vertices across the
+ring (see candidates), checked with Polygon.diagonal.
+
+@param arrays: The polygon coordinates as NumPy arrays, or None to use the
+       scalar predicates
+@return: An (i, j) pair of positions in the piece, with i < j, or None
+'''
+def findDiagonal(xs, ys, piece, rng, arrays = None):
+    n = len(piece)
+    if n < 4:
+        return None
+
+    if arrays is not None:
+        numpy = BatchPredicates.numpy
+        index = numpy.frombuffer(piece, dtype = numpy.int32)
+        x = arrays[0][index]
+        y = arrays[1][index]
+        fx = x.astype(numpy.float64)
+        fy = y.astype(numpy.float64)
+        v = numpy.arange(n)
+        nxt = numpy.roll(v, -1)
+        prv = numpy.roll(v, 1)
+        start = rng.randrange(n)
+        pairs = set()
+        for k in range(CANDIDATES):
+            i = (start + k * n // CANDIDATES) % n
+            dx, dy = direction(x, y, nxt, prv, i, (i + n // 2) % n)
+            j = visibleVertex(fx, fy, i, dx, dy)
+            if j >= 0 and (j - i) % n > 1 and (i - j) % n > 1:
+                pairs.add((min(i, j), max(i, j)))
+        pairs = sorted(pairs, key = lambda p: (largerPiece(n, p[0], p[1]), p))
+        for i, j in pairs[:MAX_TESTS]:
+            if BatchPredicates.diagonals(x, y, nxt, prv, numpy.array([i]), numpy.array([j]))[0]:
+                return i, j
+        return None
+
+    x = [xs[v] for v in piece]
+    y = [ys[v] for v in piece]
+    nxt = [(i + 1) % n for i in range(n)]
+    prv = [(i - 1) % n for i in range(n)]
+    tests = 0
+    for i, j in candidates(n, rng):
+        if inCone(x, y, nxt, prv, i, j) and inCone(x, y, nxt, prv, j, i):
+            if diagonal(x, y, nxt, prv, i, j, 0):
+                return i, j
+            tests += 1
+            if tests == MAX_TESTS:
+                break
+    return None
+
+
+'''
+Cuts a polygon into pieces along diagonals.
+
+@param polygon: A Polygon in CCW order
+@param pieces: The number of pieces to aim for
+@param minSize: Pieces with fewer vertices aren't cut
+@return: A list of the pieces, each an array('i') of vertex indices of the
+        polygon in CCW order
+'''
+def splitPolygon(polygon, pieces, minSize = MIN_SIZE, seed = 0):
+    xs = polygon.xs
+    ys = polygon.ys
+    arrays = None
+    if BatchPredicates.useBatch(len(xs), xs, ys):
+        arrays = BatchPredicates.coordinates(polygon)
+    rng = random.Random(seed)
+
+    # The largest piece is at the top of the heap. Pieces smaller than
+    # minSize are cheap, and don't count towards 'pieces':
+    heap = [(-len(xs), 0, array('i', range(len(xs))))]
+    done = []
+    small = []
+    cuts = 0
+    count = 1
+    while heap and len(heap) + len(done) < pieces and cuts < MAX_CUTS * pieces:
+        size, order, piece = heapq.heappop(heap)
+        if -size < minSize:
+            done.append(piece)
+            break
+        cut = findDiagonal(xs, ys, piece, rng, arrays)
+        if cut is None:
+            done.append(piece)
+            continue
+        cuts += 1
+        i, j = cut
+        for part in (piece[i:j + 1], piece[j:] + piece[:i + 1]):
+            if len(part) < minSize:
+                small.append(part)
+            else:
+                count += 1
+                heapq.heappush(heap, (-len(part), count, part))
+    return done + [entry[2] for entry in heap] + small
+
+
+'''
+Triangulates a polygon by cutting it into pieces (see splitPolygon) and
+triangulating them on a pool of worker processes.
+
+@param polygon: A Polygon, in CW or CCW order
+@param engine: The Triangulation engine for the pieces
+@param workers: Number of worker processes, by default the number of CPUs
+@param pieces: The number of pieces to cut the polygon into, by default
+       four per worker
+@return: The triangles in the same format as Triangulation.Triangulate, named
+        after the vertices of 'polygon'
+'''
+def triangulateParallel(polygon, engine = EARCLIP, workers = None, pieces = None,
+                        minSize = MIN_SIZE):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if pieces is None:
+        pieces = 4 * workers
+
+    orientation, convex = polygon.classify()
+    if convex or len(polygon) < 2 * minSize:
+        return Triangulation(engine = engine, polygon = polygon).Triangulate()
+    if orientation < 0:
+        polygon = polygon.clone()
+        polygon.reverse()
+
+    parts = []
+    for piece in splitPolygon(polygon, pieces, minSize):
+        # The ear clipping engines start at the first vertex. Starting at a
+        # cut, the ears share the long cut edge and cover the whole piece, so
+        # start across from it:
+        half = len(piece) // 2
+        piece = piece[half:] + piece[:half]
+        parts.append(Polygon(coordinatesLike(polygon.xs, [polygon.xs[v] for v in piece]),
+                             coordinatesLike(polygon.ys, [polygon.ys[v] for v in piece]),
+                             [polygon.name(v) for v in piece]))
+
+    triangles = []
+    for result in BatchTriangulation.iterTriangulate(parts, engine, workers, chunksize = 1):
+        if not result.ok():
+            raise ValueError("Piece %d of %d: %s" % (result.index + 1, len(parts), result.error))
+        triangles.extend(result.triangles)
+    return triangles
@@ -10,9 +10,14 @@ to represent a polygon.
 Other attributes:
 ear: Boolean value indicating or not this vertex is an ear of the polygon
 name: a string/integer, used to identify a vertex
+
+Point uses __slots__, so a vertex doesn't carry an attribute dictionary. For
+large polygons, see the array-backed Polygon class instead.
 '''
 
-class Point:
+class Point(object):
+
+    __slots__ = ('x', 'y', 'ear', 'name', 'next', 'prev')
     
     def __init__(self, x, y):
         self.x = x
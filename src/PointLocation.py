@@ -0,0 +1,401 @@
+'''
+Created on Oct 18, 2026
+
+Point location over a triangulation: for a query point, find the triangle
+that contains it. Scanning the triangles takes O(n) per query, which adds up
+fast with millions of queries; PointLocator answers each one in expected
+O(log n) time.
+
+The index is a trapezoidal map of the triangle edges, built by randomized
+incremental insertion (de Berg et al., "Computational Geometry", chapter 6),
+with its search structure: a DAG whose inner nodes ask whether the query
+point is left or right of a vertex (x-nodes) or above or below an edge
+(y-nodes), and whose leaves are the trapezoids of the map. Every trapezoid
+lies in one triangle, the one above its bottom edge, so each leaf simply
+holds that triangle's index (-1 outside the polygon or in a hole). The build
+takes expected O(n log n) time and the DAG has expected O(n) nodes.
+
+A grid of buckets would be simpler, but the triangulations produced here are
+full of long thin triangles (a convex polygon becomes a fan, see
+Polygon.fan), which would land in a great many buckets each. The depth of
+the DAG doesn't depend on the shape of the triangles at all.
+
+Points with the same x are ordered by y, as if the plane were slightly
+sheared, so vertical edges need no special case. All the tests use the exact
+orientation predicate (see Predicates.py). The triangles must not overlap,
+which is true of every triangulation this package produces. A point on an
+edge is reported in the triangle above the edge (to the left of a vertical
+one), and a point on the boundary of the polygon can be reported as outside.
+
+After the build, the DAG is stored in four flat arrays, so locateMany can walk
+all the query points down it together with NumPy, one level at a time.
+'''
+from array import array
+import random
+import time
+
+import BatchPredicates
+from Polygon import coordinatesLike
+from Predicates import orient
+import TriangleOutput
+
+
+# Kinds of DAG nodes:
+LEAF = 0
+XNODE = 1
+YNODE = 2
+
+
+'''
+Merges the vertices of a polygon that have the same position, and numbers the
+distinct positions in x, then y order.
+
+@return: The arrays of distinct x and y coordinates, in that order, and for
+        each vertex of the polygon the number of its position
+'''
+def distinctVertices(xs, ys):
+    positions = sorted(set(zip(xs, ys)))
+    number = {}
+    for k in range(len(positions)):
+        number[positions[k]] = k
+    ux = coordinatesLike(xs, [p[0] for p in positions])
+    uy = coordinatesLike(ys, [p[1] for p in positions])
+    ids = array('i', [number[key] for key in zip(xs, ys)])
+    return ux, uy, ids
+
+
+'''
+Collects the distinct edges of the triangles, each one from its smaller to
+its larger vertex number, with the triangle on either side of it.
+
+@return: Arrays with the two vertices of each edge, and the triangle above
+        (to the left of) and below it, -1 where there is none
+'''
+def triangleEdges(xs, ys, ids, flat):
+    sides = {}
+    for t in range(len(flat) // 3):
+        corners = (ids[flat[3 * t]], ids[flat[3 * t + 1]], ids[flat[3 * t + 2]])
+        for k in range(3):
+            a = corners[k]
+            b = corners[k - 2]
+            c = corners[k - 1]
+            if a > b:
+                a, b = b, a
+            side = orient(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c])
+            if side == 0:
+                raise ValueError("Triangle %d has no area" % t)
+            edge = sides.get((a, b))
+            if edge is None:
+                edge = sides[(a, b)] = [-1, -1]
+            edge[0 if side > 0 else 1] = t
+
+    starts = array('i')
+    ends = array('i')
+    above = array('i')
+    below = array('i')
+    for (a, b), (up, down) in sides.items():
+        starts.append(a)
+        ends.append(b)
+        above.append(up)
+        below.append(down)
+    return starts, ends, above, below
+
+
+'''
+Builds the trapezoidal map and its search DAG, one edge at a time. Nodes are
+lists: [LEAF, top, bottom, leftp, rightp] for a trapezoid (edges and vertices,
+-1 for the bounding box), [XNODE, vertex, left, right] and [YNODE, edge,
+above, below]. A leaf that is split is turned into an inner node in place, so
+every parent that pointed at the trapezoid sees the new nodes.
+'''
+class TrapezoidalMap:
+
+    def __init__(self, xs, ys, starts, ends):
+        self.xs = xs
+        self.ys = ys
+        self.starts = starts
+        self.ends = ends
+        self.root = [LEAF, -1, -1, -1, -1]
+
+
+    '''
+    Returns True if edge s is above edge t, where their x ranges overlap. The
+    edges don't cross, so this is the same all along the overlap.
+    '''
+    def isAbove(self, s, t):
+        xs = self.xs
+        ys = self.ys
+        a = self.starts[t]
+        b = self.ends[t]
+        p = self.starts[s]
+        q = self.ends[s]
+        if a <= p:
+            side = orient(xs[a], ys[a], xs[b], ys[b], xs[p], ys[p])
+            if side == 0:
+                side = orient(xs[a], ys[a], xs[b], ys[b], xs[q], ys[q])
+        else:
+            side = -orient(xs[p], ys[p], xs[q], ys[q], xs[a], ys[a])
+        if side == 0:
+            raise ValueError("Triangle edges overlap")
+        return side > 0
+
+
+    '''
+    Returns the trapezoid that edge s enters just to the right of vertex r.
+    '''
+    def locateAlong(self, s, r):
+        node = self.root
+        while node[0] != LEAF:
+            if node[0] == XNODE:
+                node = node[3] if node[1] <= r else node[2]
+            elif self.isAbove(s, node[1]):
+                node = node[2]
+            else:
+                node = node[3]
+        return node
+
+
+    def insert(self, s):
+        xs = self.xs
+        ys = self.ys
+        p = self.starts[s]
+        q = self.ends[s]
+
+        # The trapezoids that s crosses, from left to right:
+        crossed = [self.locateAlong(s, p)]
+        while True:
+            right = crossed[-1][4]
+            if right == -1 or q <= right:
+                break
+            crossed.append(self.locateAlong(s, right))
+
+        # New trapezoids above and below s. A wall between two crossed
+        # trapezoids is cut off on the side of s that its vertex isn't on, so
+        # the trapezoids on that side merge:
+        first = crossed[0]
+        upper = [[LEAF, first[1], s, p, -1]]
+        lower = [[LEAF, s, first[2], p, -1]]
+        uppers = [upper[0]]
+        lowers = [lower[0]]
+        for j in range(1, len(crossed)):
+            wall = crossed[j - 1][4]
+            side = orient(xs[p], ys[p], xs[q], ys[q], xs[wall], ys[wall])
+            if side == 0:
+                raise ValueError("A vertex lies on a triangle edge")
+            if side > 0:
+                upper[-1][4] = wall
+                upper.append([LEAF, crossed[j][1], s, wall, -1])
+            else:
+                lower[-1][4] = wall
+                lower.append([LEAF, s, crossed[j][2], wall, -1])
+            uppers.append(upper[-1])
+            lowers.append(lower[-1])
+        upper[-1][4] = q
+        lower[-1][4] = q
+
+        # Replace the crossed trapezoids in the DAG:
+        last = crossed[-1]
+        left = None
+        if first[3] != p:
+            left = [LEAF, first[1], first[2], first[3], p]
+        right = None
+        if last[4] != q:
+            right = [LEAF, last[1], last[2], q, last[4]]
+        for j in range(len(crossed)):
+            node = [YNODE, s, uppers[j], lowers[j]]
+            if j == len(crossed) - 1 and right is not None:
+                node = [XNODE, q, node, right]
+            if j == 0 and left is not None:
+                node = [XNODE, p, left, node]
+            crossed[j][:] = node
+
+
+'''
+Finds the triangle that contains each query point. Build it from a polygon
+and its triangles, then call locate or locateMany as often as needed.
+
+The triangles are numbered in the order they were given. Besides the index,
+the object keeps:
+
+buildSeconds: the time taken to build it
+depth: the length of the longest path through the DAG (the number of steps
+       of the slowest query)
+'''
+class PointLocator:
+
+    '''
+    @param polygon: The Polygon the triangles refer to. For a polygon with
+           holes this is the Polygon of all its rings, from Holes.joinRings.
+    @param triangles: Name triples (as returned by Triangulation.Triangulate),
+           index triples or a flat index array
+    @param seed: Seed for the random order in which the edges are inserted
+    '''
+    def __init__(self, polygon, triangles, seed = 0):
+        start = time.time()
+        flat = TriangleOutput.flatIndices(triangles, polygon)
+        self.count = len(flat) // 3
+        self.xs, self.ys, ids = distinctVertices(polygon.xs, polygon.ys)
+        self.starts, self.ends, above, below = triangleEdges(self.xs, self.ys, ids, flat)
+
+        trapezoids = TrapezoidalMap(self.xs, self.ys, self.starts, self.ends)
+        order = list(range(len(self.starts)))
+        random.Random(seed).shuffle(order)
+        for s in order:
+            trapezoids.insert(s)
+        self.flatten(trapezoids.root, above)
+        self.buildSeconds = time.time() - start
+
+
+    '''
+    Stores the DAG in the arrays kind, key, low and high. For an x-node, key
+    is the vertex and low and high are the left and right children; for a
+    y-node, key is the edge and low and high are the children below and
+    above; for a leaf, key is the triangle.
+    '''
+    def flatten(self, root, above):
+        self.kind = array('b')
+        self.key = array('i')
+        self.low = array('i')
+        self.high = array('i')
+        number = {}
+        nodes = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if id(node) in number:
+                continue
+            number[id(node)] = len(nodes)
+            nodes.append(node)
+            if node[0] != LEAF:
+                stack.append(node[2])
+                stack.append(node[3])
+
+        for node in nodes:
+            self.kind.append(node[0])
+            if node[0] == LEAF:
+                self.key.append(above[node[2]] if node[2] != -1 else -1)
+                self.low.append(-1)
+                self.high.append(-1)
+            elif node[0] == XNODE:
+                self.key.append(node[1])
+                self.low.append(number[id(node[2])])
+                self.high.append(number[id(node[3])])
+            else:
+                self.key.append(node[1])
+                self.low.append(number[id(node[3])])
+                self.high.append(number[id(node[2])])
+
+        # Depth of every node, children first (a leaf can have many parents):
+        depth = [-1] * len(nodes)
+        stack = [0]
+        while stack:
+            k = stack[-1]
+            if depth[k] >= 0:
+                stack.pop()
+            elif self.kind[k] == LEAF:
+                depth[k] = 0
+                stack.pop()
+            elif depth[self.low[k]] < 0:
+                stack.append(self.low[k])
+            elif depth[self.high[k]] < 0:
+                stack.append(self.high[k])
+            else:
+                depth[k] = 1 + max(depth[self.low[k]], depth[self.high[k]])
+                stack.pop()
+        self.depth = depth[0]
+
+
+    '''
+    Returns the number of bytes taken by the index: the DAG and the vertices
+    and edges it refers to.
+    '''
+    def nbytes(self):
+        total = 0
+        for a in (self.kind, self.key, self.low, self.high, self.xs, self.ys,
+                  self.starts, self.ends):
+            total += a.itemsize * len(a)
+        return total
+
+
+    def __len__(self):
+        return self.count
+
+
+    '''
+    Returns the index of the triangle that contains the point (x, y), or -1 if
+    it isn't inside the polygon.
+    '''
+    def locate(self, x, y):
+        xs = self.xs
+        ys = self.ys
+        kind = self.kind
+        key = self.key
+        node = 0
+        while kind[node] != LEAF:
+            k = key[node]
+            if kind[node] == XNODE:
+                right = x > xs[k] or (x == xs[k] and y >= ys[k])
+            else:
+                a = self.starts[k]
+                b = self.ends[k]
+                right = orient(xs[a], ys[a], xs[b], ys[b], x, y) >= 0
+            node = self.high[node] if right else self.low[node]
+        return key[node]
+
+
+    '''
+    Same as locate, for many points at once.
+
+    @param xs, ys: Sequences or arrays of the query coordinates
+    @return: An array('i') with the triangle index of every point, -1 for
+            the points outside the polygon
+    '''
+    def locateMany(self, xs, ys):
+        if not BatchPredicates.useBatch(len(xs), xs, ys):
+            return array('i', [self.locate(xs[i], ys[i]) for i in range(len(xs))])
+        return array('i', self.locateArrays(BatchPredicates.numpy.asarray(xs),
+                                            BatchPredicates.numpy.asarray(ys)).tobytes())
+
+
+    '''
+    Walks NumPy arrays of query points down the DAG together, one level per
+    step, and returns the triangle indices as an int32 array.
+    '''
+    def locateArrays(self, qx, qy):
+        numpy = BatchPredicates.numpy
+        kind = numpy.frombuffer(self.kind, dtype = numpy.int8)
+        key = numpy.frombuffer(self.key, dtype = numpy.int32)
+        low = numpy.frombuffer(self.low, dtype = numpy.int32)
+        high = numpy.frombuffer(self.high, dtype = numpy.int32)
+        vx = numpy.asarray(self.xs)
+        vy = numpy.asarray(self.ys)
+        starts = numpy.frombuffer(self.starts, dtype = numpy.int32)
+        ends = numpy.frombuffer(self.ends, dtype = numpy.int32)
+        if not (BatchPredicates.exactRange(vx) and BatchPredicates.exactRange(vy)):
+            return numpy.array([self.locate(x, y) for x, y in zip(qx.tolist(), qy.tolist())],
+                               dtype = numpy.int32)
+
+        node = numpy.zeros(len(qx), dtype = numpy.int32)
+        active = numpy.arange(len(qx))
+        while len(active):
+            current = node[active]
+            kinds = kind[current]
+            inner = kinds != LEAF
+            active = active[inner]
+            current = current[inner]
+            kinds = kinds[inner]
+            keys = key[current]
+            x = qx[active]
+            y = qy[active]
+            right = numpy.empty(len(active), dtype = bool)
+
+            isX = kinds == XNODE
+            k = keys[isX]
+            right[isX] = (x[isX] > vx[k]) | ((x[isX] == vx[k]) & (y[isX] >= vy[k]))
+            isY = ~isX
+            a = starts[keys[isY]]
+            b = ends[keys[isY]]
+            right[isY] = BatchPredicates.areaSign(vx[a], vy[a], vx[b], vy[b], x[isY], y[isY]) >= 0
+
+            node[active] = numpy.where(right, high[current], low[current])
+        return key[node]
@@ -0,0 +1,610 @@
+'''
+Created on Oct 18, 2026
+
+This class is a compact, array-backed representation of a polygon. It holds
+the same information as a circular linked-list of Point objects, but without
+one Python object per vertex:
+
+xs, ys: the vertex coordinates, in typed arrays ('q' for integer input, 'd'
+        otherwise), in CCW order. Integers that don't fit in 64 bits are
+        kept in plain lists instead (see coordinateType).
+nxt, prv: index arrays that play the role of Point.next and Point.prev
+ear: a bytearray with one ear flag per vertex. The flags are computed the
+     first time the polygon is triangulated and then kept up to date: moving
+     a vertex with moveVertex only recomputes the flags that can change.
+earsValid: True once the ear flags have been computed
+names: optional list of vertex names. If it is None, vertex i is named
+       str(i + 1), which is what IOClass.createLinkedList does.
+
+A vertex costs 2 * 8 + 2 * 4 + 1 = 25 bytes here, compared to several hundred
+bytes for a Point object with its attribute dictionary. Cloning a polygon is a
+single buffer copy per array.
+
+The ear clipping functions at the bottom of this module are the same O'Rourke
+predicates as the Triangulation class, rewritten to work on vertex indices.
+'''
+from array import array
+from Point import Point
+from Predicates import orient
+import BatchPredicates
+
+
+# Integer coordinates outside this range don't fit in an array('q'):
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+'''
+Returns the type code of the array that can hold the coordinates xs and ys:
+'q' if they are all integers that fit in 64 bits, 'd' if any of them isn't an
+integer, and None for larger integers, which are kept in plain lists. The
+predicates are exact on Python integers of any size.
+'''
+def coordinateType(xs, ys):
+    if isinstance(xs, array) and isinstance(ys, array) and xs.typecode == ys.typecode:
+        if xs.typecode in 'qd':
+            # Already typed, so there's no need to look at every element:
+            return xs.typecode
+    for values in (xs, ys):
+        for v in values:
+            if not isinstance(v, int):
+                return 'd'
+    if len(xs) > 0 and (min(min(xs), min(ys)) < INT64_MIN or max(max(xs), max(ys)) > INT64_MAX):
+        return None
+    return 'q'
+
+
+'''
+Returns the values in an array with the given type code, or in a list if the
+type code is None (see coordinateType).
+'''
+def coordinateArray(typecode, values):
+    if typecode is None:
+        return list(values)
+    return array(typecode, values)
+
+
+'''
+Returns the values stored the same way as the coordinates xs: in an array
+with the same type code, or in a list.
+'''
+def coordinatesLike(xs, values):
+    return coordinateArray(xs.typecode if isinstance(xs, array) else None, values)
+
+
+'''
+Appends the point (x, y) to the coordinate arrays xs and ys after one of the
+appends raised OverflowError, by turning them into lists.
+
+@return: The new xs and ys
+'''
+def appendLarge(xs, ys, x, y):
+    xs = list(xs[:len(ys)])
+    ys = list(ys)
+    xs.append(x)
+    ys.append(y)
+    return xs, ys
+
+
+class Polygon:
+
+    __slots__ = ('xs', 'ys', 'nxt', 'prv', 'ear', 'earsValid', 'names')
+
+    def __init__(self, xs, ys, names = None):
+        typecode = coordinateType(xs, ys)
+        n = len(xs)
+        try:
+            self.xs = coordinateArray(typecode, xs)
+            self.ys = coordinateArray(typecode, ys)
+        except OverflowError:
+            # Floats mixed with integers too large for a double:
+            self.xs = list(xs)
+            self.ys = list(ys)
+        self.nxt = array('i', range(1, n + 1))
+        self.prv = array('i', range(-1, n - 1))
+        if n > 0:
+            self.nxt[n - 1] = 0
+            self.prv[0] = n - 1
+        self.ear = bytearray(n)
+        self.earsValid = False
+        self.names = names
+
+
+    '''
+    Creates a Polygon from a circular linked-list of Point objects. The vertex
+    names are kept.
+    '''
+    @staticmethod
+    def fromLinkedList(head):
+        xs = []
+        ys = []
+        names = []
+        cursor = head
+        while True:
+            xs.append(cursor.x)
+            ys.append(cursor.y)
+            names.append(cursor.name)
+            cursor = cursor.next
+            if cursor is head:
+                break
+
+        # Don't store the names if they're the default ones:
+        default = True
+        for i in range(len(names)):
+            if names[i] != str(i + 1):
+                default = False
+                break
+        return Polygon(xs, ys, None if default else names)
+
+
+    '''
+    Creates the equivalent circular linked-list of Point objects.
+    @return: Reference to the head of the linked list and n (number of points)
+    '''
+    def toLinkedList(self):
+        n = len(self.xs)
+        if n == 0:
+            return None, 0
+        points = []
+        for i in range(n):
+            p = Point(self.xs[i], self.ys[i])
+            p.name = self.name(i)
+            p.ear = bool(self.ear[i])
+            points.append(p)
+        for i in range(n):
+            points[i].next = points[self.nxt[i]]
+            points[i].prev = points[self.prv[i]]
+        return points[0], n
+
+
+    def size(self):
+        return len(self.xs)
+
+
+    def __len__(self):
+        return len(self.xs)
+
+
+    '''
+    Returns the name of vertex i.
+    '''
+    def name(self, i):
+        if self.names is None:
+            return str(i + 1)
+        return self.names[i]
+
+
+    '''
+    Creates a copy of the polygon. Each array is copied as one buffer.
+    '''
+    def clone(self):
+        copy = Polygon.__new__(Polygon)
+        copy.xs = self.xs[:]
+        copy.ys = self.ys[:]
+        copy.nxt = self.nxt[:]
+        copy.prv = self.prv[:]
+        copy.ear = self.ear[:]
+        copy.earsValid = self.earsValid
+        copy.names = self.names
+        return copy
+
+
+    '''
+    Reverses the order of the vertices in place, e.g. to turn a clockwise ring
+    into a counterclockwise one. Every vertex keeps its name, so the names
+    are stored explicitly afterwards. The ear flags are thrown away.
+    '''
+    def reverse(self):
+        n = len(self.xs)
+        names = [self.name(i) for i in range(n)]
+        names.reverse()
+        self.xs.reverse()
+        self.ys.reverse()
+        self.names = names
+        self.ear = bytearray(n)
+        self.earsValid = False
+
+
+    '''
+    Same as the classify function below, for this polygon.
+    '''
+    def classify(self):
+        return classify(self.xs, self.ys)
+
+
+    '''
+    @return: The bounding box of the polygon as (xmin, ymin, xmax, ymax)
+    '''
+    def bounds(self):
+        return min(self.xs), min(self.ys), max(self.xs), max(self.ys)
+
+
+    '''
+    Same as Triangulation.scale, but done on the coordinate arrays: the polygon
+    is translated close to the axes and then scaled to fit the canvas.
+
+    @param uniform: True if x and y coordinates should be scaled by the same
+    factor.
+    '''
+    def scale(self, uniform = False):
+        xs = self.xs
+        ys = self.ys
+        xmin, ymin, xmax, ymax = self.bounds()
+
+        # After translating by (10 - xmin, 10 - ymin), the largest coordinates
+        # are these:
+        xmax = xmax - xmin + 10
+        ymax = ymax - ymin + 10
+
+        # 1250 and 690 are based on the canvas dimensions (1280 x 720)
+        k1 = 1250.0 / xmax
+        k2 = 690.0 / ymax
+        if uniform:
+            k1 = k2 = min(k1, k2)
+
+        for i in range(len(xs)):
+            xs[i] = int((xs[i] - xmin + 10) * k1)
+            ys[i] = int((ys[i] - ymin + 10) * k2)
+
+        # Rounding to integers can change the ear status of any vertex:
+        self.earsValid = False
+
+
+    '''
+    Computes the ear flag of every vertex, like earInit below, unless
+    they are already up to date.
+
+    @param stats: An Instrumentation.TriangulationStats object, or None. The
+           predicate calls are counted in it.
+    '''
+    def earStatus(self, stats = None):
+        if self.earsValid:
+            return self.ear
+        if BatchPredicates.useBatch(len(self.xs), self.xs, self.ys):
+            x, y = BatchPredicates.coordinates(self)
+            numpy = BatchPredicates.numpy
+            ears = BatchPredicates.earInit(x, y, numpy.array(self.nxt, dtype = numpy.intp),
+                                           numpy.array(self.prv, dtype = numpy.intp), stats)
+            self.ear[:] = ears.astype(numpy.uint8).tobytes()
+        elif len(self.xs) > 0:
+            init = earInit if stats is None else stats.counting().earInit
+            init(self.xs, self.ys, self.nxt, self.prv, self.ear, 0)
+        self.earsValid = True
+        return self.ear
+
+
+    '''
+    Moves vertex i to (x, y). If the ear flags have already been computed, only
+    the ones that can have changed are recomputed:
+
+    - the ear flag of a vertex depends on the positions of the two vertices on
+      either side of it, so the flags of i and its four closest neighbours are
+      recomputed in full.
+    - any other vertex can only change if its diagonal crosses one of the two
+      edges at i. An ear is dropped if its diagonal crosses a new edge, and a
+      non-ear is recomputed in full if its diagonal crossed an old edge.
+
+    Finding those diagonals takes two passes over all the vertices, so a move
+    costs O(n), plus O(n) for each flag that is recomputed; computing all the
+    flags again (earStatus) costs O(n^2).
+    '''
+    def moveVertex(self, i, x, y):
+        xs = self.xs
+        ys = self.ys
+        nxt = self.nxt
+        prv = self.prv
+        if not self.earsValid:
+            xs[i] = x
+            ys[i] = y
+            return
+
+        p = prv[i]
+        q = nxt[i]
+        near = set([prv[p], p, i, q, nxt[q]])
+
+        # Find the non-ears whose diagonals were blocked by the old edges:
+        recheck = []
+        for u in range(len(xs)):
+            if u in near or self.ear[u]:
+                continue
+            a = prv[u]
+            b = nxt[u]
+            if crossesEdge(xs, ys, a, b, p, i) or crossesEdge(xs, ys, a, b, i, q):
+                recheck.append(u)
+
+        xs[i] = x
+        ys[i] = y
+
+        # Drop the ears whose diagonals are crossed by the new edges:
+        for u in range(len(xs)):
+            if u in near or not self.ear[u]:
+                continue
+            a = prv[u]
+            b = nxt[u]
+            if crossesEdge(xs, ys, a, b, p, i) or crossesEdge(xs, ys, a, b, i, q):
+                self.ear[u] = False
+
+        for u in recheck:
+            self.ear[u] = diagonal(xs, ys, nxt, prv, prv[u], nxt[u], u)
+        for u in near:
+            self.ear[u] = diagonal(xs, ys, nxt, prv, prv[u], nxt[u], u)
+
+
+    '''
+    Triangulates the polygon with O'Rourke's ear clipping, like
+    Triangulation.Triangulate. The ear flags are computed once (see earStatus)
+    and the clipping is done on copies of the index arrays, so this polygon is
+    left unchanged and triangulating it again only costs the clipping. Large
+    polygons use the NumPy predicates when they are available.
+
+    @param stats: An Instrumentation.TriangulationStats object, or None. The
+           predicate calls and the number of ears tested and clipped are
+           added to it.
+    @param out: Where to append the triangles, as they are clipped off; any
+           object with an append method, such as a TriangleOutput.TriangleWriter.
+           By default a new list.
+    @return: A list of (v1, v2, v3) index triples of the form (prev, ear, next),
+            or 'out'. If no ear can be found (the polygon isn't simple), the
+            clipping stops early and there are fewer than n-2 triangles; it
+            is up to the caller to report that.
+    '''
+    def earClip(self, stats = None, out = None):
+        self.earStatus(stats)
+        if BatchPredicates.useBatch(len(self.xs), self.xs, self.ys):
+            x, y = BatchPredicates.coordinates(self)
+            return BatchPredicates.earClip(x, y, self.nxt, self.prv, self.ear, stats, out)
+
+        xs = self.xs
+        ys = self.ys
+        nxt = self.nxt[:]
+        prv = self.prv[:]
+        ear = self.ear[:]
+        returnlist = out if out is not None else []
+        isDiagonal = diagonal if stats is None else stats.counting().diagonal
+
+        head = 0
+        n = len(xs)
+        tested = 0
+
+        # Each step of the outer loop clips off one ear
+        while n > 3:
+            v2 = head
+            earfound = False
+            while True:
+                tested += 1
+                if ear[v2]:
+                    earfound = True
+                    v3 = nxt[v2]
+                    v4 = nxt[v3]
+                    v1 = prv[v2]
+                    v0 = prv[v1]
+                    returnlist.append((v1, v2, v3))
+
+                    # Update the ear status of the diagonal endpoints:
+                    ear[v1] = isDiagonal(xs, ys, nxt, prv, v0, v3, head)
+                    ear[v3] = isDiagonal(xs, ys, nxt, prv, v1, v4, head)
+
+                    # Cut off the ear v2:
+                    nxt[v1] = v3
+                    prv[v3] = v1
+                    head = v3
+                    n -= 1
+
+                    if n == 3:
+                        v2 = head
+                        returnlist.append((prv[v2], v2, nxt[v2]))
+                    break
+                v2 = nxt[v2]
+                if v2 == head:
+                    break
+
+            if not earfound:
+                break
+
+        if stats is not None:
+            stats.earsTested += tested
+            stats.earsClipped += len(xs) - n
+        return returnlist
+
+
+'''
+Classifies the ring (xs, ys) in one pass over its vertices.
+
+The orientation is the turn at the lowest of the leftmost vertices, which is
+always a convex vertex of a simple polygon, so its AreaSign is the sign of the
+polygon's area (if it is 0, the full signed area is computed instead). The
+ring is strictly convex if every turn has that same, non-zero sign and the
+edges turn around only once: going round the ring, the x direction of the
+edges changes sign exactly twice. This rules out a star drawn with crossing
+edges, whose turns all go the same way too.
+
+@return: (orientation, convex), where orientation is 1 for a CCW ring, -1 for
+        a CW ring and 0 if it has no area, and convex is True if the ring is
+        strictly convex (in either orientation)
+'''
+def classify(xs, ys):
+    n = len(xs)
+    if n < 3:
+        return 0, False
+    if BatchPredicates.useBatch(n, xs, ys):
+        x = BatchPredicates.numpy.asarray(xs)
+        y = BatchPredicates.numpy.asarray(ys)
+        orientation, convex = BatchPredicates.classify(x, y)
+        if orientation == 0:
+            orientation = signedAreaSign(xs, ys)
+        return orientation, convex
+
+    positive = 0
+    negative = 0
+    changes = 0
+    first = None
+    last = None
+    lowest = 0
+    for b in range(n):
+        a = b - 1
+        c = b + 1 if b + 1 < n else 0
+        turn = areaSign(xs, ys, a, b, c)
+        if turn > 0:
+            positive += 1
+        elif turn < 0:
+            negative += 1
+
+        # The x direction of the edge a,b:
+        dx = xs[b] - xs[a]
+        if dx != 0:
+            right = dx > 0
+            if first is None:
+                first = right
+            elif right != last:
+                changes += 1
+            last = right
+
+        if xs[b] < xs[lowest] or (xs[b] == xs[lowest] and ys[b] < ys[lowest]):
+            lowest = b
+    if last is not None and last != first:
+        changes += 1
+
+    orientation = areaSign(xs, ys, lowest - 1, lowest, (lowest + 1) % n)
+    if orientation == 0:
+        orientation = signedAreaSign(xs, ys)
+    convex = (positive == n or negative == n) and changes == 2
+    return orientation, convex
+
+
+'''
+Returns the sign of the signed area of the ring (xs, ys): 1 for CCW, -1 for
+CW, 0 for none.
+'''
+def signedAreaSign(xs, ys):
+    area = 0
+    for i in range(len(xs)):
+        area += xs[i - 1] * ys[i] - xs[i] * ys[i - 1]
+    if area > 0:
+        return 1
+    if area < 0:
+        return -1
+    return 0
+
+
+'''
+Triangulates a strictly convex polygon with n vertices as a fan from vertex 0,
+in O(n). The triangles are listed in CCW order for the given orientation of
+the ring (see classify).
+
+@return: A list of (a, b, c) index triples, like Polygon.earClip
+'''
+def fan(n, orientation = 1):
+    if orientation < 0:
+        return [(0, i + 1, i) for i in range(1, n - 1)]
+    return [(0, i, i + 1) for i in range(1, n - 1)]
+
+
+'''
+O'Rourke's AreaSign on vertex indices. The sign is exact (see Predicates.py);
+integer coordinates are handled here without any further call.
+'''
+def areaSign(xs, ys, a, b, c):
+    ax = xs[a]
+    ay = ys[a]
+    area2 = (xs[b] - ax) * (ys[c] - ay) - (xs[c] - ax) * (ys[b] - ay)
+    if type(area2) is int:
+        if area2 > 0:
+            return 1
+        if area2 < 0:
+            return -1
+        return 0
+    return orient(ax, ay, xs[b], ys[b], xs[c], ys[c])
+
+
+def between(xs, ys, a, b, c):
+    if areaSign(xs, ys, a, b, c) != 0:
+        return False
+    if xs[a] != xs[b]:
+        return (xs[a] <= xs[c] <= xs[b]) or (xs[a] >= xs[c] >= xs[b])
+    return (ys[a] <= ys[c] <= ys[b]) or (ys[a] >= ys[c] >= ys[b])
+
+
+def intersectProp(xs, ys, a, b, c, d):
+    abc = areaSign(xs, ys, a, b, c)
+    abd = areaSign(xs, ys, a, b, d)
+    cda = areaSign(xs, ys, c, d, a)
+    cdb = areaSign(xs, ys, c, d, b)
+    if abc == 0 or abd == 0 or cda == 0 or cdb == 0:
+        return False
+    return ((abc > 0) != (abd > 0)) and ((cda > 0) != (cdb > 0))
+
+
+def intersect(xs, ys, a, b, c, d):
+    if intersectProp(xs, ys, a, b, c, d):
+        return True
+    return (between(xs, ys, a, b, c) or between(xs, ys, a, b, d) or
+            between(xs, ys, c, d, a) or between(xs, ys, c, d, b))
+
+
+'''
+Returns True if the edge c,d has an end at the same position as a or b, and
+doesn't otherwise overlap the segment a,b. Such an edge only touches a,b at
+its end. This happens when a polygon has two vertices at the same position,
+like the two sides of a bridge to a hole (see Holes.py).
+'''
+def touchesAtEnd(xs, ys, a, b, c, d):
+    for p in (c, d):
+        px = xs[p]
+        py = ys[p]
+        if (px == xs[a] and py == ys[a]) or (px == xs[b] and py == ys[b]):
+            return areaSign(xs, ys, a, b, c) != 0 or areaSign(xs, ys, a, b, d) != 0
+    return False
+
+
+'''
+Returns True if the segment a,b intersects the edge c,d, where edges incident
+to a or b never count (the same rule as in diagonalie).
+'''
+def crossesEdge(xs, ys, a, b, c, d):
+    if c == a or d == a or c == b or d == b:
+        return False
+    return intersect(xs, ys, a, b, c, d) and not touchesAtEnd(xs, ys, a, b, c, d)
+
+
+'''
+Returns True if the segment a,b does not cross any edge of the polygon that
+is not incident to a or b. The ring is walked from 'head'. Edges that only
+touch a,b at another vertex in the same position as a or b don't count
+either (see touchesAtEnd).
+'''
+def diagonalie(xs, ys, nxt, a, b, head):
+    c = head
+    while True:
+        c1 = nxt[c]
+        if (c != a and c1 != a and c != b and c1 != b and intersect(xs, ys, a, b, c, c1) and
+                not touchesAtEnd(xs, ys, a, b, c, c1)):
+            return False
+        c = c1
+        if c == head:
+            break
+    return True
+
+
+def inCone(xs, ys, nxt, prv, a, b):
+    a1 = nxt[a]
+    a0 = prv[a]
+    if areaSign(xs, ys, a, a1, a0) >= 0:
+        return areaSign(xs, ys, a, b, a0) > 0 and areaSign(xs, ys, b, a, a1) > 0
+    return not (areaSign(xs, ys, a, b, a1) >= 0 and areaSign(xs, ys, b, a, a0) > 0)
+
+
+def diagonal(xs, ys, nxt, prv, a, b, head):
+    return (inCone(xs, ys, nxt, prv, a, b) and inCone(xs, ys, nxt, prv, b, a) and
+            diagonalie(xs, ys, nxt, a, b, head))
+
+
+'''
+Initializes the ear flag of every vertex in the ring that starts at 'head'.
+'''
+def earInit(xs, ys, nxt, prv, ear, head):
+    v1 = head
+    while True:
+        ear[v1] = diagonal(xs, ys, nxt, prv, prv[v1], nxt[v1], head)
+        v1 = nxt[v1]
+        if v1 == head:
+            break
@@ -0,0 +1,279 @@
+'''
+Created on Oct 18, 2026
+
+Seeded generators of simple polygons, for benchmarks and stress tests. Every
+generator takes the number of vertices n and a seed, and returns two 'q'
+arrays of integer coordinates describing a simple polygon in CCW order, with
+no duplicate points. The same n and seed always give the same polygon.
+
+convex: a strictly convex polygon, built from edge vectors in distinct
+        directions sorted by angle
+star: a star-shaped polygon, one vertex on each of n distinct rays from the
+      origin, at a random distance
+spiral: a thick spiral arm; most vertices are reflex or close to it
+comb: a row of teeth of random heights on a bar, the usual worst case for ear
+      clipping (half of the vertices are reflex)
+random: random points joined into a simple polygon by 2-opt untangling. This
+        is roughly cubic, so it's only practical up to a few thousand
+        vertices.
+collinear: a long, thin x-monotone polygon whose vertices are all within one
+           unit of two parallel lines, so many vertices are collinear with
+           their neighbours and the rest nearly are
+'''
+from array import array
+import math
+import random
+
+
+'''
+Returns a list of at least 'count' primitive integer vectors (gcd(x, y) = 1),
+all the ones up to some length r, and r itself. No two of them point in the
+same direction.
+'''
+def primitiveVectors(count):
+    # About 6 / pi^2 of the lattice points in the disk are primitive:
+    r = int(math.sqrt(count / 1.9)) + 2
+    while True:
+        vectors = []
+        for x in range(-r, r + 1):
+            h = int(math.sqrt(r * r - x * x))
+            for y in range(-h, h + 1):
+                if gcd(abs(x), abs(y)) == 1:
+                    vectors.append((x, y))
+        if len(vectors) >= count:
+            return vectors, r
+        r += r // 4 + 1
+
+
+def gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+
+'''
+Returns the vertices obtained by adding up the edge vectors in order of angle,
+starting at the origin. If the vectors add up to zero, the result is a closed
+convex polygon in CCW order.
+'''
+def chainByAngle(vectors):
+    vectors = sorted(vectors, key = lambda v: math.atan2(v[1], v[0]))
+    xs = array('q')
+    ys = array('q')
+    x = 0
+    y = 0
+    for dx, dy in vectors:
+        xs.append(x)
+        ys.append(y)
+        x += dx
+        y += dy
+    return xs, ys
+
+
+def convex(n, seed = 0):
+    rng = random.Random(seed)
+    pool, r = primitiveVectors(2 * n + 8)
+    # Opposite vectors are used in pairs, so the edges add up to zero:
+    pairs = [v for v in pool if v > (0, 0)]
+    chosen = rng.sample(pairs, n // 2 - (n % 2) * 1)
+    vectors = []
+    for x, y in chosen:
+        vectors.append((x, y))
+        vectors.append((-x, -y))
+    if n % 2:
+        # Three vectors longer than any in the pool, and so not parallel to
+        # any of them, that add up to zero:
+        if r % 3 == 0:
+            r += 1
+        vectors.extend([(r + 1, 1), (-1, r + 2), (-r, -r - 3)])
+    return chainByAngle(vectors)
+
+
+def star(n, seed = 0):
+    rng = random.Random(seed)
+    # A few fixed directions keep every gap between rays below 180 degrees, so
+    # the origin is inside the polygon:
+    if n >= 4:
+        fixed = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+    else:
+        fixed = [(1, 0), (-1, 1), (0, -1)]
+    pool, r = primitiveVectors(n + 4)
+    pool = [v for v in pool if v not in fixed]
+    directions = fixed[:n] + rng.sample(pool, n - len(fixed[:n]))
+    directions.sort(key = lambda v: math.atan2(v[1], v[0]))
+    xs = array('q')
+    ys = array('q')
+    for dx, dy in directions:
+        k = rng.randint(1, 8)
+        xs.append(dx * k)
+        ys.append(dy * k)
+    return xs, ys
+
+
+def spiral(n, seed = 0):
+    if n < 4:
+        return convex(n, seed)
+    rng = random.Random(seed)
+    m = n // 2
+    # At least 32 vertices per turn on each edge, or the chords cut across
+    # the arm:
+    turns = min(1 + m // 2000 + rng.random(), m / 32.0)
+    step = 2 * math.pi * turns / m
+    spacing = 1000.0                          # growth of the radius per radian
+    width = spacing * math.pi / 2             # half the thickness of the arm
+    start = max(3 * width, 50.0 / step + width)
+
+    outer = []
+    inner = []
+    for i in range(m):
+        angle = i * step
+        r = start + spacing * angle
+        c = math.cos(angle)
+        s = math.sin(angle)
+        outer.append((int(round((r + width) * c)), int(round((r + width) * s))))
+        inner.append((int(round((r - width) * c)), int(round((r - width) * s))))
+
+    # Out along the inner edge and back along the outer one (CCW):
+    ring = inner + outer[::-1]
+    if n % 2:
+        # One more vertex halfway across the end of the arm:
+        ring.insert(m, ((inner[-1][0] + outer[-1][0]) // 2, (inner[-1][1] + outer[-1][1]) // 2))
+    ring.reverse()
+    return array('q', [p[0] for p in ring]), array('q', [p[1] for p in ring])
+
+
+def comb(n, seed = 0):
+    if n < 4:
+        return convex(n, seed)
+    rng = random.Random(seed)
+    teeth = max(n // 4, 1)
+    tooth = 10
+    base = tooth
+    heights = [rng.randint(2, 50) * tooth for i in range(teeth)]
+    right = (2 * teeth - 1) * tooth
+
+    ring = [(0, 0)]
+    # The vertices that don't make up a full tooth go on a convex chain below
+    # the bar:
+    extra = n - 4 * teeth
+    for j in range(1, extra + 1):
+        ring.append((j * right // (extra + 1), -j * (extra + 1 - j)))
+    ring.append((right, 0))
+    for i in range(teeth - 1, -1, -1):
+        left = 2 * i * tooth
+        ring.append((left + tooth, heights[i]))
+        ring.append((left, heights[i]))
+        if i > 0:
+            ring.append((left, base))
+            ring.append((left - tooth, base))
+    return array('q', [p[0] for p in ring]), array('q', [p[1] for p in ring])
+
+
+def orientation(a, b, c):
+    v = (b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])
+    return (v > 0) - (v < 0)
+
+
+def onSegment(a, b, c):
+    return (min(a[0], b[0]) <= c[0] <= max(a[0], b[0]) and
+            min(a[1], b[1]) <= c[1] <= max(a[1], b[1]))
+
+
+'''
+Returns True if segments ab and cd have any point in common.
+'''
+def segmentsMeet(a, b, c, d):
+    o1 = orientation(a, b, c)
+    o2 = orientation(a, b, d)
+    o3 = orientation(c, d, a)
+    o4 = orientation(c, d, b)
+    if o1 != o2 and o3 != o4:
+        return True
+    return ((o1 == 0 and onSegment(a, b, c)) or (o2 == 0 and onSegment(a, b, d)) or
+            (o3 == 0 and onSegment(c, d, a)) or (o4 == 0 and onSegment(c, d, b)))
+
+
+'''
+Returns twice the signed area of a list of (x, y) points.
+'''
+def area2(ring):
+    total = 0
+    for i in range(len(ring)):
+        x0, y0 = ring[i - 1]
+        x1, y1 = ring[i]
+        total += x0 * y1 - x1 * y0
+    return total
+
+
+def randomSimple(n, seed = 0):
+    rng = random.Random(seed)
+    limit = 1 << 24
+    seen = set()
+    ring = []
+    while len(ring) < n:
+        p = (rng.randint(0, limit), rng.randint(0, limit))
+        if p not in seen:
+            seen.add(p)
+            ring.append(p)
+
+    # 2-opt: while two edges cross, reverse the part of the ring between them.
+    # Each reversal makes the perimeter shorter, so this ends.
+    changed = True
+    while changed:
+        changed = False
+        for i in range(n - 2):
+            a = ring[i]
+            b = ring[i + 1]
+            for j in range(i + 2, n if i > 0 else n - 1):
+                c = ring[j]
+                d = ring[(j + 1) % n]
+                if segmentsMeet(a, b, c, d):
+                    ring[i + 1:j + 1] = ring[i + 1:j + 1][::-1]
+                    b = ring[i + 1]
+                    changed = True
+
+    if area2(ring) < 0:
+        ring.reverse()
+    return array('q', [p[0] for p in ring]), array('q', [p[1] for p in ring])
+
+
+def nearlyCollinear(n, seed = 0):
+    rng = random.Random(seed)
+    bottom = (n + 1) // 2
+    top = n - bottom
+    ring = []
+    for i in range(bottom):
+        ring.append((i * 1000, rng.randint(0, 1)))
+    for j in range(top):
+        ring.append(((top - 1 - j) * 1000 + 500, rng.randint(2, 3)))
+    return array('q', [p[0] for p in ring]), array('q', [p[1] for p in ring])
+
+
+GENERATORS = {
+    'convex': convex,
+    'star': star,
+    'spiral': spiral,
+    'comb': comb,
+    'random': randomSimple,
+    'collinear': nearlyCollinear,
+}
+
+
+'''
+Generates a polygon with one of the generators above, by name.
+'''
+def generate(name, n, seed = 0):
+    if name not in GENERATORS:
+        raise ValueError("Unknown polygon generator: %s" % name)
+    if n < 3:
+        raise ValueError("A polygon needs at least 3 vertices")
+    return GENERATORS[name](n, seed)
+
+
+'''
+Writes coordinate arrays to a file in the input format read by IOClass (see
+IOClass.writeCoordinates).
+'''
+def writeText(filename, xs, ys):
+    import IOClass
+    IOClass.writeCoordinates(filename, xs, ys)
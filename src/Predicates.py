@@ -0,0 +1,73 @@
+'''
+Created on Oct 18, 2026
+
+The orientation predicate that all the AreaSign variants are built on. It
+returns the exact sign of twice the signed area of the triangle (a, b, c):
+
+    (bx - ax) * (cy - ay) - (cx - ax) * (by - ay)
+
+For integer coordinates (what IOClass produces) this is computed directly:
+Python integers don't overflow or round, so the sign is always right. For
+integers, this is also what O'Rourke's AreaSign with its +/-0.5 tolerance
+computes, as long as the float conversion in AreaSign doesn't round; a
+non-zero area is at least 1.
+
+For float coordinates, the same expression is evaluated in floating point and
+accepted if it is further from zero than the error bound of Shewchuk's
+orient2d (stage A of "Adaptive Precision Floating-Point Arithmetic and Fast
+Robust Geometric Predicates", 1997). Only the rare cases inside the bound are
+recomputed exactly, with rationals. Unlike AreaSign, nearly collinear float
+points are not rounded to collinear: the sign is always the exact one.
+'''
+
+
+# Half the distance between 1.0 and the next float, and the relative error
+# bound of the float determinant (Shewchuk's ccwerrboundA):
+EPSILON = 2.0 ** -53
+ERRBOUND = (3.0 + 16.0 * EPSILON) * EPSILON
+
+
+'''
+Returns 1, -1 or 0: the sign of twice the area of the triangle (a, b, c).
+'''
+def orient(ax, ay, bx, by, cx, cy):
+    abx = bx - ax
+    aby = by - ay
+    acx = cx - ax
+    acy = cy - ay
+    left = abx * acy
+    right = acx * aby
+    det = left - right
+    if type(det) is int:
+        if det > 0:
+            return 1
+        if det < 0:
+            return -1
+        return 0
+
+    bound = ERRBOUND * (abs(left) + abs(right))
+    if det > bound:
+        return 1
+    if -det > bound:
+        return -1
+    # A float difference is zero only if the two values are equal, so this is
+    # an exact zero (e.g. three points on a horizontal line):
+    if (abx == 0 or acy == 0) and (acx == 0 or aby == 0):
+        return 0
+    return orientExact(ax, ay, bx, by, cx, cy)
+
+
+'''
+Same as orient, computed with exact rational arithmetic.
+'''
+def orientExact(ax, ay, bx, by, cx, cy):
+    # Only needed for the rare signs the error bound can't decide:
+    from fractions import Fraction
+    ax = Fraction(ax)
+    ay = Fraction(ay)
+    det = (Fraction(bx) - ax) * (Fraction(cy) - ay) - (Fraction(cx) - ax) * (Fraction(by) - ay)
+    if det > 0:
+        return 1
+    if det < 0:
+        return -1
+    return 0
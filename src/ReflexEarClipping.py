@@ -0,0 +1,241 @@
+'''
+Created on Oct 18, 2026
+
+This module is an ear clipping engine for the Triangulation class that avoids
+the full edge scan done by Diagonalie.
+
+A convex vertex v (with neighbours u and w) is an ear exactly when no reflex
+vertex of the polygon lies inside or on the triangle u,v,w. So instead of
+testing the diagonal u,w against every edge of the polygon, only the reflex
+vertices need to be checked. These are kept in a ReflexGrid, rows of vertices
+sorted by x, so an ear test only looks at the reflex vertices in the part of
+each row that the triangle covers.
+
+Clipping an ear can only make its two neighbours 'more convex', so a vertex
+leaves the reflex set at most once and is never added back. An ear test costs
+O(log n) for each row the triangle crosses, and there are O(sqrt(n)) rows, plus
+the reflex vertices in the rows near the triangle that it misses. Combs, convex
+chains and most outlines have small ears and run in close to O(n log n), faster
+than MonotoneTriangulation. Stars and spirals, whose ears stretch across the
+polygon, grow as about n^1.5: a star with 80000 vertices takes about 10 s here
+and 2.6 s with 'monotone'. The worst case is O(n^2), so 'monotone' is the
+engine to use when that matters.
+
+triangulateIndices returns (a, b, c) index triples like Polygon.earClip,
+each listed in CCW order as (prev, ear, next); Triangulation.Triangulate
+turns them into the usual [v1, v2, v3] name triples.
+'''
+from bisect import bisect_left, bisect_right
+import math
+
+
+'''
+Returns twice the signed area of the triangle (a, b, c), where a, b and c are
+indices into the coordinate lists xs and ys.
+'''
+def area2(xs, ys, a, b, c):
+    return (xs[b] - xs[a]) * (ys[c] - ys[a]) - (xs[c] - xs[a]) * (ys[b] - ys[a])
+
+
+'''
+This class holds the reflex vertices of a polygon in horizontal rows. The
+rows are cut where the vertices, sorted by y, reach the next multiple of
+about 2*sqrt(k) (for k vertices), so every row holds about that many however
+the vertices are spread out, and each row keeps its vertices sorted by x. A
+triangle is tested against a row by looking up the x-range it covers within
+the row, so vertices outside it, and empty space, cost nothing.
+'''
+class ReflexGrid:
+
+    def __init__(self, xs, ys, reflex):
+        self.xs = xs
+        self.ys = ys
+        reflex = sorted(reflex, key = lambda v: ys[v])
+        step = max(1, int(2 * math.sqrt(len(reflex))))
+
+        # The lowest y of each row. Vertices with the same y share a row:
+        self.bottoms = []
+        for i in range(0, len(reflex), step):
+            y = ys[reflex[i]]
+            if not self.bottoms or y > self.bottoms[-1]:
+                self.bottoms.append(y)
+        self.top = ys[reflex[-1]] if reflex else None
+
+        # The vertices of each row by x, and their x-coordinates:
+        self.rows = [[] for _ in self.bottoms]
+        for v in reflex:
+            self.rows[self.row(ys[v])].append(v)
+        for vs in self.rows:
+            vs.sort(key = lambda v: xs[v])
+        self.rowxs = [[xs[v] for v in vs] for vs in self.rows]
+
+
+    '''
+    Returns the row that y falls in, or -1 if y is below the lowest vertex.
+    '''
+    def row(self, y):
+        return bisect_right(self.bottoms, y) - 1
+
+
+    def remove(self, v):
+        j = self.row(self.ys[v])
+        if j < 0:
+            return
+        vs = self.rows[j]
+        rowxs = self.rowxs[j]
+        x = self.xs[v]
+        i = bisect_left(rowxs, x)
+        while i < len(rowxs) and rowxs[i] == x:
+            if vs[i] == v:
+                del vs[i]
+                del rowxs[i]
+                return
+            i += 1
+
+
+    '''
+    Returns True if any vertex in the grid (other than a, b and c) lies inside
+    or on the boundary of the CCW triangle a,b,c.
+
+    This takes O(log k) time for each row the triangle crosses, plus the
+    vertices in its x-range on those rows. A tall triangle crosses O(sqrt(k))
+    rows however few vertices are near it.
+    '''
+    def anyInTriangle(self, a, b, c):
+        bottoms = self.bottoms
+        if not bottoms:
+            return False
+        xs = self.xs
+        ys = self.ys
+        ax, ay, bx, by, cx, cy = xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]
+        ylo = min(ay, by, cy)
+        yhi = max(ay, by, cy)
+        if yhi < bottoms[0] or ylo > self.top:
+            return False
+        j0 = max(self.row(ylo), 0)
+        j1 = self.row(yhi)
+        xlo = min(ax, bx, cx)
+        xhi = max(ax, bx, cx)
+        if j0 < j1:
+            # The corners by y. The edge p0-p2 bounds the triangle on one
+            # side and p0-p1-p2 on the other, so the x-range of a row comes
+            # from where these cross its top and bottom, and from p1. The
+            # distances in y are taken from the exact coordinates, and the
+            # range is widened a little for rounding errors:
+            (y0, x0), (y1, x1), (y2, x2) = sorted([(ay, ax), (by, bx), (cy, cx)])
+            slope = (x2 - x0) / (y2 - y0)
+            slope1 = (x1 - x0) / (y1 - y0) if y1 > y0 else 0.0
+            slope2 = (x2 - x1) / (y2 - y1) if y2 > y1 else 0.0
+            slack = 1e-9 * (abs(x0) + abs(x1) + abs(x2))
+        last = len(bottoms) - 1
+
+        for j in range(j0, j1 + 1):
+            rowxs = self.rowxs[j]
+            if not rowxs:
+                continue
+            if j0 == j1:
+                left = xlo
+                right = xhi
+            else:
+                lo = max(bottoms[j], ylo)
+                hi = min(bottoms[j + 1] if j < last else self.top, yhi)
+                u = x0 + (lo - y0) * slope
+                w = x0 + (hi - y0) * slope
+                left = min(u, w)
+                right = max(u, w)
+                u = x0 + (lo - y0) * slope1 if lo < y1 else x1 + (lo - y1) * slope2
+                w = x0 + (hi - y0) * slope1 if hi < y1 else x1 + (hi - y1) * slope2
+                left = min(left, u, w)
+                right = max(right, u, w)
+                if lo <= y1 <= hi:
+                    left = min(left, x1)
+                    right = max(right, x1)
+                left = max(left - slack, xlo)
+                right = min(right + slack, xhi)
+
+            vs = self.rows[j]
+            i = bisect_left(rowxs, left)
+            end = len(rowxs)
+            while i < end and rowxs[i] <= right:
+                p = vs[i]
+                i += 1
+                if p == a or p == b or p == c:
+                    continue
+                px = xs[p]
+                py = ys[p]
+                # The three edge tests are written out here since this is
+                # the innermost loop of the engine:
+                if ((bx - ax) * (py - ay) - (px - ax) * (by - ay) >= 0 and
+                    (cx - bx) * (py - by) - (px - bx) * (cy - by) >= 0 and
+                    (ax - cx) * (py - cy) - (px - cx) * (ay - cy) >= 0):
+                    # A second vertex at a corner (the other side of a
+                    # bridge to a hole, see Holes.py) doesn't count:
+                    if ((px == ax and py == ay) or (px == bx and py == by) or
+                            (px == cx and py == cy)):
+                        continue
+                    return True
+        return False
+
+
+'''
+Triangulates the polygon given by the coordinate lists xs and ys (in CCW
+order).
+
+@param out: Where to append the triangles as they are clipped off, as in
+       Polygon.earClip. By default a new list.
+@return: A list of (v1, v2, v3) index triples of the form (prev, ear, next),
+        or 'out'. There are fewer than n-2 if no ear can be found, as in
+        Polygon.earClip.
+'''
+def triangulateIndices(xs, ys, out = None):
+    n = len(xs)
+    nxt = [(i + 1) % n for i in range(n)]
+    prv = [(i - 1) % n for i in range(n)]
+    returnlist = out if out is not None else []
+    if n < 3:
+        return returnlist
+
+    # Collinear vertices are not convex, so they are indexed with the reflex
+    # ones. They can still block an ear if they lie on the candidate diagonal.
+    reflex = [area2(xs, ys, prv[i], i, nxt[i]) <= 0 for i in range(n)]
+    grid = ReflexGrid(xs, ys, [i for i in range(n) if reflex[i]])
+
+    def isEar(v):
+        if reflex[v]:
+            return False
+        return not grid.anyInTriangle(prv[v], v, nxt[v])
+
+    ear = [isEar(i) for i in range(n)]
+
+    # Each step of the outer loop clips off one ear:
+    v2 = 0
+    while n > 3:
+        start = v2
+        while not ear[v2]:
+            v2 = nxt[v2]
+            if v2 == start:
+                return returnlist
+
+        v1 = prv[v2]
+        v3 = nxt[v2]
+        returnlist.append((v1, v2, v3))
+
+        # Cut off the ear v2:
+        nxt[v1] = v3
+        prv[v3] = v1
+        n -= 1
+
+        # The neighbours may have stopped being reflex; update their status
+        # and their ear flags:
+        for v in (v1, v3):
+            if reflex[v] and area2(xs, ys, prv[v], v, nxt[v]) > 0:
+                reflex[v] = False
+                grid.remove(v)
+        ear[v1] = isEar(v1)
+        ear[v3] = isEar(v3)
+        v2 = v3
+
+    v1 = prv[v2]
+    v3 = nxt[v2]
+    returnlist.append((v1, v2, v3))
+    return returnlist
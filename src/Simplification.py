@@ -0,0 +1,256 @@
+'''
+Created on Oct 18, 2026
+
+Simplification of oversampled polygons before they are triangulated. Every
+vertex removed here is one less triangle to find, and the ear clipping
+engines slow down much faster than linearly with the number of vertices.
+
+Two methods are available:
+
+visvalingam: Visvalingam and Whyatt's method ("Line generalisation by
+    repeated elimination of points", 1993). The vertex whose triangle with
+    its two neighbours has the smallest area is removed, over and over, until
+    every triangle left has more than 'tolerance' area. The triangles are kept
+    in a heap, so this takes O(n log n) time. A vertex's area never drops
+    below that of a vertex removed before it, so the order of removal is the
+    order of importance.
+douglas-peucker: Douglas and Peucker's method. The ring is cut at its first
+    vertex and the vertex furthest from it, and each chain is split at its
+    vertex furthest from the chord between its ends, until no vertex is more
+    than 'tolerance' from its chord. This takes O(n log n) time on typical
+    outlines, and O(n^2) at worst.
+
+Either way, the result could intersect itself where the outline comes close
+to itself. With preserveTopology (the default), it can't:
+- visvalingam only removes a vertex when no other vertex lies in its triangle.
+  The ring is simple, so no edge can cross the triangle without having an end
+  inside it, and the new edge can't cross anything. The vertices are kept in
+  a ReflexEarClipping.ReflexGrid for this test.
+- douglas-peucker checks the result with Validation.findIntersections, and
+  puts back the furthest dropped vertex of each edge involved until the ring
+  is simple again.
+
+At least three vertices are always kept.
+'''
+from array import array
+import heapq
+
+from Polygon import Polygon, coordinatesLike
+
+
+VISVALINGAM = 'visvalingam'
+DOUGLAS_PEUCKER = 'douglas-peucker'
+METHODS = (VISVALINGAM, DOUGLAS_PEUCKER)
+
+
+'''
+Returns twice the area of the triangle (a, b, c), always positive or 0.
+'''
+def triangleArea2(xs, ys, a, b, c):
+    return abs((xs[b] - xs[a]) * (ys[c] - ys[a]) - (xs[c] - xs[a]) * (ys[b] - ys[a]))
+
+
+'''
+Returns the vertices of the ring (xs, ys) that Visvalingam-Whyatt keeps, in
+order.
+
+@param tolerance: Vertices whose triangle has at most this area are removed
+'''
+def visvalingam(xs, ys, tolerance, preserveTopology = True):
+    n = len(xs)
+    nxt = [(i + 1) % n for i in range(n)]
+    prv = [(i - 1) % n for i in range(n)]
+    area = [triangleArea2(xs, ys, prv[v], v, nxt[v]) for v in range(n)]
+    heap = [(area[v], v) for v in range(n)]
+    heapq.heapify(heap)
+    if preserveTopology:
+        from ReflexEarClipping import ReflexGrid
+        grid = ReflexGrid(xs, ys, range(n))
+    else:
+        grid = None
+    limit = 2 * tolerance
+    removed = [False] * n
+    left = n
+
+    while heap and left > 3:
+        a2, v = heapq.heappop(heap)
+        if removed[v] or a2 != area[v]:
+            continue                    # already removed, or updated since
+        if a2 > limit:
+            break
+        u = prv[v]
+        w = nxt[v]
+        if grid is not None:
+            # The triangle may be clockwise (v is a reflex vertex):
+            if ((xs[v] - xs[u]) * (ys[w] - ys[u]) - (xs[w] - xs[u]) * (ys[v] - ys[u]) >= 0):
+                blocked = grid.anyInTriangle(u, v, w)
+            else:
+                blocked = grid.anyInTriangle(w, v, u)
+            if blocked:
+                # Left in place; it's looked at again if a neighbour goes:
+                continue
+            grid.remove(v)
+
+        removed[v] = True
+        left -= 1
+        nxt[u] = w
+        prv[w] = u
+        # The neighbours' areas can't drop below the one just removed, so the
+        # removal order stays by importance:
+        for x in (u, w):
+            area[x] = max(triangleArea2(xs, ys, prv[x], x, nxt[x]), a2)
+            heapq.heappush(heap, (area[x], x))
+
+    return array('i', [v for v in range(n) if not removed[v]])
+
+
+'''
+Returns the index of the vertex strictly between a and b (going forwards
+around the ring) that is furthest from the line through a and b, and
+compares its distance with 'tolerance'.
+
+@return: The vertex (or -1 if there is none), and True if it is further than
+        'tolerance'
+'''
+def furthest(xs, ys, a, b, tolerance):
+    n = len(xs)
+    dx = xs[b] - xs[a]
+    dy = ys[b] - ys[a]
+    length2 = dx * dx + dy * dy
+    best = -1
+    bestDistance = -1
+    v = (a + 1) % n
+    while v != b:
+        if length2 == 0:
+            ex = xs[v] - xs[a]
+            ey = ys[v] - ys[a]
+            distance = ex * ex + ey * ey
+        else:
+            # Squared distance times length2, so integers stay exact:
+            cross = dx * (ys[v] - ys[a]) - dy * (xs[v] - xs[a])
+            distance = cross * cross
+        if distance > bestDistance:
+            best = v
+            bestDistance = distance
+        v = (v + 1) % n
+    if best == -1:
+        return -1, False
+    return best, bestDistance > tolerance * tolerance * (length2 or 1)
+
+
+'''
+Returns the vertices of the ring (xs, ys) that Douglas-Peucker keeps, in
+order.
+
+@param tolerance: The largest distance a dropped vertex may be from the
+       simplified ring
+'''
+def douglasPeucker(xs, ys, tolerance, preserveTopology = True):
+    n = len(xs)
+    ex = [(xs[v] - xs[0]) ** 2 + (ys[v] - ys[0]) ** 2 for v in range(n)]
+    far = ex.index(max(ex))
+    keep = [False] * n
+    keep[0] = True
+    keep[far] = True
+
+    # Split each chain until it's within the tolerance:
+    stack = [(0, far), (far, 0)]
+    while stack:
+        a, b = stack.pop()
+        v, split = furthest(xs, ys, a, b, tolerance)
+        if split:
+            keep[v] = True
+            stack.append((a, v))
+            stack.append((v, b))
+
+    kept = [v for v in range(n) if keep[v]]
+    if len(kept) < 3:
+        # Everything is within the tolerance of one line: keep the furthest
+        # vertex from it, so there is still a polygon:
+        candidates = [v for v in (furthest(xs, ys, 0, far, 0)[0], furthest(xs, ys, far, 0, 0)[0])
+                      if v != -1]
+        keep[max(candidates, key = lambda v: triangleArea2(xs, ys, 0, v, far))] = True
+        kept = [v for v in range(n) if keep[v]]
+
+    if preserveTopology:
+        import Validation
+    while preserveTopology:
+        pairs = Validation.findIntersections([xs[v] for v in kept], [ys[v] for v in kept],
+                                             limit = len(kept))
+        if not pairs:
+            break
+        for e, f in pairs:
+            for k in (e, f):
+                v = furthest(xs, ys, kept[k], kept[(k + 1) % len(kept)], 0)[0]
+                if v != -1:
+                    keep[v] = True
+        kept = [v for v in range(n) if keep[v]]
+
+    return array('i', kept)
+
+
+'''
+Simplifies the ring (xs, ys), which should be simple and free of duplicate
+points, as IOClass reads it.
+
+@param tolerance: An area for 'visvalingam', a distance for
+       'douglas-peucker'. 0 only removes vertices that lie on the line
+       through their neighbours.
+@param method: 'visvalingam' (the default) or 'douglas-peucker'
+@param preserveTopology: If True, the simplified ring is simple too
+@return: The indices of the vertices that are kept, in ring order, as an
+        array('i')
+'''
+def simplify(xs, ys, tolerance, method = VISVALINGAM, preserveTopology = True):
+    if method not in METHODS:
+        raise ValueError("Unknown simplification method: %s" % method)
+    if tolerance < 0:
+        raise ValueError("The tolerance can't be negative")
+    if len(xs) <= 3:
+        return array('i', range(len(xs)))
+    if method == VISVALINGAM:
+        return visvalingam(xs, ys, tolerance, preserveTopology)
+    return douglasPeucker(xs, ys, tolerance, preserveTopology)
+
+
+'''
+Same as simplify, for a Polygon. The vertices that are kept keep their
+names, so the triangles of the simplified Polygon refer to the vertices of
+the original one.
+
+@return: The simplified Polygon, and the number of vertices removed
+'''
+def simplifyPolygon(polygon, tolerance, method = VISVALINGAM, preserveTopology = True):
+    kept = simplify(polygon.xs, polygon.ys, tolerance, method, preserveTopology)
+    xs = coordinatesLike(polygon.xs, [polygon.xs[v] for v in kept])
+    ys = coordinatesLike(polygon.ys, [polygon.ys[v] for v in kept])
+    simplified = Polygon(xs, ys, [polygon.name(v) for v in kept])
+    return simplified, len(polygon) - len(kept)
+
+
+'''
+Same as simplify, for a linked-list of points as created by
+IOClass.createLinkedList. The points that are kept are linked up again in
+place. If the head is removed, the first point kept after it becomes the
+head.
+
+@return: The head of the list, its new size, and the number of points removed
+'''
+def simplifyLinkedList(head, tolerance, method = VISVALINGAM, preserveTopology = True):
+    points = []
+    cursor = head
+    while True:
+        points.append(cursor)
+        cursor = cursor.next
+        if cursor is head:
+            break
+
+    kept = simplify([p.x for p in points], [p.y for p in points], tolerance, method,
+                    preserveTopology)
+    head = points[kept[0]]
+    for k in range(len(kept)):
+        p1 = points[kept[k]]
+        p2 = points[kept[(k + 1) % len(kept)]]
+        p1.next = p2
+        p2.prev = p1
+    return head, len(kept), len(points) - len(kept)
@@ -0,0 +1,221 @@
+'''
+Created on Oct 18, 2026
+
+The sweep status of the plane sweeps in MonotoneTriangulation.py and
+Validation.py: the edges that cross the sweep line, in their order along it.
+
+A Python list kept in order with a binary search finds an edge in O(log n),
+but inserting or removing one moves every edge after it: O(n) per event, and
+O(n^2) for a whole sweep when O(n) edges cross the sweep line at once (the
+teeth of a comb). This is a treap instead (Seidel and Aragon, "Randomized
+search trees", 1996): a binary search tree whose nodes also carry random
+priorities, kept in heap order by rotations. Its expected depth is O(log n),
+so every operation below takes O(log n) expected time and a sweep over n
+vertices O(n log n).
+
+The order of the edges along the sweep line doesn't change while they are in
+the status (the edges of a simple polygon don't cross), but the key that
+orders them, such as their x-coordinate at the sweep line, does. So the tree
+stores no keys: search takes a test that says whether the place looked for
+comes after a given edge, edges are inserted at a position (before another
+edge) and removed by name. An edge is named after its first vertex, 0..n-1,
+so the nodes are entries in arrays indexed by edge.
+'''
+import random
+
+
+# No edge (an empty subtree, or the end of the status):
+NONE = -1
+
+
+class SweepStatus:
+
+    '''
+    @param n: The number of edges; they are named 0..n-1
+    @param seed: Seed for the priorities
+    '''
+    def __init__(self, n, seed = 0):
+        rng = random.Random(seed)
+        self.left = [NONE] * n
+        self.right = [NONE] * n
+        self.parent = [NONE] * n
+        self.priority = [rng.random() for i in range(n)]
+        self.root = NONE
+        self.count = 0
+
+
+    def __len__(self):
+        return self.count
+
+
+    '''
+    Returns the edges in the status, in order.
+    '''
+    def toList(self):
+        edges = []
+        e = self.first()
+        while e != NONE:
+            edges.append(e)
+            e = self.next(e)
+        return edges
+
+
+    '''
+    Returns the first edge e in the status for which after(e) is False, or
+    NONE if it is True for all of them. 'after' must be True for the edges up
+    to some point in the status and False for the rest, like the test of a
+    binary search.
+    '''
+    def search(self, after):
+        left = self.left
+        right = self.right
+        found = NONE
+        e = self.root
+        while e != NONE:
+            if after(e):
+                e = right[e]
+            else:
+                found = e
+                e = left[e]
+        return found
+
+
+    def first(self):
+        e = self.root
+        if e != NONE:
+            left = self.left
+            while left[e] != NONE:
+                e = left[e]
+        return e
+
+
+    def last(self):
+        e = self.root
+        if e != NONE:
+            right = self.right
+            while right[e] != NONE:
+                e = right[e]
+        return e
+
+
+    '''
+    Returns the edge after e in the status, or NONE if e is the last one.
+    '''
+    def next(self, e):
+        right = self.right
+        if right[e] != NONE:
+            e = right[e]
+            left = self.left
+            while left[e] != NONE:
+                e = left[e]
+            return e
+        parent = self.parent
+        while parent[e] != NONE and right[parent[e]] == e:
+            e = parent[e]
+        return parent[e]
+
+
+    '''
+    Returns the edge before e in the status, or NONE if e is the first one.
+    '''
+    def prev(self, e):
+        left = self.left
+        if left[e] != NONE:
+            e = left[e]
+            right = self.right
+            while right[e] != NONE:
+                e = right[e]
+            return e
+        parent = self.parent
+        while parent[e] != NONE and left[parent[e]] == e:
+            e = parent[e]
+        return parent[e]
+
+
+    '''
+    Inserts edge e just before the edge 'before', or at the end of the status
+    if 'before' is NONE. e must not be in the status already.
+    '''
+    def insert(self, e, before = NONE):
+        left = self.left
+        right = self.right
+        parent = self.parent
+        left[e] = NONE
+        right[e] = NONE
+        if self.root == NONE:
+            parent[e] = NONE
+            self.root = e
+        elif before == NONE:
+            p = self.last()
+            right[p] = e
+            parent[e] = p
+        elif left[before] == NONE:
+            left[before] = e
+            parent[e] = before
+        else:
+            # After the last edge of the left subtree of 'before':
+            p = left[before]
+            while right[p] != NONE:
+                p = right[p]
+            right[p] = e
+            parent[e] = p
+        self.count += 1
+
+        priority = self.priority
+        while parent[e] != NONE and priority[parent[e]] < priority[e]:
+            self.rotateUp(e)
+
+
+    '''
+    Removes edge e from the status.
+    '''
+    def remove(self, e):
+        left = self.left
+        right = self.right
+        parent = self.parent
+        priority = self.priority
+
+        # Rotate e down until it is a leaf, then cut it off:
+        while left[e] != NONE or right[e] != NONE:
+            if right[e] == NONE or (left[e] != NONE and priority[left[e]] > priority[right[e]]):
+                self.rotateUp(left[e])
+            else:
+                self.rotateUp(right[e])
+        p = parent[e]
+        if p == NONE:
+            self.root = NONE
+        elif left[p] == e:
+            left[p] = NONE
+        else:
+            right[p] = NONE
+        parent[e] = NONE
+        self.count -= 1
+
+
+    '''
+    Rotates edge x above its parent, keeping the order of the status.
+    '''
+    def rotateUp(self, x):
+        left = self.left
+        right = self.right
+        parent = self.parent
+        p = parent[x]
+        g = parent[p]
+        if left[p] == x:
+            b = right[x]
+            left[p] = b
+            right[x] = p
+        else:
+            b = left[x]
+            right[p] = b
+            left[x] = p
+        if b != NONE:
+            parent[b] = p
+        parent[p] = x
+        parent[x] = g
+        if g == NONE:
+            self.root = x
+        elif left[g] == p:
+            left[g] = x
+        else:
+            right[g] = x
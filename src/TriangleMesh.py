@@ -0,0 +1,226 @@
+'''
+Created on Oct 18, 2026
+
+A compact result type for triangulations. Triangulation.Triangulate returns a
+list of [name, name, name] lists, which takes well over 100 bytes per
+triangle, and the names have to be looked up again to get at the vertices. A
+TriangleMesh keeps the triangles as one flat array('i') of 3t 0-based vertex
+indices (12 bytes per triangle) together with the Polygon they refer to:
+
+    mesh = Triangulation(polygon = p).TriangulateMesh()
+    mesh[k]                   # (a, b, c), the indices of triangle k
+    mesh.view()               # a t x 3 memoryview of int32, not a copy
+    mesh.numpyArray()         # a t x 3 NumPy int32 array, not a copy
+    mesh.areas()              # array('d') of the triangle areas
+    mesh.adjacency()          # array('i') of neighbouring triangles
+    mesh.toList()             # the name triples returned by Triangulate
+
+On Python 3.12 and later the mesh supports the buffer protocol itself, so
+memoryview(mesh) and numpy.asarray(mesh) work directly.
+
+The engines append the triangles to the mesh as they produce them (it has
+the append and extend methods of the 'out' argument of the engines), so the
+triangles are never held as tuples. The views share memory with the array,
+which can't grow while a view is held, so take them after the mesh is built.
+
+For a polygon with holes, the indices refer to the polygon the engine worked
+on (see Triangulation.holePolygon), in which the vertices at the ends of each
+bridge appear twice. Their names are those of the original vertices, so
+toList gives the same result as Triangulate.
+'''
+from array import array
+
+import BatchPredicates
+import TriangleOutput
+
+
+class TriangleMesh:
+
+    '''
+    @param polygon: The Polygon the indices refer to
+    @param indices: A flat sequence of 3t 0-based vertex indices, or None for
+           an empty mesh to append triangles to. An array('i') is used as it
+           is, not copied.
+    '''
+    def __init__(self, polygon, indices = None):
+        self.polygon = polygon
+        if indices is None:
+            indices = array('i')
+        elif not (isinstance(indices, array) and indices.typecode == 'i'):
+            indices = array('i', indices)
+        if len(indices) % 3 != 0:
+            raise ValueError("The number of indices must be a multiple of 3")
+        self.indices = indices
+
+
+    def append(self, triangle):
+        self.indices.extend(triangle)
+
+
+    def extend(self, triangles):
+        if isinstance(triangles, TriangleMesh):
+            self.indices.extend(triangles.indices)
+        elif isinstance(triangles, array):
+            self.indices.extend(triangles)
+        else:
+            for t in triangles:
+                self.indices.extend(t)
+
+
+    def __len__(self):
+        return len(self.indices) // 3
+
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("Triangle index out of range")
+        flat = self.indices
+        return flat[3 * k], flat[3 * k + 1], flat[3 * k + 2]
+
+
+    def __iter__(self):
+        flat = self.indices
+        for k in range(0, len(flat), 3):
+            yield flat[k], flat[k + 1], flat[k + 2]
+
+
+    '''
+    Returns the size of the index array in bytes.
+    '''
+    def nbytes(self):
+        return len(self.indices) * self.indices.itemsize
+
+
+    '''
+    Returns the indices as a t x 3 memoryview of int32 (format 'i'), without
+    copying them.
+    '''
+    def view(self):
+        return memoryview(self.indices).cast('B').cast('i', (len(self), 3))
+
+
+    def __buffer__(self, flags):
+        return self.view()
+
+
+    '''
+    Returns the indices as a t x 3 NumPy int32 array that shares memory with
+    the mesh. NumPy must be installed.
+    '''
+    def numpyArray(self):
+        numpy = BatchPredicates.loadNumpy()
+        if numpy is None:
+            raise ImportError("NumPy is not installed")
+        return numpy.frombuffer(self.indices, dtype = numpy.intc).reshape(len(self), 3)
+
+
+    '''
+    Returns the area of each triangle (always positive) as an array('d').
+    '''
+    def areas(self):
+        xs = self.polygon.xs
+        ys = self.polygon.ys
+        flat = self.indices
+        if BatchPredicates.useBatch(len(self), xs, ys):
+            x, y = BatchPredicates.coordinates(self.polygon)
+            t = self.numpyArray()
+            a = t[:, 0]
+            b = t[:, 1]
+            c = t[:, 2]
+            area = abs(BatchPredicates.area2(x[a], y[a], x[b], y[b], x[c], y[c])) / 2.0
+            result = array('d')
+            result.frombytes(area.astype(BatchPredicates.numpy.float64).tobytes())
+            return result
+
+        result = array('d', [0.0]) * len(self)
+        for k in range(len(self)):
+            a = flat[3 * k]
+            b = flat[3 * k + 1]
+            c = flat[3 * k + 2]
+            result[k] = abs((xs[b] - xs[a]) * (ys[c] - ys[a]) -
+                            (xs[c] - xs[a]) * (ys[b] - ys[a])) / 2.0
+        return result
+
+
+    '''
+    Returns the neighbours of the triangles as a flat array('i') laid out like
+    the indices: entry 3k+e is the triangle on the other side of edge e of
+    triangle k, the edge from its vertex e to its vertex (e+1)%3, or -1 if
+    that edge is on the boundary of the polygon.
+    '''
+    def adjacency(self):
+        flat = self.indices
+        count = len(flat)
+        if BatchPredicates.useBatch(count):
+            numpy = BatchPredicates.numpy
+            t = self.numpyArray()
+            a = t.ravel()
+            b = numpy.roll(t, -1, axis = 1).ravel()
+            key = (numpy.minimum(a, b).astype(numpy.int64) * len(self.polygon) +
+                   numpy.maximum(a, b))
+            order = numpy.argsort(key, kind = 'stable')
+            shared = numpy.flatnonzero(key[order][1:] == key[order][:-1])
+            first = order[shared]
+            second = order[shared + 1]
+            neighbours = numpy.full(count, -1, dtype = numpy.intc)
+            neighbours[first] = second // 3
+            neighbours[second] = first // 3
+            result = array('i')
+            result.frombytes(neighbours.tobytes())
+            return result
+
+        neighbours = array('i', [-1]) * count
+        edges = {}
+        for slot in range(count):
+            a = flat[slot]
+            b = flat[slot + 1 if slot % 3 != 2 else slot - 2]
+            key = (a, b) if a < b else (b, a)
+            other = edges.pop(key, None)
+            if other is None:
+                edges[key] = slot
+            else:
+                neighbours[slot] = other // 3
+                neighbours[other] = slot // 3
+        return neighbours
+
+
+    '''
+    Returns the triangles in the form returned by Triangulation.Triangulate:
+    a list of [v1, v2, v3] vertex names.
+    '''
+    def toList(self):
+        names = self.polygon.names
+        if names is None:
+            names = [str(i + 1) for i in range(len(self.polygon))]
+        flat = self.indices
+        return [[names[flat[k]], names[flat[k + 1]], names[flat[k + 2]]]
+                for k in range(0, len(flat), 3)]
+
+
+    '''
+    Returns the triangles as a list of (a, b, c) index triples, the form the
+    engines return.
+    '''
+    def toTriples(self):
+        return list(self)
+
+
+'''
+Builds a TriangleMesh from triangles in any of the forms that
+TriangleOutput.flatIndices accepts, such as the name triples returned by
+Triangulation.Triangulate.
+'''
+def fromTriangles(polygon, triangles):
+    return TriangleMesh(polygon, TriangleOutput.flatIndices(triangles, polygon))
+
+
+'''
+Returns 'triangles' in the form returned by Triangulation.Triangulate: a
+TriangleMesh is converted with toList, anything else is returned as it is.
+'''
+def toList(triangles):
+    if isinstance(triangles, TriangleMesh):
+        return triangles.toList()
+    return triangles
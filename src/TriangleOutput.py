@@ -0,0 +1,349 @@
+'''
+Created on Oct 18, 2026
+
+Buffered writers for triangulation results. Instead of one write call per
+triangle, the triangles are formatted a chunk at a time (CHUNK triangles) and
+each chunk is written with a single call. Three formats are supported:
+
+text: the format printed by IOClass.printTrianglesToConsole: the number of
+      triangles, then one [a,b,c] line of vertex names per triangle
+obj:  Wavefront OBJ: a "v x y 0" line per vertex, then an "f a b c" line per
+      triangle, with 1-based vertex indices
+ply:  binary little-endian PLY, with x, y and z (always 0) as doubles per
+      vertex, and a list of three int indices per face
+
+The writers take a file name or an open stream (a binary stream for PLY), and
+the triangles in any of these forms:
+- the name triples returned by Triangulation.Triangulate
+- a list of 0-based index triples, as returned by the engines
+- a flat sequence of 3t 0-based indices, such as an array('i'), or a
+  BinaryFile.triangles memoryview
+- a TriangleMesh
+
+TriangleWriter does the same work incrementally: the engines can append the
+triangles to it as they produce them (see Triangulation.TriangulateTo), so
+the output is written while the triangulation is still running and the whole
+triangle list is never held in memory.
+'''
+from array import array
+import struct
+import sys
+
+
+FORMATS = ('text', 'obj', 'ply')
+
+# Number of triangles (or vertices) formatted and written at a time:
+CHUNK = 1 << 16
+
+PLY_FACE = '<B3i'
+
+
+'''
+Opens 'target' for writing unless it is already a stream.
+
+@return: The stream, and True if it was opened here (and must be closed)
+'''
+def openTarget(target, binary):
+    if hasattr(target, 'write'):
+        return target, False
+    return open(target, 'wb' if binary else 'w'), True
+
+
+'''
+Returns the vertex names of a Polygon as a list.
+'''
+def vertexNames(polygon):
+    if polygon.names is not None:
+        return polygon.names
+    return [str(i + 1) for i in range(len(polygon))]
+
+
+'''
+Returns True if 'triangles' is a flat sequence of indices rather than a list
+of triples.
+'''
+def isFlat(triangles):
+    if isinstance(triangles, (array, memoryview)):
+        return True
+    return hasattr(triangles, 'ndim') and triangles.ndim == 1
+
+
+'''
+Converts the triangles to a flat array('i') of 0-based vertex indices. Name
+triples are looked up in the vertex names of 'polygon'.
+'''
+def flatIndices(triangles, polygon = None):
+    # A TriangleMesh holds them already:
+    if isinstance(getattr(triangles, 'indices', None), array):
+        return triangles.indices
+    if isFlat(triangles):
+        if isinstance(triangles, array) and triangles.typecode == 'i':
+            return triangles
+        if isinstance(triangles, memoryview) and triangles.ndim > 1:
+            triangles = triangles.cast('B').cast(triangles.format)
+        return array('i', triangles)
+
+    flat = array('i')
+    if len(triangles) == 0:
+        return flat
+    if isinstance(triangles[0][0], str):
+        if polygon is None:
+            raise ValueError("A polygon is needed to look up the vertex names")
+        names = vertexNames(polygon)
+        indexOf = {}
+        for i in range(len(names)):
+            indexOf[names[i]] = i
+        for t in triangles:
+            flat.extend((indexOf[t[0]], indexOf[t[1]], indexOf[t[2]]))
+    else:
+        for t in triangles:
+            flat.extend(t)
+    return flat
+
+
+'''
+Formats triangles start to stop-1 of the flat index array in the text format,
+each one on a new line.
+'''
+def textChunk(names, flat, start, stop):
+    return ''.join(['\n[%s,%s,%s]' % (names[flat[k]], names[flat[k + 1]], names[flat[k + 2]])
+                    for k in range(3 * start, 3 * stop, 3)])
+
+
+def objChunk(flat, start, stop, base = 0):
+    base += 1
+    return ''.join(['f %d %d %d\n' % (flat[k] + base, flat[k + 1] + base, flat[k + 2] + base)
+                    for k in range(3 * start, 3 * stop, 3)])
+
+
+def plyChunk(flat, start, stop):
+    count = stop - start
+    values = [3] * (4 * count)
+    values[1::4] = flat[3 * start:3 * stop:3]
+    values[2::4] = flat[3 * start + 1:3 * stop:3]
+    values[3::4] = flat[3 * start + 2:3 * stop:3]
+    return struct.pack('<' + PLY_FACE[1:] * count, *values)
+
+
+'''
+Returns the OBJ vertex lines of a polygon, a chunk at a time.
+'''
+def objVertices(polygon):
+    xs = polygon.xs
+    ys = polygon.ys
+    for start in range(0, len(xs), CHUNK):
+        stop = min(start + CHUNK, len(xs))
+        yield ''.join(['v %r %r 0\n' % (xs[i], ys[i]) for i in range(start, stop)])
+
+
+def plyHeader(n, t):
+    return ('ply\nformat binary_little_endian 1.0\n'
+            'element vertex %d\nproperty double x\nproperty double y\nproperty double z\n'
+            'element face %d\nproperty list uchar int vertex_indices\nend_header\n'
+            % (n, t)).encode('ascii')
+
+
+'''
+Returns the PLY vertex block of a polygon: x, y, 0 as little-endian doubles.
+'''
+def plyVertices(polygon):
+    n = len(polygon)
+    block = array('d', bytes(24 * n))
+    block[0::3] = array('d', polygon.xs)
+    block[1::3] = array('d', polygon.ys)
+    if sys.byteorder == 'big':
+        block.byteswap()
+    return block.tobytes()
+
+
+'''
+Writes triangles in the text format of printTrianglesToConsole.
+
+@param target: A file name or a text stream
+@param triangles: Name triples, index triples or a flat index array
+@param polygon: The Polygon the indices refer to, for their names. Without
+       it, vertex i is named str(i + 1).
+'''
+def writeText(target, triangles, polygon = None):
+    stream, opened = openTarget(target, False)
+    try:
+        if not isFlat(triangles) and len(triangles) > 0 and isinstance(triangles[0][0], str):
+            # Name triples are written as they are:
+            stream.write('%d' % len(triangles))
+            for start in range(0, len(triangles), CHUNK):
+                stream.write(''.join(['\n[%s,%s,%s]' % (t[0], t[1], t[2])
+                                      for t in triangles[start:start + CHUNK]]))
+            return
+
+        flat = flatIndices(triangles)
+        t = len(flat) // 3
+        if polygon is not None:
+            names = vertexNames(polygon)
+        else:
+            names = [str(i + 1) for i in range(max(flat) + 1 if t else 0)]
+        stream.write('%d' % t)
+        for start in range(0, t, CHUNK):
+            stream.write(textChunk(names, flat, start, min(start + CHUNK, t)))
+    finally:
+        if opened:
+            stream.close()
+
+
+'''
+Writes a polygon and its triangles as a Wavefront OBJ file.
+
+@param target: A file name or a text stream
+@param polygon: The Polygon the triangles refer to
+@param triangles: Name triples, index triples or a flat index array
+@param base: The number of vertices already written to the file, when
+       several polygons go into one OBJ file
+'''
+def writeOBJ(target, polygon, triangles, base = 0):
+    flat = flatIndices(triangles, polygon)
+    t = len(flat) // 3
+    stream, opened = openTarget(target, False)
+    try:
+        for text in objVertices(polygon):
+            stream.write(text)
+        for start in range(0, t, CHUNK):
+            stream.write(objChunk(flat, start, min(start + CHUNK, t), base))
+    finally:
+        if opened:
+            stream.close()
+
+
+'''
+Writes a polygon and its triangles as a binary PLY file.
+
+@param target: A file name or a binary stream
+@param polygon: The Polygon the triangles refer to
+@param triangles: Name triples, index triples or a flat index array
+'''
+def writePLY(target, polygon, triangles):
+    flat = flatIndices(triangles, polygon)
+    t = len(flat) // 3
+    stream, opened = openTarget(target, True)
+    try:
+        stream.write(plyHeader(len(polygon), t))
+        stream.write(plyVertices(polygon))
+        for start in range(0, t, CHUNK):
+            stream.write(plyChunk(flat, start, min(start + CHUNK, t)))
+    finally:
+        if opened:
+            stream.close()
+
+
+'''
+Writes triangles in the given format ('text', 'obj' or 'ply').
+'''
+def write(target, polygon, triangles, format = 'text'):
+    if format == 'text':
+        writeText(target, triangles, polygon)
+    elif format == 'obj':
+        writeOBJ(target, polygon, triangles)
+    elif format == 'ply':
+        writePLY(target, polygon, triangles)
+    else:
+        raise ValueError("Unknown output format: %s" % format)
+
+
+'''
+Writes triangles as they are produced. The engines treat it like the list
+they would otherwise return: triangles (0-based index triples into
+'polygon') are added with append or extend, and written out a chunk at a
+time.
+
+The text and PLY formats start with the number of triangles, so it has to be
+known in advance: by default it's len(polygon) - 2, the size of every
+triangulation of a simple polygon. close() raises a ValueError if a
+different number of triangles was written, since the header is wrong then.
+
+@param target: A file name or a stream (binary for PLY)
+@param polygon: The Polygon the indices refer to
+@param format: 'text', 'obj' or 'ply'
+@param count: The number of triangles that will be written
+'''
+class TriangleWriter:
+
+    def __init__(self, target, polygon, format = 'text', count = None):
+        if format not in FORMATS:
+            raise ValueError("Unknown output format: %s" % format)
+        self.polygon = polygon
+        self.format = format
+        self.count = count if count is not None else max(len(polygon) - 2, 0)
+        self.written = 0
+        self.pending = array('i')
+        self.names = vertexNames(polygon) if format == 'text' else None
+        self.stream, self.opened = openTarget(target, format == 'ply')
+
+        if format == 'text':
+            self.stream.write('%d' % self.count)
+        elif format == 'obj':
+            for text in objVertices(polygon):
+                self.stream.write(text)
+        else:
+            self.stream.write(plyHeader(len(polygon), self.count))
+            self.stream.write(plyVertices(polygon))
+
+
+    def append(self, triangle):
+        self.pending.extend(triangle)
+        if len(self.pending) >= 3 * CHUNK:
+            self.flush()
+
+
+    def extend(self, triangles):
+        if isFlat(triangles):
+            self.pending.extend(triangles)
+        else:
+            for t in triangles:
+                self.pending.extend(t)
+        if len(self.pending) >= 3 * CHUNK:
+            self.flush()
+
+
+    def __len__(self):
+        return self.written + len(self.pending) // 3
+
+
+    '''
+    Writes out the pending triangles.
+    '''
+    def flush(self):
+        flat = self.pending
+        t = len(flat) // 3
+        if t == 0:
+            return
+        if self.format == 'text':
+            self.stream.write(textChunk(self.names, flat, 0, t))
+        elif self.format == 'obj':
+            self.stream.write(objChunk(flat, 0, t))
+        else:
+            self.stream.write(plyChunk(flat, 0, t))
+        self.written += t
+        self.pending = array('i')
+
+
+    '''
+    Writes out the pending triangles and closes the target (if it was opened
+    here). With check=True, the number of triangles is checked as well.
+    '''
+    def close(self, check = True):
+        try:
+            self.flush()
+        finally:
+            if self.opened:
+                self.stream.close()
+            else:
+                self.stream.flush()
+        if check and self.format != 'obj' and self.written != self.count:
+            raise ValueError("Expected %d triangles, but %d were written" % (self.count, self.written))
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, kind, value, traceback):
+        # Don't hide an exception from the with block behind a count error:
+        self.close(kind is None)
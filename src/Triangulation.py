@@ -6,28 +6,147 @@ This class represents a Triangulation object. The methods in this class can be
 used to take a polygon and triangulate it. There are also methods for drawing the
 polygon and/or triangulations on a Tkinter canvas.
 
-Triangulation objects have two instance variables: HEAD and SIZE
+Triangulation objects have six main instance variables: HEAD, SIZE, ENGINE,
+POLYGON, RESULTS and HOLES
 
 HEAD is the reference to the head node of a polygon. The polygon should be a
 circularly-linked list of Point objects, representing the vertices in CCW order.
 
 SIZE is the number of nodes in the linked list.
 
+ENGINE selects the algorithm used by Triangulate: 'earclip' (the default) is
+O'Rourke's ear clipping, 'monotone' splits the polygon into y-monotone pieces
+first (see MonotoneTriangulation.py), which is O(n log n), and 'reflex' is ear
+clipping that only tests ears against an index of the reflex vertices (see
+ReflexEarClipping.py).
+
+POLYGON is an optional array-backed Polygon object. If it is set, it is used
+instead of HEAD and SIZE for triangulating, scaling and drawing, and no Point
+objects are created at all.
+
+RESULTS is an optional TriangulationCache. If it is set, Triangulate looks the
+polygon up in it first, and stores the triangles it finds there.
+
+HOLES is an optional list of Polygon objects, one per hole of the polygon.
+With holes, the ear clipping engines triangulate the single ring made by
+bridging the holes into the outer ring (see Holes.py), and the monotone
+engine sweeps all the rings at once. The vertices of the holes are named
+after those of the outer ring, as if all the rings had been read from one
+file (see Holes.ringNames).
+
+Calling instrument() makes Triangulate count predicate calls and time its
+phases in a TriangulationStats object (see Instrumentation.py), STATS, and
+optionally hand it to a callback after every call.
+
 The mathematical functions for performing the triangulation (such as Left, 
 LeftOn, Intersect, IntersectProp, etc. ) are adapted from the textbook 
 'Computational Geometry in C' by O'Rourke. These functions in my project are 
 translations of the the author's C code into Python.
 
+Tkinter is only imported by the drawing functions that need it (see
+loadTkinter), so the module works without a display. In the same way, the
+other engines, holes, validation, instrumentation, the result types and the
+renderers are imported by the methods that use them, so a plain command line
+run only loads the ear clipping code (and NumPy only for a large polygon, see
+BatchPredicates.py).
 '''
-import Tkinter
+import time
 from Point import Point
-import IOClass
+from Polygon import Polygon, fan
+from Predicates import orient
+from ViewTransform import ViewTransform
+
+# Names of the available triangulation engines:
+EARCLIP = 'earclip'
+MONOTONE = 'monotone'
+REFLEX = 'reflex'
+ENGINES = (EARCLIP, MONOTONE, REFLEX)
+
+
+'''
+Imports and returns the Tkinter module, the first time something is drawn on
+a canvas. Python 3 calls it 'tkinter'.
+'''
+def loadTkinter():
+    try:
+        import Tkinter
+    except ImportError:
+        import tkinter as Tkinter
+    return Tkinter
+
+
 class Triangulation:
 
 
-    def __init__(self, head = None, size = 0):
+    def __init__(self, head = None, size = 0, engine = EARCLIP, polygon = None,
+                 results = None, holes = None):
+        if engine not in ENGINES:
+            raise ValueError("Unknown triangulation engine: %s" % engine)
         self.HEAD = head
         self.SIZE = size
+        self.ENGINE = engine
+        self.POLYGON = polygon
+        self.RESULTS = results
+        self.HOLES = holes
+        
+        # Instrumentation, off by default (see instrument):
+        self.STATS = None
+        self.CALLBACK = None
+        
+        # Array copy of the linked list and its ear flags (see Triangulate):
+        self.CACHE = None
+        
+        
+    '''
+    Returns the vertices of the polygon as a list of (x, y, name) tuples, in
+    CCW order, from whichever representation is being used. If there are
+    holes, their vertices follow those of the outer ring (see ringSizes).
+    '''
+    def vertexList(self):
+        vertices = []
+        if self.HOLES:
+            import Holes
+            outer = self.outerPolygon()
+            names = Holes.ringNames(outer, self.HOLES)
+            for p in [outer] + list(self.HOLES):
+                for i in range(len(p.xs)):
+                    vertices.append((p.xs[i], p.ys[i], names[len(vertices)]))
+            return vertices
+
+        if self.POLYGON is not None:
+            p = self.POLYGON
+            for i in range(len(p.xs)):
+                vertices.append((p.xs[i], p.ys[i], p.name(i)))
+            return vertices
+
+        cursor = self.HEAD
+        while True:
+            vertices.append((cursor.x, cursor.y, cursor.name))
+            cursor = cursor.next
+            if cursor is self.HEAD:
+                break
+        return vertices
+
+
+    '''
+    Returns the number of vertices in each ring of vertexList: the outer ring,
+    then each hole.
+    '''
+    def ringSizes(self):
+        sizes = [len(self.outerPolygon())]
+        if self.HOLES:
+            sizes.extend([len(h) for h in self.HOLES])
+        return sizes
+
+
+    '''
+    Returns the outer ring as a Polygon: POLYGON, or the array copy of the
+    linked list.
+    '''
+    def outerPolygon(self):
+        if self.POLYGON is not None:
+            return self.POLYGON
+        return self.ringPolygon()
         
         
     '''
@@ -84,33 +203,27 @@ class Triangulation:
     Adapted from O'Rourke. This is another convenient function that returns 1,
     -1 or 0 depending on whether the area of the triangle a,b,c is positive,
     negative or zero, respectively.
+    
+    The sign is always exact: integer coordinates are computed without any
+    rounding, and float coordinates are checked against an error bound (see
+    Predicates.py). The predicates below call orient directly.
     '''
     def AreaSign(self, a, b, c):
-        # Multiplication by 1.0 is to force conversion to float
-        a1 = (b.x - a.x) * 1.0 * (c.y - a.y)
-        a2 = (c.x - a.x) * 1.0 * (b.y - a.y)
-
-        area2 = a1 - a2
-
-        if area2 > 0.5:
-            return 1
-        if area2 < -0.5:
-            return -1
-        return 0
+        return orient(a.x, a.y, b.x, b.y, c.x, c.y)
 
 
     '''
     Adapted from O'Rourke.
     '''
     def Left(self, a,b,c):
-        return self.AreaSign(a,b,c) > 0
+        return orient(a.x, a.y, b.x, b.y, c.x, c.y) > 0
 
 
     '''
     Adapted from O'Rourke.
     '''
     def LeftOn(self, a,b,c):
-        return self.AreaSign(a,b,c) >= 0
+        return orient(a.x, a.y, b.x, b.y, c.x, c.y) >= 0
 
 
     '''
@@ -118,7 +231,7 @@ class Triangulation:
     a quick area calculation of the triangle a,b,c.
     '''
     def Collinear(self, a,b,c):
-        return self.AreaSign(a,b,c) == 0
+        return orient(a.x, a.y, b.x, b.y, c.x, c.y) == 0
 
 
     '''
@@ -127,7 +240,7 @@ class Triangulation:
     ranges.
     '''
     def Between(self, a, b, c):
-        if not self.Collinear(a, b, c):
+        if orient(a.x, a.y, b.x, b.y, c.x, c.y) != 0:
             return False
 
         if a.x != b.x:
@@ -177,10 +290,15 @@ class Triangulation:
     not considered a proper intersection.
     '''
     def IntersectProp(self, a, b, c, d):
-        if self.Collinear(a,b,c) or self.Collinear(a,b,d) or self.Collinear(c,d,a) or self.Collinear(c,d,b):
+        # Each orientation is computed once, and used for both tests:
+        abc = orient(a.x, a.y, b.x, b.y, c.x, c.y)
+        abd = orient(a.x, a.y, b.x, b.y, d.x, d.y)
+        cda = orient(c.x, c.y, d.x, d.y, a.x, a.y)
+        cdb = orient(c.x, c.y, d.x, d.y, b.x, b.y)
+        if abc == 0 or abd == 0 or cda == 0 or cdb == 0:
             return False
 
-        return self.Xor(self.Left(a,b,c), self.Left(a,b,d)) and self.Xor(self.Left(c,d,a) , self.Left(c,d,b))
+        return self.Xor(abc > 0, abd > 0) and self.Xor(cda > 0, cdb > 0)
 
 
     '''
@@ -194,10 +312,12 @@ class Triangulation:
         a1 = a.next
         a0 = a.prev
 
-        if self.LeftOn(a, a1, a0):
-            return self.Left(a,b,a0) and self.Left(b,a,a1)
+        if orient(a.x, a.y, a1.x, a1.y, a0.x, a0.y) >= 0:
+            return (orient(a.x, a.y, b.x, b.y, a0.x, a0.y) > 0 and
+                    orient(b.x, b.y, a.x, a.y, a1.x, a1.y) > 0)
         else:
-            return not (self.LeftOn(a,b,a1) and self.Left(b,a,a0))
+            return not (orient(a.x, a.y, b.x, b.y, a1.x, a1.y) >= 0 and
+                        orient(b.x, b.y, a.x, a.y, a0.x, a0.y) > 0)
 
 
     '''
@@ -208,33 +328,17 @@ class Triangulation:
             b, HEAD)
 
 
-
     '''
-    Adapted from O'Rourke. This function must be called initially before the 
-    triangulation is performed, because the ear status of each vertex must be
-    initialized before triangulation can take place.
-    '''
-    def EarInit(self, HEAD):
-        v0 = None
-        v1 = None
-        v2 = None
-
-        v1 = HEAD
-        while True:
-            v2 = v1.next
-            v0 = v1.prev
-            v1.ear = self.Diagonal(v0, v2, HEAD)
-            v1 = v1.next
-
-            if v1 is HEAD:
-                break
-
-    '''
-    This is the actual triangulation function, which makes use of all the helper
-    functions defined above. Note that since the linked list will be
-    destroyed during the triangulation process (since the polygon's ears are
-    clipped off), a new linked list is created so that the original linked 
-    list is preserved.
+    This is the actual triangulation function. The ear clipping follows the
+    same steps as O'Rourke's Triangulate, but it runs on an array copy of the
+    linked list (see Polygon.earClip), so the linked list itself is never
+    modified.
+    
+    The array copy and its ear flags are cached on this object, so calling
+    Triangulate again on the same polygon only costs an O(n) check of the
+    linked list (see ringPolygon) and the clipping. A Point whose coordinates
+    have changed is found by that check; invalidate(point) updates the ear
+    flags around it right away instead.
     
     @return: A list of 3-tuples. Each 3-tuple is of the form [v1, v2, v3], 
             which represents a triangle. All of these tuples, taken together,
@@ -243,70 +347,327 @@ class Triangulation:
     Note that the return value can be modified easily so that some other values 
     of the polygon can be returned instead - for example, the coordinates of 
     the triangles or the Point objects themselves.
+    
+    If ENGINE is 'monotone' or 'reflex', the work is handed off to
+    MonotoneTriangulation or ReflexEarClipping, which return a list in the
+    same format.
+    
+    Whatever the engine, the polygon is classified first (see
+    Polygon.classify): a clockwise polygon is triangulated as its CCW reverse,
+    and a strictly convex polygon is simply cut into a fan of triangles.
+    
+    If instrumentation is on (see instrument), STATS describes this call when
+    it returns.
+    
+    If there are holes, the triangles can refer to the vertices of the holes
+    as well (see vertexList for their names).
     '''
     def Triangulate(self):
-        v0 = None
-        v1 = None
-        v2 = None
-        v3 = None
-        v4 = None
-        earfound = False
-        returnlist = []
-
-        self.EarInit(self.HEAD)
-        # Create a clone of the linked list just before starting the 
-        # triangulation process:
-        HEAD, n = self.cloneLinkedList()
-        
-        # Each step of the outer loop clips off one ear
-        while n > 3:
-            v2 = HEAD
-            earfound = False
-            while True:
-                if v2.ear:
-                    earfound = True
-                    # Ear found
-                    v3 = v2.next
-                    v4 = v3.next
-                    v1 = v2.prev
-                    v0 = v1.prev
-
-
-                    # v1,v3 is a diagonal
-                    tri = [v1.name, v2.name, v3.name]
-                    returnlist.append(tri)
-
-                    # Update the ear status of the diagonal endpoints:
-                    v1.ear = self.Diagonal(v0, v3, HEAD)
-                    v3.ear = self.Diagonal(v1, v4, HEAD)
-
-                    # Cut off the ear v2:
-                    v1.next = v3
-                    v3.prev = v1
-                    HEAD = v3
-                    n -= 1
-                    
-                    
-                    if n == 3:
-                        # the polygon has been reduced down to 3 vertices, so
-                        # output that as the last triangulation and return:
-                        v2 = HEAD
-                        v1 = v2.prev
-                        v3 = v2.next
-                        tri = [v1.name, v2.name, v3.name]
-                        returnlist.append(tri)
-                        return returnlist
-                    
-                    
-                    break
-                v2 = v2.next
-                if v2 is HEAD:
+        if self.STATS is not None:
+            return self.TriangulateInstrumented()
+        if self.HOLES:
+            return self.TriangulatePolygon(self.holePolygon())
+        if self.POLYGON is not None:
+            return self.TriangulatePolygon(self.POLYGON)
+        return self.TriangulatePolygon(self.ringPolygon())
+
+
+    '''
+    Same as Triangulate, with the predicate calls counted and the phases timed
+    in STATS (the ear clipping engine is given STATS, see Polygon.earClip).
+    The engines always run on the array copy here, so that the phases are the
+    same for every engine.
+    '''
+    def TriangulateInstrumented(self):
+        stats = self.STATS
+        stats.reset()
+        start = time.perf_counter()
+        p = self.POLYGON
+        if p is None:
+            p = stats.time('copy', self.ringPolygon)
+        if self.HOLES:
+            p = stats.time('holes', self.holePolygon)
+        triangles = self.TriangulatePolygon(p)
+        stats.phases['total'] = time.perf_counter() - start
+        if self.CALLBACK is not None:
+            self.CALLBACK(stats)
+        return triangles
+
+
+    '''
+    Switches instrumentation on or off. When it is on, STATS holds a
+    TriangulationStats object that describes the last call to Triangulate.
+    
+    @param callback: A function that is called with STATS after every call to
+           Triangulate, e.g. to send the numbers to a metrics system
+    @return: The TriangulationStats object, or None if instrumentation was
+            switched off
+    '''
+    def instrument(self, enabled = True, callback = None):
+        if enabled:
+            import Instrumentation
+            self.STATS = Instrumentation.TriangulationStats()
+            self.CALLBACK = callback
+        else:
+            self.STATS = None
+            self.CALLBACK = None
+        return self.STATS
+
+
+    '''
+    Calls function(*args), timing it as phase 'name' if instrumentation is on.
+    '''
+    def phase(self, name, function, *args):
+        if self.STATS is None:
+            return function(*args)
+        return self.STATS.time(name, function, *args)
+
+
+    '''
+    Returns the cached array copy of the linked list that starts at HEAD,
+    creating it if there is none yet. The linked list is compared with the
+    copy in one O(n) pass first: Points whose coordinates have changed are
+    moved in the copy (see Polygon.moveVertex), and if HEAD, the order of the
+    Points or their names have changed, the copy is made again.
+    '''
+    def ringPolygon(self):
+        if self.CACHE is not None and self.CACHE[0] is self.HEAD:
+            head, polygon, index, names = self.CACHE
+            xs = polygon.xs
+            ys = polygon.ys
+            n = len(polygon)
+            moved = []
+            cursor = head
+            i = 0
+            while i < n and index.get(cursor) == i and cursor.name == names[i]:
+                if cursor.x != xs[i] or cursor.y != ys[i]:
+                    moved.append(cursor)
+                cursor = cursor.next
+                i += 1
+                if cursor is head:
                     break
+            if i == n and cursor is head:
+                try:
+                    for point in moved:
+                        polygon.moveVertex(index[point], point.x, point.y)
+                    return polygon
+                except (TypeError, OverflowError):
+                    pass                # the new coordinates don't fit the arrays
+
+        polygon = Polygon.fromLinkedList(self.HEAD)
+        index = {}
+        names = []
+        cursor = self.HEAD
+        for i in range(len(polygon)):
+            index[cursor] = i
+            names.append(cursor.name)
+            cursor = cursor.next
+        self.CACHE = (self.HEAD, polygon, index, names)
+        return polygon
 
-            if not earfound:
-                print("Error! Ear not found")
-                break
-        return returnlist
+
+    '''
+    Checks that the polygon (with its holes, if any) is simple, in O(n log n)
+    time (see Validation.py). Calling this before Triangulate makes a bad
+    polygon fail right away, instead of after the ear clipping has run out of
+    ears.
+    
+    @raise Validation.InvalidPolygonError: If any edges intersect, or the
+           polygon is degenerate. The message names the vertices of the
+           first two edges found, and 'pairs' holds their edge indices.
+    '''
+    def validate(self):
+        import Holes
+        import Validation
+        if self.HOLES:
+            p = Holes.joinRings(self.outerPolygon(), self.HOLES)
+        else:
+            p = self.outerPolygon()
+        n = len(p)
+        if n < 3:
+            raise Validation.InvalidPolygonError("A polygon needs at least 3 vertices", [])
+        Validation.validate(p.xs, p.ys, p.nxt, p.prv, [p.name(i) for i in range(n)])
+
+
+    '''
+    Returns the Polygon that the engines triangulate when there are holes: the
+    single ring made by bridging the holes into the outer ring, or, for the
+    monotone engine, all the rings side by side.
+    '''
+    def holePolygon(self):
+        import Holes
+        if self.ENGINE == MONOTONE:
+            return Holes.joinRings(self.outerPolygon(), self.HOLES)
+        return Holes.mergeHoles(self.outerPolygon(), self.HOLES)
+
+
+    '''
+    Tells the Triangulation object that the linked list has changed.
+    
+    @param point: The Point whose coordinates were changed. Only the ear flags
+           that can be affected by the move are recomputed. If it's None, the
+           whole cached copy is thrown away.
+    '''
+    def invalidate(self, point = None):
+        if self.CACHE is None:
+            return
+        if point is None or point not in self.CACHE[2]:
+            self.CACHE = None
+            return
+        self.CACHE[1].moveVertex(self.CACHE[2][point], point.x, point.y)
+
+
+    '''
+    Triangulates a Polygon object (POLYGON by default) with the selected
+    engine, working directly on its coordinate arrays. If RESULTS is set, the
+    cached triangles are used when the polygon is found there.
+    
+    A strictly convex polygon is triangulated as a fan, and a clockwise one is
+    triangulated as a reversed copy; p itself is never changed.
+    
+    @return: Same as Triangulate.
+    '''
+    def TriangulatePolygon(self, p = None):
+        if p is None:
+            p = self.POLYGON
+        p, orientation, convex = self.enginePolygon(p)
+        triangles = self.indexTriangles(p, orientation, convex)
+        return self.phase('names', self.triangleNames, p, triangles)
+
+
+    '''
+    Same as Triangulate, but the polygon is cut into pieces along diagonals and
+    the pieces are triangulated on a pool of worker processes (see
+    ParallelTriangulation.py). Polygons with holes aren't supported.
+    
+    @param workers: Number of worker processes, by default the number of CPUs
+    @param pieces: Number of pieces, by default four per worker
+    '''
+    def TriangulateParallel(self, workers = None, pieces = None):
+        if self.HOLES:
+            raise ValueError("Polygons with holes can't be triangulated in parallel")
+        # Imported here, since it imports this module:
+        import ParallelTriangulation
+        return ParallelTriangulation.triangulateParallel(self.outerPolygon(), self.ENGINE,
+                                                         workers, pieces)
+
+
+    '''
+    Same as Triangulate, but the triangles are returned as a
+    TriangleMesh.TriangleMesh: a flat int32 array of vertex indices, which
+    the engine appends to directly, instead of a list of name triples. The
+    indices refer to mesh.polygon, the Polygon the engine worked on (for a
+    polygon with holes, see TriangleMesh.py). Nothing is stored in RESULTS.
+    '''
+    def TriangulateMesh(self):
+        if self.HOLES:
+            p = self.holePolygon()
+        else:
+            p = self.outerPolygon()
+        p, orientation, convex = self.enginePolygon(p)
+        import TriangleMesh
+        return self.indexTriangles(p, orientation, convex, TriangleMesh.TriangleMesh(p))
+
+
+    '''
+    Same as Triangulate, but the triangles are written to 'target' as the
+    engine produces them, instead of being returned as a list (see
+    TriangleOutput.TriangleWriter). Nothing is stored in RESULTS.
+    
+    @param target: A file name or a stream (binary for 'ply')
+    @param format: 'text' (the format of IOClass.printTrianglesToConsole),
+           'obj' or 'ply'. The vertices in OBJ and PLY files are those the
+           engine worked on: for a polygon with holes, the bridge vertices
+           appear twice.
+    @return: The number of triangles written
+    '''
+    def TriangulateTo(self, target, format = 'text'):
+        import TriangleOutput
+        if self.HOLES:
+            p = self.holePolygon()
+        else:
+            p = self.outerPolygon()
+        p, orientation, convex = self.enginePolygon(p)
+        count = len(p) - 2
+        if self.HOLES and self.ENGINE == MONOTONE:
+            count += 2 * len(self.HOLES)
+        with TriangleOutput.TriangleWriter(target, p, format, count) as writer:
+            self.indexTriangles(p, orientation, convex, writer)
+        return len(writer)
+
+
+    '''
+    Classifies p (see Polygon.classify) and returns the Polygon the engine
+    should work on, which is p itself or, if p is clockwise and not convex, a
+    reversed copy of it, together with its orientation and whether it is
+    strictly convex.
+    '''
+    def enginePolygon(self, p):
+        if self.HOLES and self.ENGINE == MONOTONE:
+            return p, 1, False
+        orientation, convex = self.phase('classify', p.classify)
+        if orientation < 0 and not convex:
+            p = self.phase('reverse', self.reversedPolygon, p)
+            orientation = 1
+        return p, orientation, convex
+
+
+    '''
+    Runs the selected engine on p (see enginePolygon) and returns the
+    triangles as index triples. If 'out' is given, the triangles are added
+    to it as they are produced, and it is returned instead of a list.
+    '''
+    def indexTriangles(self, p, orientation, convex, out = None):
+        if convex:
+            triangles = self.phase('triangulate', fan, len(p), orientation)
+            if out is None:
+                return triangles
+            out.extend(triangles)
+            return out
+
+        triangles = None
+        # The rings of a polygon with holes aren't a single ring, so they
+        # can't be looked up by their coordinates alone:
+        cached = self.RESULTS is not None and not (self.HOLES and self.ENGINE == MONOTONE)
+        if cached:
+            triangles = self.phase('cache', self.RESULTS.get, p.xs, p.ys, self.ENGINE)
+            if triangles is not None and out is not None:
+                out.extend(triangles)
+                return out
+        if triangles is None:
+            if self.ENGINE == MONOTONE:
+                import MonotoneTriangulation
+                triangles = self.phase('triangulate', MonotoneTriangulation.triangulateIndices,
+                                       p.xs, p.ys, p.nxt, p.prv, out)
+            elif self.ENGINE == REFLEX:
+                import ReflexEarClipping
+                triangles = self.phase('triangulate', ReflexEarClipping.triangulateIndices,
+                                       p.xs, p.ys, out)
+            else:
+                self.phase('earinit', p.earStatus, self.STATS)
+                triangles = self.phase('clip', p.earClip, self.STATS, out)
+            if cached and out is None:
+                self.RESULTS.put(p.xs, p.ys, self.ENGINE, triangles)
+        return triangles
+
+
+    '''
+    Returns a copy of p with its vertices in the opposite order.
+    '''
+    def reversedPolygon(self, p):
+        p = p.clone()
+        p.reverse()
+        return p
+
+
+    '''
+    Turns index triples into the name triples returned by Triangulate.
+    '''
+    def triangleNames(self, p, triangles):
+        names = p.names
+        if names is None:
+            names = [str(i + 1) for i in range(len(p))]
+        return [[names[a], names[b], names[c]] for a, b, c in triangles]
 
 
 
@@ -317,30 +678,42 @@ class Triangulation:
     also drawn next to each vertex (this text is the name of each Point object).
     
     @param canvas: The Tkinter Canvas widget on which to draw the polygon
+    @param view: A ViewTransform that maps the points to canvas coordinates.
+           By default the points are drawn as they are (see viewTransform to
+           fit the polygon to the canvas instead).
     '''
-    def drawPolygon(self, canvas):
+    def drawPolygon(self, canvas, view = None):
+        if view is None:
+            view = ViewTransform()
             
-        # Draw the polygon as a collection of lines:
-        cursor = self.HEAD
-        while True:
-            x1 = cursor.x
-            y1 = cursor.y
-            x2 = cursor.next.x
-            y2 = cursor.next.y
+        # Draw the polygon as a collection of lines, one ring at a time:
+        vertices = view.applyAll(self.vertexList())
+        sizes = self.ringSizes() if self.HOLES else [len(vertices)]
+        start = 0
+        for size in sizes:
+            self.drawRing(canvas, vertices[start:start + size])
+            start += size
+
+
+    '''
+    Draws one ring of the polygon, given as a list of (x, y, name) tuples in
+    canvas coordinates.
+    '''
+    def drawRing(self, canvas, vertices):
+        Tkinter = loadTkinter()
+        for i in range(len(vertices)):
+            x1, y1, name = vertices[i]
+            x2, y2, _ = vertices[(i + 1) % len(vertices)]
             
             # First, draw text labels. Labels will be placed next to each vertex.
-            label = Tkinter.Label(canvas, text = cursor.name, font = "Times 8")
-            label.place(x = x1 + 5, y = 700 - (y1 + 5))
+            label = Tkinter.Label(canvas, text = name, font = "Times 8")
+            label.place(x = x1 + 5, y = y1 - 5)
             
             # Draw a line from the current vertex to the next vertex:
-            canvas.create_line(x1, 700 - y1, x2, 700 - y2, width = 2.0, fill = 'black')
+            canvas.create_line(x1, y1, x2, y2, width = 2.0, fill = 'black')
             
             # Finally, draw a little dot at the vertex:
-            canvas.create_oval(x1 - 4, 700 - (y1 - 4), x1 + 4, 700 - (y1 + 4), fill = 'black')
-            
-            cursor = cursor.next
-            if cursor.equals(self.HEAD):
-                break
+            canvas.create_oval(x1 - 4, y1 + 4, x1 + 4, y1 - 4, fill = 'black')
             
             
             
@@ -348,43 +721,110 @@ class Triangulation:
     This function draws triangles, after a polygon is triangulated.
     
     @param canvas: A Tkinter Canvas widget on which to draw the triangles
-    @param triangles: This should be the return value of the 'Triangulate' function
+    @param triangles: This should be the return value of the 'Triangulate' (or
+           'TriangulateMesh') function
+    @param view: A ViewTransform, as in drawPolygon
     
     The function draws triangles by simply drawing lines between the 3 points 
     of each triangle.
     '''
-    def drawTriangles(self, canvas, triangles):
-        # It's convenient to have the points as a list instead of a linked list:
-        pointlist = []
-        cursor = self.HEAD
-        while True:
-            pointlist.append(cursor)
-            cursor = cursor.next
-            if cursor.equals(self.HEAD):
-                break
-        
+    def drawTriangles(self, canvas, triangles, view = None):
+        if view is None:
+            view = ViewTransform()
+            
+        # A TriangleMesh holds 0-based indices into its own polygon, so no names
+        # need to be converted:
+        import TriangleMesh
+        if isinstance(triangles, TriangleMesh.TriangleMesh):
+            p = triangles.polygon
+            points = view.applyAll([(p.xs[i], p.ys[i], None) for i in range(len(p))])
+        else:
+            # The triangles refer to the vertices by name. The names are only
+            # 1..n in list order for a CCW file read as it is: a CW file is
+            # reversed when it is read, and a simplified polygon keeps the
+            # names of the vertices that are left. So look the names up:
+            points = {}
+            for point in view.applyAll(self.vertexList()):
+                points[point[2]] = point
         
         # The triangulation output is a list of triangles, where each triangle 
-        # is specified by the indices of 3 points. Get those 3 points from the
-        # 'pointlist' and draw lines between them:
+        # is specified by 3 points. Get those 3 points from 'points' and draw
+        # lines between them:
         if len(triangles) > 0:
             for t in triangles:
-                # Find the 3 vertices with the matching indices:
-                p0 = pointlist[ int( t[0] ) - 1 ]
-                p1 = pointlist[ int( t[1] ) - 1 ]
-                p2 = pointlist[ int( t[2] ) - 1 ]
+                # Find the 3 vertices with the matching names or indices:
+                p0 = points[t[0]]
+                p1 = points[t[1]]
+                p2 = points[t[2]]
                 
                 # Draw the 3 lines:
-                canvas.create_line(p0.x, 700 - p0.y, p1.x, 700 - p1.y, 
+                canvas.create_line(p0[0], p0[1], p1[0], p1[1], 
                                    width = 1.0, fill = 'red')
-                canvas.create_line(p0.x, 700 - p0.y, p2.x, 700 - p2.y, 
+                canvas.create_line(p0[0], p0[1], p2[0], p2[1], 
                                    width = 1.0, fill = 'red')
-                canvas.create_line(p2.x, 700 - p2.y, p1.x, 700 - p1.y, 
+                canvas.create_line(p2[0], p2[1], p1[0], p1[1], 
                                    width = 1.0, fill = 'red')
                 
 
 
 
+    '''
+    Returns a ViewTransform that fits the polygon into a canvas of the given
+    size, with the same translation and scaling that scale() would apply. The
+    polygon itself is not changed.
+    '''
+    def viewTransform(self, width = 1280, height = 720, uniform = True):
+        if self.POLYGON is not None:
+            return ViewTransform.fitArrays(self.POLYGON.xs, self.POLYGON.ys, width, height, uniform)
+        return ViewTransform.fitVertices(self.vertexList(), width, height, uniform)
+
+
+    '''
+    Draws the polygon and its triangulation into an SVG file, without Tkinter.
+    See HeadlessRenderer.writeSVG for the options.
+    
+    @param triangles: This should be the return value of the 'Triangulate' (or
+           'TriangulateMesh') function
+    '''
+    def renderSVG(self, target, triangles, **options):
+        import HeadlessRenderer
+        import TriangleMesh
+        if self.HOLES:
+            options.setdefault('rings', self.ringSizes())
+        HeadlessRenderer.writeSVG(target, self.vertexList(), TriangleMesh.toList(triangles),
+                                  **options)
+
+
+    '''
+    Builds a PointLocation.PointLocator over the triangles returned by
+    Triangulate (or TriangulateMesh), to find the triangles that contain given
+    points.
+    '''
+    def pointLocator(self, triangles):
+        import Holes
+        import PointLocation
+        import TriangleMesh
+        if isinstance(triangles, TriangleMesh.TriangleMesh):
+            return PointLocation.PointLocator(triangles.polygon, triangles)
+        p = self.outerPolygon()
+        if self.HOLES:
+            p = Holes.joinRings(p, self.HOLES)
+        return PointLocation.PointLocator(p, triangles)
+
+
+    '''
+    Same as renderSVG, but writes a PNG image.
+    '''
+    def renderPNG(self, target, triangles, **options):
+        import HeadlessRenderer
+        import TriangleMesh
+        if self.HOLES:
+            options.setdefault('rings', self.ringSizes())
+        HeadlessRenderer.writePNG(target, self.vertexList(), TriangleMesh.toList(triangles),
+                                  **options)
+
+
+
     '''
     This method does some translating and scaling so that the polygon is displayed
     nicely on the canvas.
@@ -404,8 +844,19 @@ class Triangulation:
     
     @param uniform: True if x and y coordinates should be scaled by the same 
     factor. If True, both x and y will be scaled by min(k1, k2).
+    
+    If POLYGON is set, the scaling is done on its coordinate arrays instead.
+    Otherwise the Points are changed, and the cached array copy of the linked
+    list is thrown away (see invalidate).
+    
+    To draw the polygon, it's better to leave the points alone and pass a
+    ViewTransform (see viewTransform) to the drawing functions.
     '''
     def scale(self, uniform = False):
+        if self.POLYGON is not None:
+            self.POLYGON.scale(uniform)
+            return
+
         xmin = 1000000000                      # Initialize to some huge numbers
         ymin = 1000000000
     
@@ -474,5 +925,8 @@ class Triangulation:
             cursor = cursor.next
             if cursor.equals(self.HEAD):
                 break
+
+        # The cached array copy (see ringPolygon) still has the old coordinates:
+        self.invalidate()
         
             
\ No newline at end of file
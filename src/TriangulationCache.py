@@ -0,0 +1,198 @@
+'''
+Created on Oct 18, 2026
+
+This module keeps the results of previous triangulations, so a polygon that
+has already been triangulated doesn't go through the engines again.
+
+Results are keyed by a hash of the vertex ring and the engine name. The ring
+is hashed starting from its lowest vertex (smallest x, then smallest y), so
+the same polygon read with a different first vertex gets the same key. The
+triangles are stored as a flat int32 array of vertex indices counted from that
+lowest vertex, and are shifted back to the indices of the ring being looked
+up.
+
+The cache holds the most recently used results in memory, up to 'maxBytes'
+bytes of triangle data. When a result is evicted and a directory was given, it
+is written to that directory (one file per key), and it is read back from
+there the next time it is asked for.
+
+Note that a cached triangulation is always a valid triangulation of the
+polygon, but for the ear clipping engines it is not necessarily the same list
+of triangles that would be found if the polygon were triangulated starting
+from a different first vertex.
+'''
+from array import array
+from collections import OrderedDict
+import hashlib
+import os
+import sys
+
+
+class TriangulationCache:
+
+    '''
+    @param maxBytes: Size limit of the in-memory results, in bytes of triangle
+           indices (12 bytes per triangle)
+    @param directory: Directory where evicted results are kept, or None to
+           throw them away
+    '''
+    def __init__(self, maxBytes = 64 << 20, directory = None):
+        self.maxBytes = maxBytes
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.diskHits = 0
+        self.diskWrites = 0
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+
+    '''
+    Returns the key of the ring (xs, ys) for the given engine, and the index of
+    the vertex that the key starts from.
+    '''
+    @staticmethod
+    def key(xs, ys, engine):
+        n = len(xs)
+        start = 0
+        for i in range(1, n):
+            if xs[i] < xs[start] or (xs[i] == xs[start] and ys[i] < ys[start]):
+                start = i
+
+        digest = hashlib.sha1()
+        digest.update(("%s:%s:%d:" % (engine, getattr(xs, 'typecode', '?'), n)).encode('ascii'))
+        if isinstance(xs, array):
+            for coords in (xs, ys):
+                view = memoryview(coords)
+                digest.update(view[start:])
+                digest.update(view[:start])
+                view.release()
+        else:
+            for coords in (xs, ys):
+                digest.update(repr(list(coords[start:]) + list(coords[:start])).encode('ascii'))
+        return digest.hexdigest(), start
+
+
+    '''
+    Returns the cached triangles of the ring (xs, ys) as a list of index
+    triples, or None if the ring isn't in the cache.
+    '''
+    def get(self, xs, ys, engine):
+        key, start = self.key(xs, ys, engine)
+        flat = self.entries.get(key)
+        if flat is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        else:
+            flat = self.readFile(key)
+            if flat is None:
+                self.misses += 1
+                return None
+            self.diskHits += 1
+            self.insert(key, flat)
+
+        n = len(xs)
+        return [((flat[k] + start) % n, (flat[k + 1] + start) % n, (flat[k + 2] + start) % n)
+                for k in range(0, len(flat), 3)]
+
+
+    '''
+    Stores the triangles (index triples into xs and ys) of the ring (xs, ys).
+    '''
+    def put(self, xs, ys, engine, triangles):
+        key, start = self.key(xs, ys, engine)
+        n = len(xs)
+        flat = array('i')
+        for t in triangles:
+            flat.extend(((t[0] - start) % n, (t[1] - start) % n, (t[2] - start) % n))
+        self.insert(key, flat)
+
+
+    '''
+    Adds an entry at the most recently used end, evicting the least recently
+    used entries while the cache is over its size limit.
+    '''
+    def insert(self, key, flat):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old) * old.itemsize
+        self.entries[key] = flat
+        self.size += len(flat) * flat.itemsize
+
+        while self.size > self.maxBytes and len(self.entries) > 1:
+            oldKey, oldFlat = self.entries.popitem(last = False)
+            self.size -= len(oldFlat) * oldFlat.itemsize
+            self.evictions += 1
+            self.writeFile(oldKey, oldFlat)
+
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.tri')
+
+
+    '''
+    Writes an evicted entry to the directory, if there is one. The file is
+    written under a temporary name first, so a reader never sees half a file.
+    '''
+    def writeFile(self, key, flat):
+        if self.directory is None:
+            return
+        path = self.path(key)
+        if os.path.exists(path):
+            return
+        if sys.byteorder == 'big':
+            flat = array('i', flat)
+            flat.byteswap()
+        temp = "%s.%d.tmp" % (path, os.getpid())
+        outputfile = open(temp, 'wb')
+        try:
+            flat.tofile(outputfile)
+        finally:
+            outputfile.close()
+        os.replace(temp, path)
+        self.diskWrites += 1
+
+
+    '''
+    Reads an entry back from the directory. Returns None if it isn't there.
+    '''
+    def readFile(self, key):
+        if self.directory is None:
+            return None
+        try:
+            inputfile = open(self.path(key), 'rb')
+        except (IOError, OSError):
+            return None
+        try:
+            flat = array('i')
+            flat.frombytes(inputfile.read())
+        finally:
+            inputfile.close()
+        if sys.byteorder == 'big':
+            flat.byteswap()
+        return flat
+
+
+    '''
+    Returns the counters as a dictionary.
+    '''
+    def stats(self):
+        return {'entries': len(self.entries), 'bytes': self.size,
+                'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'diskHits': self.diskHits,
+                'diskWrites': self.diskWrites}
+
+
+    '''
+    Empties the in-memory part of the cache. Files in the directory are kept.
+    '''
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,204 @@
+'''
+Created on Oct 18, 2026
+
+Checks that a polygon is simple before it is triangulated. The ear clipping
+loop only notices a self-intersecting ring when it runs out of ears, after
+O(n^3) work in the worst case; the sweep here finds the problem in
+O(n log n) expected time.
+
+The sweep is Shamos and Hoey's ("Geometric intersection problems", 1976). A
+vertical line sweeps the vertices from left to right (points with the same x
+from bottom to top, so vertical edges are handled like any other edge). The
+sweep status holds the edges that cross the line, from bottom to top, in a
+treap (see SweepStatus.py), so each event costs O(log n) expected; an edge
+is only tested against its neighbours there, when it is inserted or when the
+edges between them are removed. If the edges intersect anywhere, the leftmost
+intersection is found before the sweep passes it. All the tests use the exact
+orientation predicate (see Predicates.py), so nearly degenerate rings are
+judged correctly.
+
+Besides proper crossings, these are reported as well:
+- two vertices at the same position (this includes zero-length edges)
+- a vertex lying on an edge that isn't one of its own
+- two consecutive edges that fold back over each other (a spike), which is
+  also what a ring of collinear points with no area looks like
+
+An edge is identified by its first vertex: edge i runs from vertex i to
+vertex nxt[i] (vertex i + 1 for a single ring).
+'''
+from Predicates import orient
+from Polygon import intersect
+from SweepStatus import SweepStatus, NONE
+
+
+'''
+Raised for a polygon that isn't simple. 'pairs' holds the offending (i, j)
+edge pairs, as returned by findIntersections.
+'''
+class InvalidPolygonError(ValueError):
+
+    def __init__(self, message, pairs):
+        ValueError.__init__(self, message)
+        self.pairs = pairs
+
+
+'''
+Returns True if the edges e = (a, b) and f = (c, d) conflict: they intersect
+and aren't just two consecutive edges of a ring meeting at their shared
+vertex.
+'''
+def edgesConflict(xs, ys, a, b, c, d):
+    shared = None
+    if b == c:
+        shared, u, w = b, a, d
+    elif d == a:
+        shared, u, w = a, b, c
+    if shared is None:
+        return intersect(xs, ys, a, b, c, d)
+    if a == d and b == c:
+        return True                     # a ring of two vertices
+    # Consecutive edges only conflict if they fold back over each other:
+    if orient(xs[shared], ys[shared], xs[u], ys[u], xs[w], ys[w]) != 0:
+        return False
+    return ((xs[u] - xs[shared]) * (xs[w] - xs[shared]) +
+            (ys[u] - ys[shared]) * (ys[w] - ys[shared])) > 0
+
+
+'''
+Finds pairs of edges of a polygon that intersect, with a Shamos-Hoey sweep.
+
+@param nxt, prv: The rings of the polygon, as in Polygon (for example a
+       polygon with holes from Holes.joinRings). By default the vertices form
+       a single ring in the order given.
+@param limit: Stop after this many pairs. The sweep relies on the edges it
+       has passed being disjoint, so after the first pair the rest of the
+       list is not necessarily complete; every pair in it is a real
+       intersection, though.
+@return: A list of (i, j) edge pairs with i < j; empty if the polygon is
+        simple
+'''
+def findIntersections(xs, ys, nxt = None, prv = None, limit = 1):
+    n = len(xs)
+    if nxt is None:
+        nxt = [(i + 1) % n for i in range(n)]
+        prv = [(i - 1) % n for i in range(n)]
+    pairs = []
+    found = set()
+
+    def report(e, f):
+        key = (min(e, f), max(e, f))
+        if key not in found:
+            found.add(key)
+            pairs.append(key)
+        return len(pairs) >= limit
+
+    def conflict(e, f):
+        return e != f and edgesConflict(xs, ys, e, nxt[e], f, nxt[f])
+
+    # Vertices at the same position, found with a dictionary up front, so the
+    # sweep itself never sees two events at one point:
+    seen = {}
+    for v in range(n):
+        key = (xs[v], ys[v])
+        if key in seen:
+            if report(seen[key], v):
+                return pairs
+        else:
+            seen[key] = v
+    if pairs:
+        return pairs
+
+    # Sweep order, and the left (earlier) endpoint of every edge:
+    order = sorted(range(n), key = lambda v: (xs[v], ys[v]))
+    rank = [0] * n
+    for k in range(n):
+        rank[order[k]] = k
+    left = [e if rank[e] < rank[nxt[e]] else nxt[e] for e in range(n)]
+
+    def above(e, v):
+        a = left[e]
+        b = nxt[e] if a == e else e
+        return orient(xs[a], ys[a], xs[b], ys[b], xs[v], ys[v])
+
+    status = SweepStatus(n)             # edges crossing the sweep line
+    for v in order:
+        # The edges below v come first in the status:
+        first = status.search(lambda e: above(e, v) > 0)
+        below = status.prev(first) if first != NONE else status.last()
+
+        # Edges that pass through v: its own edges that end here, which are
+        # removed, or an edge that v lies on:
+        through = NONE
+        e = first
+        while e != NONE and above(e, v) == 0:
+            f = status.next(e)
+            if e != v and e != prv[v]:
+                # v lies on e, unless an earlier intersection left e out of
+                # order in the status:
+                other = prv[v] if conflict(e, prv[v]) else v
+                if conflict(e, other) and report(e, other):
+                    return pairs
+                if through == NONE:
+                    through = e
+            else:
+                status.remove(e)
+            e = f
+        over = through if through != NONE else e
+
+        # v's edges that start here, from the bottom up:
+        starting = [e for e in (prv[v], v) if left[e] == v]
+        if len(starting) == 2:
+            u = nxt[v]
+            w = prv[v]
+            turn = orient(xs[v], ys[v], xs[u], ys[u], xs[w], ys[w])
+            if turn == 0:
+                if report(prv[v], v):
+                    return pairs
+            elif turn > 0:
+                starting = [v, prv[v]]  # w is above the edge to u
+        for e in starting:
+            status.insert(e, over)
+
+        # Test the edges that are now neighbours:
+        if starting:
+            if below != NONE and conflict(below, starting[0]) and report(below, starting[0]):
+                return pairs
+            if over != NONE and conflict(starting[-1], over) and report(starting[-1], over):
+                return pairs
+        elif below != NONE and over != NONE:
+            if conflict(below, over) and report(below, over):
+                return pairs
+    return pairs
+
+
+'''
+Returns True if the polygon is simple (see findIntersections for the
+parameters).
+'''
+def isSimple(xs, ys, nxt = None, prv = None):
+    return len(xs) >= 3 and not findIntersections(xs, ys, nxt, prv)
+
+
+'''
+Raises an InvalidPolygonError if the polygon is not simple, or has fewer than
+3 vertices. The message names the vertices of the offending edges (see
+findIntersections for the parameters).
+
+@param names: The vertex names to use in the message, by default str(i + 1)
+'''
+def validate(xs, ys, nxt = None, prv = None, names = None, limit = 1):
+    n = len(xs)
+    if n < 3:
+        raise InvalidPolygonError("A polygon needs at least 3 vertices", [])
+    pairs = findIntersections(xs, ys, nxt, prv, limit)
+    if not pairs:
+        return
+    if nxt is None:
+        nxt = [(i + 1) % n for i in range(n)]
+
+    def name(v):
+        return names[v] if names is not None else str(v + 1)
+
+    e, f = pairs[0]
+    raise InvalidPolygonError("Polygon is not simple: edge %s-%s meets edge %s-%s" % (
+        name(e), name(nxt[e]), name(f), name(nxt[f])), pairs)
@@ -0,0 +1,124 @@
+'''
+Created on Oct 18, 2026
+
+This class maps polygon coordinates to canvas coordinates at draw time. It
+replaces the in-place Triangulation.scale for drawing: the polygon keeps its
+real coordinates, and the drawing functions map each point as they draw it.
+
+The mapping is the affine transform
+
+    X = (x + dx) * k1
+    Y = base - (y + dy) * k2
+
+The default transform (k1 = k2 = 1, dx = dy = 0, base = 700) is exactly what the
+drawing functions have always done with already-scaled points. fit() computes
+the same translation and scaling as Triangulation.scale, from the bounding box
+of the polygon.
+'''
+from array import array
+
+import BatchPredicates
+
+
+class ViewTransform:
+
+    def __init__(self, k1 = 1.0, k2 = 1.0, dx = 0.0, dy = 0.0, base = 700):
+        self.k1 = k1
+        self.k2 = k2
+        self.dx = dx
+        self.dy = dy
+        self.base = base
+
+
+    '''
+    Creates the transform that fits the bounding box into a canvas, like
+    Triangulation.scale: the minimum x and y are moved 10 units from the axes,
+    and the result is scaled to fit a (width - 30) x (height - 30) area (1250 x
+    690 for the default 1280 x 720 canvas).
+
+    @param uniform: True if x and y should be scaled by the same factor
+    '''
+    @staticmethod
+    def fit(xmin, ymin, xmax, ymax, width = 1280, height = 720, uniform = True):
+        dx = 10 - xmin
+        dy = 10 - ymin
+        k1 = (width - 30.0) / (xmax + dx)
+        k2 = (height - 30.0) / (ymax + dy)
+        if uniform:
+            k1 = k2 = min(k1, k2)
+        return ViewTransform(k1, k2, dx, dy, height - 20)
+
+
+    '''
+    Same as fit, with the bounding box taken from a list of (x, y, name)
+    vertices.
+    '''
+    @staticmethod
+    def fitVertices(vertices, width = 1280, height = 720, uniform = True):
+        xmin, ymin, xmax, ymax = bounds(vertices)
+        return ViewTransform.fit(xmin, ymin, xmax, ymax, width, height, uniform)
+
+
+    '''
+    Same as fit, with the bounding box taken from two coordinate arrays.
+    '''
+    @staticmethod
+    def fitArrays(xs, ys, width = 1280, height = 720, uniform = True):
+        xmin, ymin, xmax, ymax = arrayBounds(xs, ys)
+        return ViewTransform.fit(xmin, ymin, xmax, ymax, width, height, uniform)
+
+
+    '''
+    Maps the point (x, y) to canvas coordinates.
+    '''
+    def apply(self, x, y):
+        return (x + self.dx) * self.k1, self.base - (y + self.dy) * self.k2
+
+
+    '''
+    Maps a list of (x, y, name) vertices to a list of (X, Y, name) canvas
+    vertices.
+    '''
+    def applyAll(self, vertices):
+        k1 = self.k1
+        k2 = self.k2
+        dx = self.dx
+        dy = self.dy
+        base = self.base
+        return [((x + dx) * k1, base - (y + dy) * k2, name) for x, y, name in vertices]
+
+
+'''
+Returns the bounding box (xmin, ymin, xmax, ymax) of a list of (x, y, ...)
+vertices, in a single pass.
+'''
+def bounds(vertices):
+    x, y = vertices[0][0], vertices[0][1]
+    xmin = xmax = x
+    ymin = ymax = y
+    for v in vertices:
+        x = v[0]
+        y = v[1]
+        if x < xmin:
+            xmin = x
+        elif x > xmax:
+            xmax = x
+        if y < ymin:
+            ymin = y
+        elif y > ymax:
+            ymax = y
+    return xmin, ymin, xmax, ymax
+
+
+'''
+Returns the bounding box of two coordinate arrays (such as the ones of a
+Polygon object), using NumPy for large arrays when it is available.
+'''
+def arrayBounds(xs, ys):
+    if isinstance(xs, array) and BatchPredicates.useBatch(len(xs)):
+        numpy = BatchPredicates.numpy
+        dtype = numpy.int64 if xs.typecode == 'q' else numpy.float64
+        x = numpy.frombuffer(xs, dtype = dtype)
+        y = numpy.frombuffer(ys, dtype = dtype)
+        return x.min().item(), y.min().item(), x.max().item(), y.max().item()
+    return min(xs), min(ys), max(xs), max(ys)
@@ -0,0 +1,12 @@
+'''
+Created on Oct 18, 2026
+
+The modules live side by side in src/ and import each other by name, so that
+directory is put on the path before any test module is imported.
+'''
+import os
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
@@ -0,0 +1,93 @@
+'''
+Created on Oct 18, 2026
+
+Helpers shared by the tests: the bundled input files, writing rings to
+temporary input files, and an exact check that a list of triangles
+triangulates a polygon.
+'''
+import json
+import os
+
+from conftest import SRC
+
+
+INPUTS = ['input%d.txt' % k for k in range(1, 8)]
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'earclip_baseline.json')
+
+
+'''
+Returns the path of a bundled input file.
+'''
+def inputFile(name):
+    return os.path.join(SRC, name)
+
+
+'''
+Returns the triangles that the original ear clipping code found for each
+bundled input file, as name triples keyed by file name.
+'''
+def baseline():
+    with open(BASELINE) as f:
+        return json.load(f)
+
+
+'''
+Returns the points of an input file as a list of (x, y) tuples, in the order
+of the file.
+'''
+def readPoints(filename):
+    import IOClass
+    return list(IOClass.iterVertices(filename))
+
+
+'''
+Writes the points to 'filename' in the input format ([x,y] lines).
+'''
+def writePoints(filename, points):
+    with open(filename, 'w') as f:
+        f.write("%d\n" % len(points))
+        f.write("".join(["[%d,%d]\n" % (x, y) for x, y in points]))
+    return filename
+
+
+'''
+Twice the signed area of a ring, exact for integer coordinates.
+'''
+def ringArea2(points):
+    return sum([points[i - 1][0] * points[i][1] - points[i][0] * points[i - 1][1]
+                for i in range(len(points))])
+
+
+'''
+Checks that the triangles (name triples, as returned by Triangulate)
+triangulate the ring of (x, y, name) vertices: there are n-2 of them, none is
+degenerate, their areas add up to that of the ring exactly, every edge of the
+ring is used by one triangle and every other edge by two.
+'''
+def checkTriangulation(vertices, triangles):
+    n = len(vertices)
+    assert len(triangles) == n - 2
+
+    index = {}
+    for i in range(n):
+        index[vertices[i][2]] = i
+    total = 0
+    edges = {}
+    for t in triangles:
+        a, b, c = index[t[0]], index[t[1]], index[t[2]]
+        ax, ay = vertices[a][:2]
+        bx, by = vertices[b][:2]
+        cx, cy = vertices[c][:2]
+        area2 = (bx - ax) * (cy - ay) - (cx - ax) * (by - ay)
+        assert area2 != 0
+        total += abs(area2)
+        for u, v in ((a, b), (b, c), (c, a)):
+            key = (min(u, v), max(u, v))
+            edges[key] = edges.get(key, 0) + 1
+
+    assert total == abs(ringArea2([v[:2] for v in vertices]))
+    for i in range(n):
+        j = (i + 1) % n
+        assert edges.pop((min(i, j), max(i, j))) == 1
+    assert all(count == 2 for count in edges.values())
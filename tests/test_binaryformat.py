@@ -0,0 +1,80 @@
+'''
+Created on Oct 18, 2026
+
+Tests for the binary polygon files of BinaryFormat.py.
+'''
+import pytest
+
+import BinaryFormat
+import IOClass
+import Simplification
+from Triangulation import Triangulation
+from support import inputFile, readPoints, writePoints
+
+
+'''
+A text file converted to binary and back is the same file, whichever way
+round its vertices go.
+'''
+@pytest.mark.parametrize('clockwise', [False, True])
+def testTextRoundTrip(clockwise, tmp_path):
+    points = readPoints(inputFile('input3.txt'))
+    if clockwise:
+        points = points[::-1]
+    text = writePoints(str(tmp_path / 'in.txt'), points)
+    binary = str(tmp_path / 'polygon.bin')
+    back = str(tmp_path / 'out.txt')
+    assert BinaryFormat.textToBinary(text, binary)
+    BinaryFormat.binaryToText(binary, back)
+    assert open(back).read() == open(text).read()
+
+
+def testTriangles(tmp_path):
+    polygon = IOClass.createPolygon(inputFile('input3.txt'))
+    triangles = Triangulation(polygon = polygon).Triangulate()
+    binary = str(tmp_path / 'polygon.bin')
+    BinaryFormat.save(binary, polygon, triangles)
+    with BinaryFormat.load(binary) as f:
+        assert f.triangleList() == triangles
+        copy = f.polygon()
+    assert list(copy.xs) == list(polygon.xs)
+    assert list(copy.ys) == list(polygon.ys)
+
+
+'''
+A file cut short anywhere, or that isn't a polygon file, gives a ValueError.
+'''
+def testTruncated(tmp_path):
+    polygon = IOClass.createPolygon(inputFile('input3.txt'))
+    triangles = Triangulation(polygon = polygon).Triangulate()
+    binary = str(tmp_path / 'polygon.bin')
+    BinaryFormat.save(binary, polygon, triangles)
+    with open(binary, 'rb') as f:
+        data = f.read()
+
+    short = str(tmp_path / 'short.bin')
+    for size in (0, 10, BinaryFormat.HEADER.size, 100, len(data) - 1):
+        with open(short, 'wb') as f:
+            f.write(data[:size])
+        with pytest.raises(ValueError):
+            BinaryFormat.load(short)
+    with open(short, 'wb') as f:
+        f.write(b'XXXX' + data[4:])
+    with pytest.raises(ValueError):
+        BinaryFormat.load(short)
+
+
+'''
+The vertices of a simplified polygon keep their names, which the file
+doesn't store; they come back when the polygon is passed to triangleList.
+'''
+def testTriangleNames(tmp_path):
+    polygon = IOClass.createPolygon(inputFile('input3.txt'))
+    polygon, removed = Simplification.simplifyPolygon(polygon, 2000)
+    assert removed > 0
+    triangles = Triangulation(polygon = polygon).Triangulate()
+    binary = str(tmp_path / 'polygon.bin')
+    BinaryFormat.save(binary, polygon, triangles)
+    with BinaryFormat.load(binary) as f:
+        assert f.triangleList(polygon) == triangles
+        assert f.triangleList() != triangles
@@ -0,0 +1,73 @@
+'''
+Created on Oct 18, 2026
+
+Tests that drawTriangles draws the triangles that were found, whatever the
+names of the vertices are.
+'''
+import IOClass
+import Simplification
+from Triangulation import Triangulation
+from ViewTransform import ViewTransform
+from support import inputFile, readPoints, writePoints
+
+
+'''
+Stands in for a Tkinter canvas, and records the lines drawn on it.
+'''
+class FakeCanvas:
+
+    def __init__(self):
+        self.lines = set()
+
+    def create_line(self, x1, y1, x2, y2, **options):
+        self.lines.add(frozenset([(x1, y1), (x2, y2)]))
+
+
+'''
+Returns the lines that drawing the triangles should give, looking up each
+vertex by name.
+'''
+def expectedLines(t, triangles, view):
+    points = dict([(v[2], v[:2]) for v in view.applyAll(t.vertexList())])
+    lines = set()
+    for a, b, c in triangles:
+        for u, w in ((a, b), (b, c), (c, a)):
+            lines.add(frozenset([points[u], points[w]]))
+    return lines
+
+
+def testDrawClockwise(tmp_path):
+    cw = writePoints(str(tmp_path / 'cw.txt'), readPoints(inputFile('input3.txt'))[::-1])
+    head, size = IOClass.createLinkedList(cw)
+    t = Triangulation(head, size)
+    triangles = t.Triangulate()
+
+    view = ViewTransform()
+    canvas = FakeCanvas()
+    t.drawTriangles(canvas, triangles, view)
+    assert canvas.lines == expectedLines(t, triangles, view)
+
+
+'''
+A simplified polygon keeps the names of the vertices that are left, so they
+are no longer 1..n (as with Main.py input3.txt --simplify 2000 --gui).
+'''
+def testDrawSimplified():
+    polygon = IOClass.createPolygon(inputFile('input3.txt'))
+    polygon, removed = Simplification.simplifyPolygon(polygon, 2000)
+    assert removed > 0
+    t = Triangulation(polygon = polygon)
+    triangles = t.Triangulate()
+
+    view = t.viewTransform(1280, 720)
+    canvas = FakeCanvas()
+    t.drawTriangles(canvas, triangles, view)
+    assert canvas.lines == expectedLines(t, triangles, view)
+
+
+def testDrawMesh():
+    t = Triangulation(polygon = IOClass.createPolygon(inputFile('input3.txt')))
+    view = ViewTransform()
+    canvas = FakeCanvas()
+    t.drawTriangles(canvas, t.TriangulateMesh(), view)
+    assert canvas.lines == expectedLines(t, t.Triangulate(), view)
@@ -0,0 +1,117 @@
+'''
+Created on Oct 18, 2026
+
+Regression tests for the three triangulation engines on the bundled input
+files, through both the linked-list and the Polygon front-ends.
+'''
+import io
+
+import pytest
+
+import IOClass
+from Triangulation import Triangulation, ENGINES, EARCLIP
+from support import INPUTS, inputFile, baseline, checkTriangulation, readPoints, writePoints
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('name', INPUTS)
+def testLinkedList(engine, name):
+    head, size = IOClass.createLinkedList(inputFile(name))
+    t = Triangulation(head, size, engine = engine)
+    checkTriangulation(t.vertexList(), t.Triangulate())
+
+
+'''
+Triangulating the same linked list again sees the Points that were changed
+since, whether or not invalidate was called.
+'''
+def testLinkedListChanged():
+    head, size = IOClass.createLinkedList(inputFile('input3.txt'))
+    t = Triangulation(head, size)
+    first = t.Triangulate()
+    assert len(first) == 31
+
+    point = head.next.next
+    x, y = point.x, point.y
+    point.x = point.y = -100000
+    moved = t.Triangulate()
+    assert moved == Triangulation(head, size).Triangulate()
+    assert len(moved) == 27
+
+    point.x, point.y = x, y
+    t.invalidate(point)
+    assert t.Triangulate() == first
+
+    # Coordinates that don't fit the cached arrays, and new names:
+    point.x = x + 0.5
+    assert t.Triangulate() == Triangulation(head, size).Triangulate()
+    point.x = x
+    point.name = 'moved'
+    assert t.Triangulate() == Triangulation(head, size).Triangulate()
+    assert 'moved' in sum(t.Triangulate(), [])
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('name', INPUTS)
+def testPolygon(engine, name):
+    t = Triangulation(polygon = IOClass.createPolygon(inputFile(name)), engine = engine)
+    triangles = t.Triangulate()
+    checkTriangulation(t.vertexList(), triangles)
+
+    # The other result forms hold the same triangles:
+    assert t.TriangulateMesh().toList() == triangles
+    stream = io.StringIO()
+    assert t.TriangulateTo(stream) == len(triangles)
+    assert stream.getvalue() == "%d" % len(triangles) + "".join(
+        ["\n[%s,%s,%s]" % tuple(tr) for tr in triangles])
+
+
+'''
+The ear clipping engine must still give exactly the triangles of the
+original code.
+'''
+@pytest.mark.parametrize('name', INPUTS)
+def testEarclipMatchesBaseline(name):
+    expected = baseline()[name]
+    head, size = IOClass.createLinkedList(inputFile(name))
+    assert Triangulation(head, size, engine = EARCLIP).Triangulate() == expected
+    polygon = IOClass.createPolygon(inputFile(name))
+    assert Triangulation(polygon = polygon, engine = EARCLIP).Triangulate() == expected
+
+
+'''
+A clockwise file is reversed when it is read, and triangulated as a reversed
+copy when it is given as a clockwise Polygon.
+'''
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('name', INPUTS)
+def testClockwise(engine, name, tmp_path):
+    cw = writePoints(str(tmp_path / name), readPoints(inputFile(name))[::-1])
+
+    head, size = IOClass.createLinkedList(cw)
+    t = Triangulation(head, size, engine = engine)
+    checkTriangulation(t.vertexList(), t.Triangulate())
+
+    t = Triangulation(polygon = IOClass.createPolygon(cw, ccw = False), engine = engine)
+    checkTriangulation(t.vertexList(), t.Triangulate())
+
+
+'''
+Coordinates beyond 64 bits are kept as Python integers. Scaling a polygon by
+a positive factor doesn't change the sign of any predicate, so every engine
+finds the same triangles as for the original coordinates.
+'''
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('name', INPUTS)
+def testLargeCoordinates(engine, name, tmp_path):
+    points = readPoints(inputFile(name))
+    big = writePoints(str(tmp_path / name), [(x * 10 ** 20 - 7, y * 10 ** 20 + 3) for x, y in points])
+    expected = Triangulation(polygon = IOClass.createPolygon(inputFile(name)), engine = engine).Triangulate()
+
+    head, size = IOClass.createLinkedList(big)
+    t = Triangulation(head, size, engine = engine)
+    assert t.Triangulate() == expected
+    checkTriangulation(t.vertexList(), expected)
+
+    polygon = IOClass.createPolygon(big, validate = True)
+    assert Triangulation(polygon = polygon, engine = engine).Triangulate() == expected
@@ -0,0 +1,170 @@
+'''
+Created on Oct 18, 2026
+
+Tests for the code around the engines: validation, holes, point location,
+simplification and the parallel splitter.
+'''
+from array import array
+
+import pytest
+
+import IOClass
+import Simplification
+import Validation
+from ParallelTriangulation import splitPolygon, triangulateParallel
+from PointLocation import PointLocator
+from Polygon import Polygon
+from Triangulation import Triangulation, ENGINES, EARCLIP, REFLEX
+from support import INPUTS, inputFile, checkTriangulation, ringArea2
+
+
+'''
+Returns a Polygon of the integer points.
+'''
+def polygonOf(points):
+    return Polygon(array('q', [p[0] for p in points]), array('q', [p[1] for p in points]))
+
+
+'''
+A zigzag comb with 'teeth' teeth, which has many reflex vertices.
+'''
+def comb(teeth):
+    points = [(0, 0), (4 * teeth, 0)]
+    for k in range(teeth, 0, -1):
+        points.append((4 * k, 10))
+        points.append((4 * k - 2, 2))
+    points.append((0, 10))
+    return points
+
+
+@pytest.mark.parametrize('name', INPUTS)
+def testInputsAreSimple(name):
+    p = IOClass.createPolygon(inputFile(name))
+    assert Validation.isSimple(p.xs, p.ys)
+
+
+def testBowTieIsRejected():
+    p = polygonOf([(0, 0), (10, 10), (10, 0), (0, 10)])
+    assert not Validation.isSimple(p.xs, p.ys)
+    with pytest.raises(Validation.InvalidPolygonError):
+        Triangulation(polygon = p).validate()
+
+
+'''
+An engine that runs out of ears returns the triangles found so far, without
+writing anything to the console: the caller reports the failure.
+'''
+def testEarNotFoundIsQuiet(capsys):
+    p = polygonOf([(0, 0), (10, 10), (10, 0), (0, 10)])
+    assert len(Triangulation(polygon = p, engine = EARCLIP).Triangulate()) < len(p) - 2
+    Triangulation(polygon = p, engine = REFLEX).Triangulate()
+    assert capsys.readouterr().out == ''
+
+
+def testTouchingVertexIsRejected():
+    # Vertex (5, 0) lies on the edge from (0, 0) to (10, 0):
+    p = polygonOf([(0, 0), (10, 0), (10, 10), (5, 0), (0, 10)])
+    assert not Validation.isSimple(p.xs, p.ys)
+
+
+'''
+Polygons with holes: the outer ring, the holes, and the area between them.
+The second has two holes that reach as far right as the one between them,
+which the bridge of the middle hole must not pass through.
+'''
+HOLES = [
+    ([(0, 0), (100, 0), (100, 100), (0, 100)],
+     [[(10, 10), (10, 30), (30, 30), (30, 10)],
+      [(60, 60), (60, 90), (90, 90), (90, 60)]],
+     100 * 100 - 20 * 20 - 30 * 30),
+    ([(0, 0), (40, 0), (40, 40), (0, 40)],
+     [[(2, 24), (6, 20), (2, 20)],
+      [(6, 9), (11, 9), (11, 4), (6, 4)],
+      [(2, 16), (6, 12), (2, 12)]],
+     40 * 40 - 8 - 25 - 8),
+]
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('case', range(len(HOLES)))
+def testHoles(engine, case):
+    outerPoints, holePoints, area = HOLES[case]
+    outer = polygonOf(outerPoints)
+    holes = [polygonOf(h) for h in holePoints]
+    t = Triangulation(polygon = outer, holes = holes, engine = engine)
+    t.validate()
+    triangles = t.Triangulate()
+
+    # n + 2h - 2 triangles, whose areas add up to the area between the rings:
+    n = len(outerPoints) + sum([len(h) for h in holePoints])
+    assert len(triangles) == n + 2 * len(holes) - 2
+    points = dict([(v[2], v[:2]) for v in t.vertexList()])
+    total = 0
+    for a, b, c in triangles:
+        area2 = ringArea2([points[a], points[b], points[c]])
+        assert area2 > 0
+        total += area2
+    assert total == 2 * area
+
+
+@pytest.mark.parametrize('name', INPUTS)
+def testPointLocation(name):
+    p = IOClass.createPolygon(inputFile(name))
+    t = Triangulation(polygon = p).TriangulateMesh()
+    locator = PointLocator(p, t)
+
+    xs = [p.xs[i] for i in range(len(p))]
+    ys = [p.ys[i] for i in range(len(p))]
+    qx = []
+    qy = []
+    for x in range(min(xs) - 1, max(xs) + 2, max(1, (max(xs) - min(xs)) // 40)):
+        for y in range(min(ys) - 1, max(ys) + 2, max(1, (max(ys) - min(ys)) // 40)):
+            qx.append(x + 0.5)
+            qy.append(y + 0.25)
+
+    # Brute force: the triangles that contain each point. The engines don't
+    # all give the triangles in the same orientation, and the points that lie
+    # on an edge are skipped.
+    found = locator.locateMany(qx, qy)
+    for k in range(len(qx)):
+        inside = []
+        onEdge = False
+        for i, (a, b, c) in enumerate(t):
+            signs = [(xs[v] - qx[k]) * (ys[w] - qy[k]) - (xs[w] - qx[k]) * (ys[v] - qy[k])
+                     for v, w in ((a, b), (b, c), (c, a))]
+            if min(signs) >= 0 or max(signs) <= 0:
+                onEdge = onEdge or 0 in signs
+                inside.append(i)
+        if onEdge:
+            continue
+        assert inside == ([found[k]] if found[k] >= 0 else [])
+        assert locator.locate(qx[k], qy[k]) == found[k]
+
+
+@pytest.mark.parametrize('method', Simplification.METHODS)
+@pytest.mark.parametrize('engine', ENGINES)
+def testSimplifyThenTriangulate(engine, method):
+    p = polygonOf(comb(50))
+    simplified, removed = Simplification.simplifyPolygon(p, 10, method)
+    assert removed > 0
+    assert Validation.isSimple(simplified.xs, simplified.ys)
+
+    # The names are those of the original vertices, which are no longer 1..n:
+    t = Triangulation(polygon = simplified, engine = engine)
+    checkTriangulation(t.vertexList(), t.Triangulate())
+
+
+def testSplitPolygon():
+    p = polygonOf(comb(200))
+    pieces = splitPolygon(p, 4, 20)
+    assert len(pieces) > 1
+    assert sum([len(piece) for piece in pieces]) == len(p) + 2 * (len(pieces) - 1)
+    assert sum([ringArea2([(p.xs[v], p.ys[v]) for v in piece]) for piece in pieces]) == \
+        ringArea2(list(zip(p.xs, p.ys)))
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def testTriangulateParallel(engine):
+    p = polygonOf(comb(200))
+    triangles = triangulateParallel(p, engine, workers = 2, pieces = 4, minSize = 20)
+    checkTriangulation(Triangulation(polygon = p).vertexList(), triangles)
@@ -0,0 +1,82 @@
+'''
+Created on Oct 18, 2026
+
+Tests for the predicate counters of Instrumentation.py, on the scalar and the
+NumPy paths.
+'''
+import math
+import threading
+from array import array
+
+import pytest
+
+import BatchPredicates
+import IOClass
+import Polygon
+from Triangulation import Triangulation
+from support import inputFile
+
+
+'''
+A star with n vertices, alternately on two circles. Half its vertices are
+reflex.
+'''
+def star(n):
+    xs = array('q')
+    ys = array('q')
+    for i in range(n):
+        r = 1000 if i % 2 == 0 else 400
+        xs.append(int(r * math.cos(2 * math.pi * i / n)))
+        ys.append(int(r * math.sin(2 * math.pi * i / n)))
+    return Polygon.Polygon(xs, ys)
+
+
+def counts(polygon):
+    t = Triangulation(polygon = polygon)
+    stats = t.instrument()
+    t.Triangulate()
+    return stats.areaSign, stats.intersect, stats.diagonal, stats.earsClipped
+
+
+def testScalarCounts():
+    head, size = IOClass.createLinkedList(inputFile('input3.txt'))
+    t = Triangulation(head, size)
+    stats = t.instrument()
+    t.Triangulate()
+    assert stats.earsClipped == size - 3
+    assert stats.diagonal >= size
+    assert stats.intersect > 0 and stats.areaSign > 0
+
+    # The module functions are left alone:
+    assert Polygon.diagonal.__module__ == 'Polygon'
+
+
+@pytest.mark.skipif(BatchPredicates.loadNumpy() is None, reason = "NumPy is not installed")
+def testBatchCounts():
+    p = star(300)
+    assert BatchPredicates.useBatch(len(p), p.xs, p.ys)
+    areaSigns, intersects, diagonals, clipped = counts(p)
+    assert clipped == len(p) - 3
+    assert diagonals >= len(p)
+    assert intersects > 0 and areaSigns > 0
+
+
+'''
+Each Triangulation counts only its own calls, even when several run at the
+same time.
+'''
+def testThreads():
+    p = star(40)
+    expected = counts(p.clone())
+    results = []
+
+    def work():
+        for _ in range(5):
+            results.append(counts(p.clone()))
+
+    threads = [threading.Thread(target = work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [expected] * 20
@@ -0,0 +1,50 @@
+'''
+Created on Oct 18, 2026
+
+Tests for the command line entry point.
+'''
+import os
+import subprocess
+import sys
+
+from conftest import SRC
+from support import inputFile
+
+
+def run(code):
+    return subprocess.run([sys.executable, '-c', code], cwd = SRC, capture_output = True,
+                          text = True, check = True).stdout
+
+
+'''
+A plain run on a small polygon loads only the ear clipping code.
+'''
+def testImportsOnlyWhatIsUsed():
+    loaded = run("import sys, Main\n"
+                 "Main.main(['input3.txt', '--output', '%s'])\n"
+                 "print(' '.join(sorted(sys.modules)))" % os.devnull).split()
+    for name in ('numpy', 'tkinter', 'Tkinter', 'HeadlessRenderer', 'PointLocation',
+                 'Instrumentation', 'Holes', 'TriangleMesh', 'MonotoneTriangulation',
+                 'ReflexEarClipping', 'Validation', 'SweepStatus', 'fractions'):
+        assert name not in loaded
+
+
+def testConsoleOutput():
+    lines = run("import Main\nMain.main([%r])" % inputFile('input3.txt')).splitlines()
+    assert lines[0] == '31'
+    assert len(lines) == 32
+
+
+'''
+A malformed record in a --multi file is reported, after the polygons before
+it have been written.
+'''
+def testMultiMalformedRecord(tmp_path, capsys):
+    import Main
+    source = tmp_path / 'polygons.txt'
+    source.write_text("3\n[0,0]\n[4,0]\n[0,4]\n4\n[0,0]\n[10,0]\n[10\n")
+    target = tmp_path / 'out.txt'
+    status = Main.main([str(source), '--multi', '--workers', '1', '--output', str(target)])
+    assert status == 1
+    assert capsys.readouterr().err.startswith("Polygon file error: ")
+    assert target.read_text().splitlines()[0] == '1'
@@ -0,0 +1,73 @@
+'''
+Created on Oct 18, 2026
+
+Tests for the index of reflex vertices in ReflexEarClipping.py, and for the
+engines on the generated polygons it was tuned on.
+'''
+import random
+
+import pytest
+
+import PolygonGenerators
+from Polygon import Polygon
+from ReflexEarClipping import ReflexGrid
+from Triangulation import Triangulation, ENGINES
+from support import checkTriangulation
+
+
+'''
+Returns True if a point other than the corners a, b and c lies inside or on
+the CCW triangle a,b,c, by looking at every point.
+'''
+def bruteForce(xs, ys, points, a, b, c):
+    ax, ay, bx, by, cx, cy = xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]
+    for p in points:
+        px = xs[p]
+        py = ys[p]
+        if (px, py) in ((ax, ay), (bx, by), (cx, cy)):
+            continue
+        if ((bx - ax) * (py - ay) - (px - ax) * (by - ay) >= 0 and
+            (cx - bx) * (py - by) - (px - bx) * (cy - by) >= 0 and
+            (ax - cx) * (py - cy) - (px - cx) * (ay - cy) >= 0):
+            return True
+    return False
+
+
+'''
+Random points on a small lattice (so that many share an x or a y, and many
+lie on the edges of the triangles), offset and scaled.
+'''
+@pytest.mark.parametrize('scale, offset', [(1, 0), (10 ** 20, 10 ** 22), (0.5, -3.25)])
+def testAgainstBruteForce(scale, offset):
+    rng = random.Random(5)
+    n = 400
+    xs = [rng.randint(0, 40) * scale + offset for i in range(n)]
+    ys = [rng.randint(0, 40) * scale + offset for i in range(n)]
+    points = set(range(0, n, 2))
+    grid = ReflexGrid(xs, ys, points)
+    for step in range(3000):
+        a, b, c = rng.sample(range(n), 3)
+        orientation = (xs[b] - xs[a]) * (ys[c] - ys[a]) - (xs[c] - xs[a]) * (ys[b] - ys[a])
+        if orientation < 0:
+            b, c = c, b
+        elif orientation == 0:
+            continue
+        assert grid.anyInTriangle(a, b, c) == bruteForce(xs, ys, points, a, b, c)
+        if step % 20 == 0 and points:
+            p = rng.choice(sorted(points))
+            points.discard(p)
+            grid.remove(p)
+
+
+def testEmpty():
+    grid = ReflexGrid([0, 10, 0], [0, 0, 10], [])
+    assert not grid.anyInTriangle(0, 1, 2)
+    grid.remove(1)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('name', ['star', 'spiral', 'comb', 'convex'])
+def testGenerated(engine, name):
+    xs, ys = PolygonGenerators.generate(name, 500, seed = 1)
+    t = Triangulation(polygon = Polygon(xs, ys), engine = engine)
+    checkTriangulation(t.vertexList(), t.Triangulate())
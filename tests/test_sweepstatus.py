@@ -0,0 +1,77 @@
+'''
+Created on Oct 18, 2026
+
+Tests for the treap behind the sweep status of the monotone engine and the
+validation sweep.
+'''
+import random
+
+from SweepStatus import SweepStatus, NONE
+
+
+'''
+Returns the depth of the deepest edge in the tree.
+'''
+def depth(status):
+    deepest = 0
+    stack = [(status.root, 1)] if status.root != NONE else []
+    while stack:
+        e, d = stack.pop()
+        deepest = max(deepest, d)
+        for child in (status.left[e], status.right[e]):
+            if child != NONE:
+                stack.append((child, d + 1))
+    return deepest
+
+
+'''
+Random insertions, removals and searches give the same order as a plain
+list that does the same operations.
+'''
+def testAgainstList():
+    rng = random.Random(3)
+    n = 500
+    status = SweepStatus(n)
+    model = []
+    absent = list(range(n))
+    for step in range(5000):
+        if model and (not absent or rng.random() < 0.45):
+            e = rng.choice(model)
+            model.remove(e)
+            absent.append(e)
+            status.remove(e)
+        else:
+            e = absent.pop(rng.randrange(len(absent)))
+            k = rng.randint(0, len(model))
+            status.insert(e, model[k] if k < len(model) else NONE)
+            model.insert(k, e)
+
+        assert len(status) == len(model)
+        if step % 50 == 0:
+            assert status.toList() == model
+            k = rng.randint(0, len(model))
+            found = status.search(lambda e: model.index(e) < k)
+            assert found == (model[k] if k < len(model) else NONE)
+            if model:
+                e = rng.choice(model)
+                i = model.index(e)
+                assert status.prev(e) == (model[i - 1] if i > 0 else NONE)
+                assert status.next(e) == (model[i + 1] if i + 1 < len(model) else NONE)
+    assert status.toList() == model
+
+
+'''
+Inserting the edges in order, as a sweep over a comb does, keeps the tree
+shallow.
+'''
+def testDepth():
+    n = 1 << 14
+    status = SweepStatus(n)
+    for e in range(n):
+        status.insert(e)
+    assert status.toList() == list(range(n))
+    assert depth(status) < 4 * 14
+    for e in range(0, n, 2):
+        status.remove(e)
+    assert status.toList() == list(range(1, n, 2))
+    assert depth(status) < 4 * 14